@@ -9,14 +9,14 @@ import os
 import logging
 import time
 from contextlib import contextmanager, asynccontextmanager
-from typing import Generator, AsyncGenerator, Optional
+from typing import Generator, AsyncGenerator, List, Optional
 from pathlib import Path
 
 from sqlalchemy import create_engine, event, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.exc import SQLAlchemyError, OperationalError, DisconnectionError, TimeoutError as SQLTimeoutError
+from sqlalchemy.exc import SQLAlchemyError, OperationalError, DisconnectionError, IntegrityError, TimeoutError as SQLTimeoutError
 import aiosqlite
 
 from models.database import Base
@@ -30,6 +30,83 @@ from utils.logging_config import get_component_logger, TimedOperation
 
 logger = get_component_logger("database")
 
+# Indexes behind the orphan checks in maintenance and integrity validation.
+# The project_id index is partial because only assigned conversations can
+# hold a dangling project reference.
+MAINTENANCE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_context_links_source_conversation_id "
+    "ON context_links (source_conversation_id)",
+    "CREATE INDEX IF NOT EXISTS ix_context_links_target_conversation_id "
+    "ON context_links (target_conversation_id)",
+    "CREATE INDEX IF NOT EXISTS ix_conversations_project_id_not_null "
+    "ON conversations (project_id) WHERE project_id IS NOT NULL",
+)
+
+# Makes duplicate (source, target, relationship type) context links
+# impossible. Creation fails on databases that still hold duplicates;
+# DataExportImportService.cleanup_orphaned_data removes them and retries.
+CONTEXT_LINK_UNIQUE_INDEX_NAME = "uq_context_links_source_target_type"
+CONTEXT_LINK_UNIQUE_INDEX = (
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {CONTEXT_LINK_UNIQUE_INDEX_NAME} "
+    "ON context_links (source_conversation_id, target_conversation_id, relationship_type)"
+)
+
+# Counter tables behind DataExportImportService.get_data_statistics:
+# (summary table, source table, grouping column). SQLite triggers keep them
+# in step with every write, including bulk statements that bypass ORM events.
+STATS_SUMMARIES = (
+    ("conversation_stats_by_tool", "conversations", "tool_name"),
+    ("preference_stats_by_category", "preferences", "category"),
+    ("context_link_stats_by_type", "context_links", "relationship_type"),
+)
+
+
+def stats_summary_ddl(summary: str, source: str, column: str) -> List[str]:
+    """Build the table and trigger DDL that maintains one counter table."""
+    # NULL keys are stored as '' so they can take part in the primary key
+    new_key = f"COALESCE(NEW.{column}, '')"
+    old_key = f"COALESCE(OLD.{column}, '')"
+    increment = (
+        f"INSERT INTO {summary} (key, count) VALUES ({new_key}, 1) "
+        f"ON CONFLICT(key) DO UPDATE SET count = count + 1;"
+    )
+    decrement = f"UPDATE {summary} SET count = count - 1 WHERE key = {old_key};"
+    return [
+        f"CREATE TABLE IF NOT EXISTS {summary} ("
+        f"key TEXT PRIMARY KEY NOT NULL, count BIGINT NOT NULL DEFAULT 0)",
+        f"CREATE TRIGGER IF NOT EXISTS {summary}_insert AFTER INSERT ON {source} "
+        f"BEGIN {increment} END",
+        f"CREATE TRIGGER IF NOT EXISTS {summary}_delete AFTER DELETE ON {source} "
+        f"BEGIN {decrement} END",
+        f"CREATE TRIGGER IF NOT EXISTS {summary}_update AFTER UPDATE OF {column} ON {source} "
+        f"WHEN {old_key} IS NOT {new_key} BEGIN {decrement} {increment} END",
+    ]
+
+
+def fill_stats_summary(conn: Connection, summary: str, source: str, column: str) -> None:
+    """Replace the contents of a counter table with counts from its source table."""
+    conn.execute(text(f"DELETE FROM {summary}"))
+    conn.execute(text(
+        f"INSERT INTO {summary} (key, count) "
+        f"SELECT COALESCE({column}, ''), COUNT(*) FROM {source} GROUP BY 1"
+    ))
+
+
+def create_stats_summaries(conn: Connection) -> None:
+    """Create any missing SQLite counter tables and triggers, filling new tables."""
+    if conn.dialect.name != "sqlite":
+        return
+    
+    existing = set(conn.scalars(text(
+        "SELECT name FROM sqlite_master WHERE type = 'table'"
+    )))
+    
+    for summary, source, column in STATS_SUMMARIES:
+        for statement in stats_summary_ddl(summary, source, column):
+            conn.execute(text(statement))
+        if summary not in existing:
+            fill_stats_summary(conn, summary, source, column)
+
 
 class DatabaseConfig:
     """Database configuration settings."""
@@ -160,6 +237,20 @@ class DatabaseManager:
             # Create all tables
             Base.metadata.create_all(bind=self.engine)
             
+            with self.engine.begin() as conn:
+                for statement in MAINTENANCE_INDEXES:
+                    conn.execute(text(statement))
+                create_stats_summaries(conn)
+            
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(text(CONTEXT_LINK_UNIQUE_INDEX))
+            except IntegrityError:
+                logger.warning(
+                    "Duplicate context links found; unique index not created. "
+                    "Run orphaned data cleanup to remove them."
+                )
+            
             # Verify database connection directly without using get_session
             session = self.session_factory()
             try:
@@ -183,6 +274,18 @@ class DatabaseManager:
             # Create all tables
             async with self.async_engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
+                for statement in MAINTENANCE_INDEXES:
+                    await conn.execute(text(statement))
+                await conn.run_sync(create_stats_summaries)
+            
+            try:
+                async with self.async_engine.begin() as conn:
+                    await conn.execute(text(CONTEXT_LINK_UNIQUE_INDEX))
+            except IntegrityError:
+                logger.warning(
+                    "Duplicate context links found; unique index not created. "
+                    "Run orphaned data cleanup to remove them."
+                )
             
             # Verify database connection
             async with self.get_async_session() as session:
@@ -497,6 +497,39 @@ class ConversationRepository:
             logger.error(f"Failed to count conversations: {e}")
             raise DatabaseConnectionError(f"Failed to count conversations: {e}") from e
 
+    def count_recent(self, hours: int = 24, tool_name: Optional[str] = None) -> int:
+        """
+        Get count of recent conversations across all tools or for a specific tool.
+        
+        Args:
+            hours: Number of hours to look back
+            tool_name: Optional tool name filter
+            
+        Returns:
+            int: Number of conversations in the time window
+            
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+                
+                query = session.query(func.count(Conversation.id)).filter(
+                    Conversation.timestamp >= cutoff_time
+                )
+                
+                if tool_name:
+                    query = query.filter(Conversation.tool_name == tool_name.lower())
+                
+                count = query.scalar()
+                logger.debug(f"Recent conversations count (last {hours}h): {count}")
+                return count or 0
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to count recent conversations: {e}")
+            raise DatabaseConnectionError(f"Failed to count recent conversations: {e}") from e
+
     def count_by_project(self, project_id: str) -> int:
         """
         Get count of conversations for a project.
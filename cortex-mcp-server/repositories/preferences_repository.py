@@ -7,7 +7,7 @@ with proper error handling and type conversion.
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Tuple, Union
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import desc, func, and_
@@ -171,6 +171,59 @@ class PreferencesRepository:
             logger.error(f"Failed to set preference value {key}: {e}")
             raise DatabaseConnectionError(f"Failed to set preference value: {e}") from e
 
+    def set_values(self, entries: List[Tuple[str, Any, Optional[PreferenceCategory]]]) -> int:
+        """
+        Set several preference values (create or update) in one transaction.
+        
+        Args:
+            entries: (key, value, category) tuples; a later entry for the same
+                key overrides an earlier one
+            
+        Returns:
+            int: Number of preferences written
+            
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        if not entries:
+            return 0
+        
+        try:
+            pending = {}
+            for key, value, category in entries:
+                pending[key] = PreferenceCreate(key=key, value=value, category=category)
+            
+            with self.db_manager.get_session() as session:
+                existing = {
+                    preference.key: preference
+                    for preference in session.query(Preference).filter(
+                        Preference.key.in_(list(pending))
+                    )
+                }
+                
+                now = datetime.utcnow()
+                for key, preference_data in pending.items():
+                    preference = existing.get(key)
+                    if preference is None:
+                        preference = Preference(
+                            key=key,
+                            category=preference_data.category.value if preference_data.category else None
+                        )
+                        session.add(preference)
+                    elif preference_data.category:
+                        preference.category = preference_data.category.value
+                    preference.set_json_value(preference_data.value)
+                    preference.updated_at = now
+                
+                session.commit()
+            
+            logger.debug(f"Set {len(pending)} preferences in one transaction")
+            return len(pending)
+            
+        except Exception as e:
+            logger.error(f"Failed to set preference values: {e}")
+            raise DatabaseConnectionError(f"Failed to set preference values: {e}") from e
+
     def update(self, key: str, update_data: PreferenceUpdate) -> Optional[Preference]:
         """
         Update an existing preference.
@@ -65,7 +65,9 @@ def export_data(args) -> None:
         export_path = service.export_all_data(
             export_path=args.path,
             include_embeddings=args.include_embeddings,
-            compress=not args.no_compress
+            compress=not args.no_compress,
+            compression_level=args.compression_level,
+            since=args.since
         )
         
         # Get file size
@@ -81,7 +83,9 @@ def export_data(args) -> None:
             if export_path.endswith('.zip'):
                 import zipfile
                 with zipfile.ZipFile(export_path, 'r') as zipf:
-                    with zipf.open("export_data.json") as f:
+                    # Statistics live in metadata.json, so the section
+                    # entries do not need to be read
+                    with zipf.open("metadata.json") as f:
                         export_data = json.load(f)
             else:
                 with open(export_path, 'r') as f:
@@ -130,7 +134,8 @@ def import_data(args) -> None:
         results = service.import_data(
             import_path=args.file,
             overwrite_existing=args.overwrite,
-            selective_import=selective_import
+            selective_import=selective_import,
+            unsafe_fast=args.unsafe_fast
         )
         
         print(f"✅ Import completed successfully!")
@@ -219,6 +224,7 @@ def cleanup_data(args) -> None:
             
             print(f"📊 Orphaned Data Cleanup Results:")
             print(f"  Orphaned context links: {results['orphaned_context_links']}")
+            print(f"  Duplicate context links: {results['duplicate_context_links']}")
             print(f"  Orphaned project references: {results['orphaned_project_references']}")
         
         if not args.conversations and not args.orphaned:
@@ -238,7 +244,7 @@ def show_statistics(args) -> None:
         print("📊 Data Statistics")
         print("=" * 50)
         
-        stats = service.get_data_statistics()
+        stats = service.get_data_statistics(exact=not args.estimate)
         
         # Conversations
         print(f"\n💬 Conversations:")
@@ -254,7 +260,7 @@ def show_statistics(args) -> None:
         
         # Projects
         print(f"\n📁 Projects:")
-        print(f"  Total: {stats['projects']['total']}")
+        print(f"  Total: {stats['projects']['total']}{' (estimated)' if stats['projects']['is_estimate'] else ''}")
         print(f"  With conversations: {stats['projects']['with_conversations']}")
         
         if stats['projects']['most_active']:
@@ -281,7 +287,8 @@ def show_statistics(args) -> None:
                 print(f"    {link_type}: {count}")
         
         # Storage
-        print(f"\n💾 Storage (estimated):")
+        print(f"\n💾 Storage{' (estimated)' if stats['storage']['is_estimate'] else ''}:")
+        print(f"  Database: {stats['storage']['database_mb']:.1f} MB")
         print(f"  Conversations: {stats['storage']['estimated_conversations_mb']:.1f} MB")
         print(f"  Preferences: {stats['storage']['estimated_preferences_mb']:.1f} MB")
         
@@ -361,6 +368,11 @@ Examples:
     export_parser.add_argument("--path", help="Export file path (auto-generated if not specified)")
     export_parser.add_argument("--include-embeddings", action="store_true", help="Include vector embeddings")
     export_parser.add_argument("--no-compress", action="store_true", help="Don't compress the export file")
+    export_parser.add_argument("--compression-level", type=int, default=3, choices=range(1, 10),
+                               metavar="1-9", help="Deflate level for compressed exports (default: 3)")
+    export_parser.add_argument("--since", type=datetime.fromisoformat, metavar="TIMESTAMP",
+                               help="Only export conversations and links newer than this ISO timestamp "
+                                    "(use export_cursor from a previous export)")
     export_parser.add_argument("--stats", action="store_true", help="Show export statistics")
     export_parser.set_defaults(func=export_data)
     
@@ -371,6 +383,8 @@ Examples:
     import_parser.add_argument("--conversations-only", action="store_true", help="Import only conversations")
     import_parser.add_argument("--projects-only", action="store_true", help="Import only projects")
     import_parser.add_argument("--preferences-only", action="store_true", help="Import only preferences")
+    import_parser.add_argument("--unsafe-fast", action="store_true",
+                               help="Disable SQLite fsyncs during import (only when a backup exists)")
     import_parser.set_defaults(func=import_data)
     
     # Migration command
@@ -392,6 +406,8 @@ Examples:
     # Statistics command
     stats_parser = subparsers.add_parser("stats", help="Show data statistics")
     stats_parser.add_argument("--json", action="store_true", help="Output raw JSON data")
+    stats_parser.add_argument("--estimate", action="store_true",
+                              help="Use planner estimates and cached results instead of exact counts")
     stats_parser.set_defaults(func=show_statistics)
     
     # Validation command
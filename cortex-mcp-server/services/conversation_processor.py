@@ -5,8 +5,12 @@ This service combines context management, tagging, and conversation linking
 to provide comprehensive conversation processing capabilities.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, AsyncIterator, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from models.database import Conversation
@@ -20,8 +24,50 @@ from tagging_service import TaggingService
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parse_tags(tags: Optional[str]) -> Tuple[str, ...]:
+    """
+    Split a stored comma-separated tags string into individual tags.
+
+    Tag strings repeat heavily across conversations, so results are memoized
+    on the raw column value instead of re-splitting for every row.
+    """
+    if not tags:
+        return ()
+    return tuple(tag.strip() for tag in tags.split(",") if tag.strip())
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most ``size`` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _processing_result(
+    conversation: Conversation,
+    timestamp: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """Build a processing result for a conversation with nothing done yet."""
+    return {
+        'conversation_id': conversation.id,
+        'processing_timestamp': timestamp or datetime.utcnow(),
+        'tags_generated': [],
+        'tags_added': 0,
+        'project_detected': False,
+        'project_id': conversation.project_id,
+        'context_processed': False,
+        'links_created': 0,
+        'categories': {},
+        'errors': []
+    }
+
+
 class ConversationProcessor:
     """Orchestrates conversation processing including context and tagging."""
+
+    # Number of conversations processed per chunk when reprocessing a project
+    REPROCESS_BATCH_SIZE = 64
     
     def __init__(
         self,
@@ -83,18 +129,7 @@ class ConversationProcessor:
         try:
             await self.initialize()
             
-            results = {
-                'conversation_id': conversation.id,
-                'processing_timestamp': datetime.utcnow(),
-                'tags_generated': [],
-                'tags_added': 0,
-                'project_detected': False,
-                'project_id': conversation.project_id,
-                'context_processed': False,
-                'links_created': 0,
-                'categories': {},
-                'errors': []
-            }
+            results = _processing_result(conversation)
             
             # Generate and apply tags
             if auto_tag:
@@ -136,18 +171,9 @@ class ConversationProcessor:
             
         except Exception as e:
             logger.error(f"Error processing conversation {conversation.id}: {e}")
-            return {
-                'conversation_id': conversation.id,
-                'processing_timestamp': datetime.utcnow(),
-                'tags_generated': [],
-                'tags_added': 0,
-                'project_detected': False,
-                'project_id': conversation.project_id,
-                'context_processed': False,
-                'links_created': 0,
-                'categories': {},
-                'errors': [f"Processing failed: {str(e)}"]
-            }
+            results = _processing_result(conversation)
+            results['errors'].append(f"Processing failed: {str(e)}")
+            return results
 
     async def _process_tags(self, conversation: Conversation) -> List[str]:
         """Process tags for a conversation."""
@@ -162,51 +188,94 @@ class ConversationProcessor:
                 return []
             
             # Get existing tags
-            existing_tags = set(conversation.tags_list) if conversation.tags else set()
+            current_tags = _parse_tags(conversation.tags)
+            existing_tags = set(current_tags)
+            
+            # Only write when there are genuinely new tags to persist
+            added_tags = list(dict.fromkeys(tag for tag in new_tags if tag not in existing_tags))
+            if not added_tags:
+                return []
             
-            # Combine with existing tags (avoid duplicates)
-            all_tags = list(existing_tags.union(set(new_tags)))
+            # Keep existing order and append new tags so the stored string is stable
+            all_tags = list(current_tags) + added_tags
+            update_data = ConversationUpdate(tags=all_tags)
+            updated_conversation = self.conversation_repo.update(conversation.id, update_data)
             
-            # Update conversation if new tags were added
-            if set(all_tags) != existing_tags:
-                update_data = ConversationUpdate(tags=all_tags)
-                updated_conversation = self.conversation_repo.update(conversation.id, update_data)
-                
-                if updated_conversation:
-                    conversation.tags = updated_conversation.tags
-                    logger.debug(f"Updated tags for conversation {conversation.id}: {all_tags}")
-                
-                # Return only the newly added tags
-                return [tag for tag in new_tags if tag not in existing_tags]
+            if updated_conversation:
+                conversation.tags = updated_conversation.tags
+                logger.debug(f"Updated tags for conversation {conversation.id}: {all_tags}")
             
-            return []
+            return added_tags
             
         except Exception as e:
             logger.error(f"Error processing tags for conversation {conversation.id}: {e}")
             raise
 
+    async def iter_process(
+        self,
+        conversations: Iterable[Conversation],
+        auto_tag: bool = True,
+        auto_link: bool = True,
+        auto_project_detect: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process conversations one at a time, yielding each result.
+        
+        Failures are yielded as result dicts with ``failed`` set instead of
+        aborting the iteration, so memory use stays constant regardless of
+        how many conversations are processed.
+        
+        Args:
+            conversations: Conversations to process
+            auto_tag: Whether to automatically generate tags
+            auto_link: Whether to automatically create context links
+            auto_project_detect: Whether to automatically detect project
+            
+        Yields:
+            Dict[str, Any]: Processing result for each conversation
+        """
+        await self.initialize()
+        
+        for conversation in conversations:
+            try:
+                yield await self.process_conversation(
+                    conversation, auto_tag, auto_link, auto_project_detect
+                )
+            except Exception as e:
+                logger.error(f"Failed to process conversation {conversation.id}: {e}")
+                yield {
+                    'conversation_id': conversation.id,
+                    'failed': True,
+                    'error': str(e)
+                }
+
     async def process_conversation_batch(
         self,
         conversations: List[Conversation],
         auto_tag: bool = True,
         auto_link: bool = True,
-        auto_project_detect: bool = True
+        auto_project_detect: bool = True,
+        keep_results: bool = True
     ) -> Dict[str, Any]:
         """
         Process multiple conversations in batch.
         
+        Per-conversation results are returned in ``individual_results``
+        unless ``keep_results`` is turned off, in which case only aggregate
+        counters are collected. Use ``iter_process`` to stream individual
+        results instead.
+        
         Args:
             conversations: List of conversations to process
             auto_tag: Whether to automatically generate tags
             auto_link: Whether to automatically create context links
             auto_project_detect: Whether to automatically detect project
+            keep_results: Whether to include per-conversation results
             
         Returns:
             Dict[str, Any]: Batch processing results
         """
         try:
-            await self.initialize()
-            
             batch_results = {
                 'total_conversations': len(conversations),
                 'processed_successfully': 0,
@@ -214,30 +283,42 @@ class ConversationProcessor:
                 'total_tags_added': 0,
                 'total_links_created': 0,
                 'projects_detected': 0,
-                'processing_timestamp': datetime.utcnow(),
-                'individual_results': []
+                'skipped_empty': 0,
+                'processing_timestamp': datetime.utcnow()
             }
+            if keep_results:
+                batch_results['individual_results'] = []
             
+            # Empty conversations produce no tags or links; skip the pipeline for them
+            work, skippable = [], []
             for conversation in conversations:
-                try:
-                    result = await self.process_conversation(
-                        conversation, auto_tag, auto_link, auto_project_detect
-                    )
-                    
-                    batch_results['individual_results'].append(result)
-                    batch_results['processed_successfully'] += 1
-                    batch_results['total_tags_added'] += result.get('tags_added', 0)
-                    batch_results['total_links_created'] += result.get('links_created', 0)
-                    
-                    if result.get('project_detected'):
-                        batch_results['projects_detected'] += 1
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process conversation {conversation.id}: {e}")
+                (work if (conversation.content or '').strip() else skippable).append(conversation)
+            
+            batch_results['skipped_empty'] = len(skippable)
+            if keep_results:
+                batch_results['individual_results'].extend(
+                    _processing_result(conversation, batch_results['processing_timestamp'])
+                    for conversation in skippable
+                )
+            
+            async for result in self.iter_process(
+                work, auto_tag, auto_link, auto_project_detect
+            ):
+                if result.get('failed'):
                     batch_results['failed_conversations'].append({
-                        'conversation_id': conversation.id,
-                        'error': str(e)
+                        'conversation_id': result['conversation_id'],
+                        'error': result['error']
                     })
+                    continue
+                
+                if keep_results:
+                    batch_results['individual_results'].append(result)
+                batch_results['processed_successfully'] += 1
+                batch_results['total_tags_added'] += result.get('tags_added', 0)
+                batch_results['total_links_created'] += result.get('links_created', 0)
+                
+                if result.get('project_detected'):
+                    batch_results['projects_detected'] += 1
             
             logger.info(f"Batch processed {batch_results['processed_successfully']}/{batch_results['total_conversations']} conversations")
             return batch_results
@@ -250,15 +331,21 @@ class ConversationProcessor:
         self,
         project_id: str,
         force_retag: bool = False,
-        force_relink: bool = False
+        force_relink: bool = False,
+        cancel_event: Optional[asyncio.Event] = None
     ) -> Dict[str, Any]:
         """
         Reprocess all conversations for a specific project.
         
+        Conversations are processed in chunks of ``REPROCESS_BATCH_SIZE`` so
+        progress is reported incrementally and the run can be cancelled
+        between chunks.
+        
         Args:
             project_id: Project ID to reprocess
             force_retag: Whether to regenerate all tags
             force_relink: Whether to recreate all context links
+            cancel_event: Optional event that stops processing after the current chunk
             
         Returns:
             Dict[str, Any]: Reprocessing results
@@ -287,13 +374,42 @@ class ConversationProcessor:
                 # For now, just log the intention
                 logger.info(f"Force relink requested for project {project_id}")
             
-            # Process all conversations
-            results = await self.process_conversation_batch(
-                conversations,
-                auto_tag=True,
-                auto_link=True,
-                auto_project_detect=False  # Project already known
-            )
+            # Process conversations in fixed-size chunks
+            results = {
+                'total_conversations': len(conversations),
+                'processed_successfully': 0,
+                'failed_conversations': [],
+                'total_tags_added': 0,
+                'total_links_created': 0,
+                'projects_detected': 0,
+                'skipped_empty': 0,
+                'processing_timestamp': datetime.utcnow(),
+                'cancelled': False
+            }
+            
+            for chunk in _batched(conversations, self.REPROCESS_BATCH_SIZE):
+                chunk_results = await self.process_conversation_batch(
+                    chunk,
+                    auto_tag=True,
+                    auto_link=True,
+                    auto_project_detect=False,  # Project already known
+                    keep_results=False  # Only the counters are aggregated
+                )
+                
+                for key in ('processed_successfully', 'total_tags_added',
+                            'total_links_created', 'projects_detected', 'skipped_empty'):
+                    results[key] += chunk_results[key]
+                results['failed_conversations'].extend(chunk_results['failed_conversations'])
+                
+                done = (results['processed_successfully'] + results['skipped_empty']
+                        + len(results['failed_conversations']))
+                logger.info(f"Reprocessing project {project_id}: "
+                           f"{done}/{results['total_conversations']} conversations")
+                
+                if cancel_event is not None and cancel_event.is_set():
+                    logger.info(f"Reprocessing of project {project_id} cancelled")
+                    results['cancelled'] = True
+                    break
             
             # Generate project-level tags
             project_tags = await self._generate_project_tags(project_id, conversations)
@@ -324,17 +440,39 @@ class ConversationProcessor:
             logger.error(f"Error generating project tags for {project_id}: {e}")
             return []
 
+    def _full_scan_stats(self) -> Dict[str, Any]:
+        """
+        Scan conversations once and compute the aggregates behind both
+        ``get_processing_stats`` and ``get_tag_statistics``.
+        """
+        all_conversations = self.conversation_repo.list_all(limit=1000)
+        
+        tag_counts = Counter()
+        tagged_conversations = 0
+        assigned_conversations = 0
+        
+        for conversation in all_conversations:
+            if conversation.tags:
+                tagged_conversations += 1
+                tag_counts.update(_parse_tags(conversation.tags))
+            if conversation.project_id:
+                assigned_conversations += 1
+        
+        return {
+            'scanned_conversations': len(all_conversations),
+            'tagged_conversations': tagged_conversations,
+            'assigned_conversations': assigned_conversations,
+            'tag_counts': tag_counts
+        }
+
     async def get_processing_stats(self) -> Dict[str, Any]:
         """Get processing statistics."""
         try:
             total_conversations = self.conversation_repo.count_total()
             
-            # Get conversations with tags
-            all_conversations = self.conversation_repo.list_all(limit=1000)
-            tagged_conversations = sum(1 for conv in all_conversations if conv.tags)
-            
-            # Get project assignment stats
-            assigned_conversations = sum(1 for conv in all_conversations if conv.project_id)
+            scan = self._full_scan_stats()
+            tagged_conversations = scan['tagged_conversations']
+            assigned_conversations = scan['assigned_conversations']
             
             stats = {
                 'total_conversations': total_conversations,
@@ -372,7 +510,7 @@ class ConversationProcessor:
             
             suggestions = {
                 'conversation_id': conversation_id,
-                'current_tags': conversation.tags_list if conversation.tags else [],
+                'current_tags': list(_parse_tags(conversation.tags)),
                 'suggested_additional_tags': [],
                 'project_suggestions': [],
                 'context_improvements': []
@@ -384,7 +522,7 @@ class ConversationProcessor:
                 conversation.conversation_metadata
             )
             
-            current_tags = set(conversation.tags_list) if conversation.tags else set()
+            current_tags = set(_parse_tags(conversation.tags))
             new_tag_suggestions = [tag for tag in fresh_tags if tag not in current_tags]
             suggestions['suggested_additional_tags'] = new_tag_suggestions
             
@@ -421,30 +559,18 @@ class ConversationProcessor:
     def get_tag_statistics(self) -> Dict[str, Any]:
         """Get statistics about tag usage."""
         try:
-            all_conversations = self.conversation_repo.list_all(limit=1000)
-            
-            tag_counts = {}
-            total_tagged = 0
-            
-            for conversation in all_conversations:
-                if conversation.tags:
-                    total_tagged += 1
-                    tags = conversation.tags_list
-                    for tag in tags:
-                        tag_counts[tag] = tag_counts.get(tag, 0) + 1
-            
-            # Sort tags by frequency
-            sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
+            scan = self._full_scan_stats()
+            tag_counts = scan['tag_counts']
             
             return {
-                'total_conversations': len(all_conversations),
-                'tagged_conversations': total_tagged,
+                'total_conversations': scan['scanned_conversations'],
+                'tagged_conversations': scan['tagged_conversations'],
                 'unique_tags': len(tag_counts),
-                'most_common_tags': sorted_tags[:20],
+                'most_common_tags': tag_counts.most_common(20),
                 'tag_categories': self.tagging_service.get_tag_categories(),
                 'timestamp': datetime.utcnow()
             }
             
         except Exception as e:
             logger.error(f"Error getting tag statistics: {e}")
-            return {'error': str(e)}
\ No newline at end of file
+            return {'error': str(e)}
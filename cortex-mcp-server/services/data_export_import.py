@@ -8,35 +8,253 @@ This service provides comprehensive data export/import functionality including:
 - Data cleanup utilities for maintenance
 """
 
+import copy
+import io
 import json
 import logging
+import mmap
+import queue
+import threading
+import time
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterable, Iterator, BinaryIO, Callable, ContextManager
+from itertools import islice
 import zipfile
 import tempfile
 import shutil
 
-from sqlalchemy.orm import Session
+# Try to import optional fast JSON serializer
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import optional streaming JSON parser
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+from sqlalchemy.orm import Session, aliased
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import text, func
+from sqlalchemy import text, func, select, insert, update, delete, case, literal, or_, inspect, String
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from models.database import Conversation, Project, Preference, ContextLink
 from models.schemas import (
-    ConversationCreate, ProjectCreate, PreferenceCreate, ContextLinkCreate,
-    PreferenceCategory
+    ConversationCreate, ConversationUpdate, ProjectCreate, ProjectUpdate,
+    PreferenceCreate, ContextLinkCreate, PreferenceCategory
+)
+from config.database import (
+    DatabaseManager, DatabaseConnectionError,
+    CONTEXT_LINK_UNIQUE_INDEX, CONTEXT_LINK_UNIQUE_INDEX_NAME,
+    STATS_SUMMARIES, create_stats_summaries, fill_stats_summary
 )
-from config.database import DatabaseManager, DatabaseConnectionError
 from repositories.conversation_repository import ConversationRepository
 from repositories.project_repository import ProjectRepository
 from repositories.preferences_repository import PreferencesRepository
 
 logger = logging.getLogger(__name__)
 
+# Import statements are built once and reused for every batch; SQLAlchemy
+# caches their compiled SQL, so the import loops only bind parameters
+_INSERT_PROJECT = insert(Project)
+_INSERT_CONVERSATION = insert(Conversation)
+_INSERT_CONTEXT_LINK = insert(ContextLink)
+_UPDATE_CONTEXT_LINK = update(ContextLink)
+
+# Export format versions this service can import, and those whose ZIP
+# archives hold one JSON-lines entry per section
+_SUPPORTED_FORMAT_VERSIONS = ("1.0", "1.1")
+_JSONL_ARCHIVE_VERSIONS = ("1.1",)
+
+# INSERT constructs that can skip rows conflicting with a unique index, by
+# dialect name
+_CONFLICT_SKIPPING_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+# Orphan checks are written as LEFT JOIN anti-joins, which the planner
+# resolves with primary key lookups (and the partial project_id index)
+_SOURCE_CONVERSATION = aliased(Conversation)
+_TARGET_CONVERSATION = aliased(Conversation)
+
+# Links whose source or target conversation no longer exists
+_ORPHANED_LINK_IDS = select(ContextLink.id).outerjoin(
+    _SOURCE_CONVERSATION, _SOURCE_CONVERSATION.id == ContextLink.source_conversation_id
+).outerjoin(
+    _TARGET_CONVERSATION, _TARGET_CONVERSATION.id == ContextLink.target_conversation_id
+).where(
+    _SOURCE_CONVERSATION.id.is_(None) | _TARGET_CONVERSATION.id.is_(None)
+)
+
+# Oldest link of each (source, target, relationship type) group; any other
+# link in the group is a duplicate
+_CANONICAL_LINK_IDS = select(func.min(ContextLink.id)).group_by(
+    ContextLink.source_conversation_id,
+    ContextLink.target_conversation_id,
+    ContextLink.relationship_type
+)
+
+# Conversations pointing at a project that no longer exists
+_ORPHANED_PROJECT_REF_IDS = select(Conversation.id).outerjoin(
+    Project, Project.id == Conversation.project_id
+).where(
+    Conversation.project_id.isnot(None),
+    Project.id.is_(None)
+)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@contextmanager
+def _open_zip_entry(zip_path: str, entry_name: str) -> Iterator[BinaryIO]:
+    """Open a single entry of a ZIP archive for binary reading."""
+    with zipfile.ZipFile(zip_path, 'r') as zipf:
+        with zipf.open(entry_name) as f:
+            yield f
+
+
+class _SpooledSection:
+    """Re-iterable view over one section spooled to a temporary JSON-lines file."""
+    
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+    
+    def append(self, item: Any) -> None:
+        self._file.write(_dumps(item))
+        self._file.write(b"\n")
+    
+    def close(self) -> None:
+        self._file.close()
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self._file.flush()
+        self._file.seek(0)
+        for line in self._file:
+            yield _loads(line)
+
+
+class _JsonLinesSection:
+    """Re-iterable view over one newline-delimited JSON entry of a ZIP export."""
+    
+    def __init__(self, zip_path: str, entry_name: str):
+        self._zip_path = zip_path
+        self._entry_name = entry_name
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with _open_zip_entry(self._zip_path, self._entry_name) as f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+
+
+def _prefetch(items: Iterable[Any], maxsize: int) -> Iterator[Any]:
+    """
+    Iterate ``items`` on a background thread, buffering up to ``maxsize``
+    items ahead of the consumer.
+    
+    This overlaps database fetches with serialization and compression in
+    the consuming thread while keeping memory bounded by the buffer size.
+    A generator is started, consumed and closed entirely on the worker
+    thread, so any session it opens is never touched by the consumer.
+    """
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(maxsize=maxsize)
+    finished = object()
+    stop = threading.Event()
+    
+    def put(entry: Tuple[Any, Optional[BaseException]]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((finished, e))
+            return
+        finally:
+            # Stopping early must also release the generator's resources here
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        put((finished, None))
+    
+    worker = threading.Thread(target=produce, name="export-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is finished:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
+def _isoformat(value: Union[str, datetime]) -> str:
+    """Return an ISO-8601 string for a timestamp that may already be one."""
+    return value if isinstance(value, str) else value.isoformat()
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most ``size`` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
 
 class DataExportImportService:
     """Service for data export/import operations."""
     
+    # Number of rows fetched per round-trip while streaming exports
+    EXPORT_BATCH_SIZE = 1000
+    
+    # Bytes of serialized rows buffered before each write to the export file,
+    # so the compressor sees large chunks instead of one small write per row
+    EXPORT_WRITE_BUFFER_SIZE = 1 << 20
+    
+    # Number of rows inserted per executemany statement during imports
+    IMPORT_BATCH_SIZE = 1000
+    
+    # Maximum number of bound parameters in a single IN (...) lookup
+    IN_CLAUSE_CHUNK_SIZE = 500
+    
+    # Conversations deleted per transaction during cleanup
+    CLEANUP_BATCH_SIZE = 400
+    
+    # Seconds computed data statistics are reused before querying again
+    STATS_CACHE_TTL = 30.0
+    
     def __init__(self, db_manager: DatabaseManager):
         """
         Initialize the data export/import service.
@@ -49,13 +267,20 @@ class DataExportImportService:
         self.project_repo = ProjectRepository(db_manager)
         self.preferences_repo = PreferencesRepository(db_manager)
         
-        # Export format version for compatibility
-        self.export_format_version = "1.0"
+        # Export format version for compatibility. 1.1 writes compressed
+        # exports as one JSON-lines entry per section; 1.0 archives hold a
+        # single export_data.json and can still be imported.
+        self.export_format_version = "1.1"
+        
+        # (monotonic time computed, statistics) from the last get_data_statistics
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
     
     def export_all_data(self, 
                        export_path: Optional[str] = None,
                        include_embeddings: bool = False,
-                       compress: bool = True) -> str:
+                       compress: bool = True,
+                       compression_level: int = 3,
+                       since: Optional[datetime] = None) -> str:
         """
         Export all user data to a file.
         
@@ -63,6 +288,12 @@ class DataExportImportService:
             export_path: Custom export file path (auto-generated if None)
             include_embeddings: Whether to include vector embeddings (large files)
             compress: Whether to compress the export file
+            compression_level: Deflate level (1-9) for compressed exports; low
+                levels are much faster on text-heavy JSON at a small size cost
+            since: Only export conversations newer than this timestamp and
+                the context links touching them or created after it
+                (incremental export); projects and preferences are always
+                exported in full
             
         Returns:
             str: Path to the exported file
@@ -86,25 +317,21 @@ class DataExportImportService:
             
             logger.info(f"Starting data export to: {export_path}")
             
-            # Collect all data
-            export_data = {
-                "metadata": {
-                    "export_timestamp": datetime.now().isoformat(),
-                    "format_version": self.export_format_version,
-                    "include_embeddings": include_embeddings,
-                    "exported_by": "cortex_mcp"
-                },
-                "conversations": self._export_conversations(include_embeddings),
-                "projects": self._export_projects(),
-                "preferences": self._export_preferences(),
-                "context_links": self._export_context_links(),
-                "statistics": self._get_export_statistics()
+            metadata = {
+                "export_timestamp": datetime.now().isoformat(),
+                "format_version": self.export_format_version,
+                "include_embeddings": include_embeddings,
+                "exported_by": "cortex_mcp",
+                "since": since.isoformat() if since else None
             }
             
+            # Rows are streamed from the database straight into the output file
             if compress:
-                self._write_compressed_export(export_data, export_path)
+                self._write_compressed_export(
+                    metadata, include_embeddings, export_path, compression_level, since
+                )
             else:
-                self._write_json_export(export_data, export_path)
+                self._write_json_export(metadata, include_embeddings, export_path, since)
             
             logger.info(f"Data export completed successfully: {export_path}")
             return export_path
@@ -113,190 +340,388 @@ class DataExportImportService:
             logger.error(f"Data export failed: {e}")
             raise DatabaseConnectionError(f"Data export failed: {e}") from e
     
-    def _export_conversations(self, include_embeddings: bool = False) -> List[Dict[str, Any]]:
-        """Export all conversations."""
+    def _iso_timestamp_column(self, session: Session, column: Any) -> Any:
+        """
+        Select a DateTime column as an ISO-8601 string when the database can.
+        
+        SQLite stores DateTime values as 'YYYY-MM-DD HH:MM:SS.ffffff' text, so
+        swapping the separator yields ISO format without building datetimes.
+        """
+        if session.get_bind().dialect.name == "sqlite":
+            return func.replace(column, " ", "T", type_=String).label(column.key)
+        return column
+    
+    def _export_conversations(self, 
+                              session: Session, 
+                              include_embeddings: bool = False,
+                              since: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Export conversations (optionally only those newer than ``since``), yielding one dict per row."""
         try:
-            with self.db_manager.get_session() as session:
-                conversations = session.query(Conversation).all()
-                
-                exported_conversations = []
-                for conv in conversations:
-                    conv_data = {
-                        "id": conv.id,
-                        "tool_name": conv.tool_name,
-                        "project_id": conv.project_id,
-                        "timestamp": conv.timestamp.isoformat(),
-                        "content": conv.content,
-                        "conversation_metadata": conv.conversation_metadata,
-                        "tags": conv.tags_list
-                    }
-                    
-                    # Include embeddings if requested (note: actual embeddings would be in vector store)
-                    if include_embeddings:
-                        # Placeholder for embedding data - would need vector store integration
-                        conv_data["embedding_available"] = False
-                    
-                    exported_conversations.append(conv_data)
+            # Core select returns plain row mappings, skipping ORM instrumentation
+            # and identity-map bookkeeping for every exported row
+            query = select(
+                Conversation.id,
+                Conversation.tool_name,
+                Conversation.project_id,
+                self._iso_timestamp_column(session, Conversation.timestamp),
+                Conversation.content,
+                Conversation.conversation_metadata,
+                Conversation.tags
+            )
+            if since is not None:
+                query = query.where(Conversation.timestamp > since)
+            
+            rows = session.execute(
+                query.execution_options(yield_per=self.EXPORT_BATCH_SIZE)
+            ).mappings()
+            
+            exported_count = 0
+            for row in rows:
+                conv_data = dict(row)
+                conv_data["timestamp"] = _isoformat(row["timestamp"])
+                conv_data["tags"] = (
+                    [tag.strip() for tag in row["tags"].split(",") if tag.strip()]
+                    if row["tags"] else []
+                )
                 
-                logger.info(f"Exported {len(exported_conversations)} conversations")
-                return exported_conversations
+                # Include embeddings if requested (note: actual embeddings would be in vector store)
+                if include_embeddings:
+                    # Placeholder for embedding data - would need vector store integration
+                    conv_data["embedding_available"] = False
                 
+                exported_count += 1
+                yield conv_data
+            
+            logger.info(f"Exported {exported_count} conversations")
+            
         except SQLAlchemyError as e:
             logger.error(f"Failed to export conversations: {e}")
             raise DatabaseConnectionError(f"Failed to export conversations: {e}") from e
     
-    def _export_projects(self) -> List[Dict[str, Any]]:
-        """Export all projects."""
+    def _export_projects(self, session: Session) -> Iterator[Dict[str, Any]]:
+        """Export all projects, yielding one dict per row."""
         try:
-            with self.db_manager.get_session() as session:
-                projects = session.query(Project).all()
-                
-                exported_projects = []
-                for project in projects:
-                    project_data = {
-                        "id": project.id,
-                        "name": project.name,
-                        "path": project.path,
-                        "description": project.description,
-                        "created_at": project.created_at.isoformat(),
-                        "last_accessed": project.last_accessed.isoformat()
-                    }
-                    exported_projects.append(project_data)
-                
-                logger.info(f"Exported {len(exported_projects)} projects")
-                return exported_projects
-                
+            rows = session.execute(
+                select(
+                    Project.id,
+                    Project.name,
+                    Project.path,
+                    Project.description,
+                    self._iso_timestamp_column(session, Project.created_at),
+                    self._iso_timestamp_column(session, Project.last_accessed)
+                ).execution_options(yield_per=self.EXPORT_BATCH_SIZE)
+            ).mappings()
+            
+            exported_count = 0
+            for row in rows:
+                project_data = dict(row)
+                project_data["created_at"] = _isoformat(row["created_at"])
+                project_data["last_accessed"] = _isoformat(row["last_accessed"])
+                exported_count += 1
+                yield project_data
+            
+            logger.info(f"Exported {exported_count} projects")
+            
         except SQLAlchemyError as e:
             logger.error(f"Failed to export projects: {e}")
             raise DatabaseConnectionError(f"Failed to export projects: {e}") from e
     
-    def _export_preferences(self) -> List[Dict[str, Any]]:
-        """Export all preferences."""
+    def _export_preferences(self, session: Session) -> Iterator[Dict[str, Any]]:
+        """Export all preferences, yielding one dict per row."""
         try:
-            with self.db_manager.get_session() as session:
-                preferences = session.query(Preference).all()
-                
-                exported_preferences = []
-                for pref in preferences:
-                    pref_data = {
-                        "key": pref.key,
-                        "value": pref.get_json_value(),
-                        "category": pref.category,
-                        "updated_at": pref.updated_at.isoformat()
-                    }
-                    exported_preferences.append(pref_data)
-                
-                logger.info(f"Exported {len(exported_preferences)} preferences")
-                return exported_preferences
-                
+            exported_count = 0
+            for pref in session.query(Preference).yield_per(self.EXPORT_BATCH_SIZE):
+                pref_data = {
+                    "key": pref.key,
+                    "value": pref.get_json_value(),
+                    "category": pref.category,
+                    "updated_at": pref.updated_at.isoformat()
+                }
+                exported_count += 1
+                yield pref_data
+            
+            logger.info(f"Exported {exported_count} preferences")
+            
         except SQLAlchemyError as e:
             logger.error(f"Failed to export preferences: {e}")
             raise DatabaseConnectionError(f"Failed to export preferences: {e}") from e
     
-    def _export_context_links(self) -> List[Dict[str, Any]]:
-        """Export all context links."""
+    def _export_context_links(self, 
+                              session: Session, 
+                              since: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Export context links, yielding one dict per row.
+        
+        With ``since``, only links touching a conversation newer than
+        ``since`` (the conversations exported alongside them) or created
+        after it are exported.
+        """
         try:
-            with self.db_manager.get_session() as session:
-                context_links = session.query(ContextLink).all()
-                
-                exported_links = []
-                for link in context_links:
-                    link_data = {
-                        "id": link.id,
-                        "source_conversation_id": link.source_conversation_id,
-                        "target_conversation_id": link.target_conversation_id,
-                        "relationship_type": link.relationship_type,
-                        "confidence_score": link.confidence_score,
-                        "created_at": link.created_at.isoformat()
-                    }
-                    exported_links.append(link_data)
-                
-                logger.info(f"Exported {len(exported_links)} context links")
-                return exported_links
-                
+            query = select(
+                ContextLink.id,
+                ContextLink.source_conversation_id,
+                ContextLink.target_conversation_id,
+                ContextLink.relationship_type,
+                ContextLink.confidence_score,
+                self._iso_timestamp_column(session, ContextLink.created_at)
+            )
+            if since is not None:
+                # Select links by the conversations this export contains, as
+                # a link may be recorded after the conversations it joins;
+                # newer links between earlier conversations are kept as well
+                exported_ids = select(Conversation.id).where(Conversation.timestamp > since)
+                query = query.where(or_(
+                    ContextLink.source_conversation_id.in_(exported_ids),
+                    ContextLink.target_conversation_id.in_(exported_ids),
+                    ContextLink.created_at > since
+                ))
+            
+            rows = session.execute(
+                query.execution_options(yield_per=self.EXPORT_BATCH_SIZE)
+            ).mappings()
+            
+            exported_count = 0
+            for row in rows:
+                link_data = dict(row)
+                link_data["created_at"] = _isoformat(row["created_at"])
+                exported_count += 1
+                yield link_data
+            
+            logger.info(f"Exported {exported_count} context links")
+            
         except SQLAlchemyError as e:
             logger.error(f"Failed to export context links: {e}")
             raise DatabaseConnectionError(f"Failed to export context links: {e}") from e
     
-    def _get_export_statistics(self) -> Dict[str, Any]:
+    def _get_export_statistics(self, session: Session) -> Dict[str, Any]:
         """Get statistics about the exported data."""
         try:
-            with self.db_manager.get_session() as session:
-                stats = {
-                    "total_conversations": session.query(func.count(Conversation.id)).scalar() or 0,
-                    "total_projects": session.query(func.count(Project.id)).scalar() or 0,
-                    "total_preferences": session.query(func.count(Preference.key)).scalar() or 0,
-                    "total_context_links": session.query(func.count(ContextLink.id)).scalar() or 0,
+            # Totals and the conversation date range in a single round-trip
+            (total_conversations, total_projects, total_preferences,
+             total_context_links, oldest, newest) = session.execute(
+                select(
+                    select(func.count(Conversation.id)).scalar_subquery(),
+                    select(func.count(Project.id)).scalar_subquery(),
+                    select(func.count(Preference.key)).scalar_subquery(),
+                    select(func.count(ContextLink.id)).scalar_subquery(),
+                    select(func.min(Conversation.timestamp)).scalar_subquery(),
+                    select(func.max(Conversation.timestamp)).scalar_subquery()
+                )
+            ).one()
+            
+            stats = {
+                "total_conversations": total_conversations or 0,
+                "total_projects": total_projects or 0,
+                "total_preferences": total_preferences or 0,
+                "total_context_links": total_context_links or 0,
+            }
+            
+            if oldest and newest:
+                stats["conversation_date_range"] = {
+                    "oldest": oldest.isoformat(),
+                    "newest": newest.isoformat()
                 }
-                
-                # Date ranges
-                conv_dates = session.query(
-                    func.min(Conversation.timestamp),
-                    func.max(Conversation.timestamp)
-                ).first()
-                
-                if conv_dates[0] and conv_dates[1]:
-                    stats["conversation_date_range"] = {
-                        "oldest": conv_dates[0].isoformat(),
-                        "newest": conv_dates[1].isoformat()
-                    }
-                
-                # Tool usage
-                tool_counts = session.query(
-                    Conversation.tool_name,
-                    func.count(Conversation.id)
-                ).group_by(Conversation.tool_name).all()
-                
-                stats["conversations_by_tool"] = {tool: count for tool, count in tool_counts}
-                
-                return stats
-                
+            
+            # Tool usage (grouped, so it cannot be folded into the query above)
+            tool_counts = session.query(
+                Conversation.tool_name,
+                func.count(Conversation.id)
+            ).group_by(Conversation.tool_name).all()
+            
+            stats["conversations_by_tool"] = {tool: count for tool, count in tool_counts}
+            
+            return stats
+            
         except SQLAlchemyError as e:
             logger.error(f"Failed to get export statistics: {e}")
             return {}
     
-    def _write_json_export(self, data: Dict[str, Any], export_path: str) -> None:
+    def _export_sections(self, 
+                         session: Session, 
+                         metadata: Dict[str, Any], 
+                         include_embeddings: bool,
+                         since: Optional[datetime] = None) -> Tuple[Tuple[str, Iterator[Dict[str, Any]]], ...]:
+        """
+        Record the export cursor and return the row iterators for each section.
+        
+        Returns:
+            Tuple of (section name, row iterator) pairs in export order
+        """
+        # Record where this export ends so the next incremental run can resume
+        newest = session.scalar(select(func.max(Conversation.timestamp)))
+        metadata["export_cursor"] = (
+            newest.isoformat() if newest else metadata.get("since")
+        )
+        
+        return (
+            ("conversations", self._export_conversations(session, include_embeddings, since)),
+            ("projects", self._export_projects(session)),
+            ("preferences", self._export_preferences(session)),
+            ("context_links", self._export_context_links(session, since)),
+        )
+    
+    def _iter_export(self, 
+                     metadata: Dict[str, Any], 
+                     include_embeddings: bool,
+                     since: Optional[datetime] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield the whole export as ``(kind, value)`` events read in one session.
+        
+        The events are ``("metadata", metadata)`` once the export cursor is
+        recorded, ``(section, None)`` when a section starts, ``(section, row)``
+        for each of its rows, and finally ``("statistics", statistics)``.
+        
+        One session for all sections gives a single connection and a
+        consistent snapshot, so the statistics match the exported rows. The
+        session belongs to whichever thread iterates this generator.
+        """
+        with self.db_manager.get_session() as session:
+            sections = self._export_sections(session, metadata, include_embeddings, since)
+            yield "metadata", metadata
+            
+            for name, rows in sections:
+                yield name, None
+                for row in rows:
+                    yield name, row
+            
+            yield "statistics", self._get_export_statistics(session)
+    
+    def _write_export_document(self, 
+                               f: BinaryIO, 
+                               metadata: Dict[str, Any], 
+                               include_embeddings: bool,
+                               since: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Stream the export document into an open binary file.
+        
+        Each section is written row by row as it is read from the database,
+        so peak memory is bounded by the fetch batch rather than the dataset.
+        
+        Returns:
+            Dict with the export statistics written at the end of the document
+        """
+        statistics: Dict[str, Any] = {}
+        separator = None
+        
+        # Rows are fetched on a worker thread, which owns the export session,
+        # while this thread serializes and compresses the previous ones
+        events = _prefetch(self._iter_export(metadata, include_embeddings, since),
+                           self.EXPORT_BATCH_SIZE)
+        for kind, value in events:
+            if kind == "metadata":
+                f.write(b'{\n  "metadata": ')
+                f.write(_dumps(value))
+            elif kind == "statistics":
+                statistics = value
+            elif value is None:
+                if separator is not None:
+                    f.write(b"\n  ]")
+                f.write(b',\n  "' + kind.encode("ascii") + b'": [')
+                separator = b"\n    "
+            else:
+                f.write(separator)
+                f.write(_dumps(value))
+                separator = b",\n    "
+        
+        if separator is not None:
+            f.write(b"\n  ]")
+        f.write(b',\n  "statistics": ')
+        f.write(_dumps(statistics))
+        f.write(b"\n}\n")
+        
+        return statistics
+    
+    def _write_json_export(self, 
+                           metadata: Dict[str, Any], 
+                           include_embeddings: bool, 
+                           export_path: str,
+                           since: Optional[datetime] = None) -> None:
         """Write export data as JSON file."""
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(export_path, 'wb', buffering=self.EXPORT_WRITE_BUFFER_SIZE) as f:
+            self._write_export_document(f, metadata, include_embeddings, since)
     
-    def _write_compressed_export(self, data: Dict[str, Any], export_path: str) -> None:
-        """Write export data as compressed ZIP file."""
-        with zipfile.ZipFile(export_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Write main data file
-            json_data = json.dumps(data, indent=2, ensure_ascii=False)
-            zipf.writestr("export_data.json", json_data)
+    def _write_compressed_export(self, 
+                                 metadata: Dict[str, Any], 
+                                 include_embeddings: bool, 
+                                 export_path: str,
+                                 compression_level: int = 3,
+                                 since: Optional[datetime] = None) -> None:
+        """
+        Write export data as compressed ZIP file.
+        
+        Each section is written to its own newline-delimited JSON entry
+        (one row per line), so a truncated archive still yields every
+        complete row and readers can iterate a section without parsing
+        the rest of the export.
+        """
+        file_structure = {}
+        
+        with zipfile.ZipFile(export_path, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=compression_level) as zipf:
+            statistics: Dict[str, Any] = {}
+            
+            # Section entries are deflated; the small side files are
+            # stored uncompressed so no extra compressor state is set up.
+            # Rows are fetched on a worker thread, which owns the export
+            # session, while this thread serializes and compresses the
+            # previous ones.
+            with ExitStack() as section:
+                f = None
+                events = _prefetch(self._iter_export(metadata, include_embeddings, since),
+                                   self.EXPORT_BATCH_SIZE)
+                for kind, value in events:
+                    if kind == "statistics":
+                        statistics = value
+                    elif kind == "metadata":
+                        continue
+                    elif value is None:
+                        # Finish the previous entry before opening the next
+                        section.close()
+                        entry_name = f"{kind}.jsonl"
+                        entry = section.enter_context(
+                            zipf.open(entry_name, "w", force_zip64=True)
+                        )
+                        f = section.enter_context(
+                            io.BufferedWriter(entry, buffer_size=self.EXPORT_WRITE_BUFFER_SIZE)
+                        )
+                        file_structure[entry_name] = f"Exported {kind.replace('_', ' ')}, one JSON object per line"
+                    else:
+                        f.write(_dumps(value))
+                        f.write(b"\n")
+            
+            file_structure["metadata.json"] = "Export metadata and statistics"
+            file_structure["README.txt"] = "Information about this export"
             
             # Write metadata file
-            metadata = {
-                "export_info": data["metadata"],
-                "file_structure": {
-                    "export_data.json": "Main export data file",
-                    "README.txt": "Information about this export"
-                }
+            metadata_content = {
+                "export_info": metadata,
+                "statistics": statistics,
+                "file_structure": file_structure
             }
-            zipf.writestr("metadata.json", json.dumps(metadata, indent=2))
+            zipf.writestr("metadata.json", json.dumps(metadata_content, indent=2),
+                          compress_type=zipfile.ZIP_STORED)
             
             # Write README
             readme_content = f"""Cortex MCP Server Data Export
             
-Export Date: {data['metadata']['export_timestamp']}
-Format Version: {data['metadata']['format_version']}
+Export Date: {metadata['export_timestamp']}
+Format Version: {metadata['format_version']}
 
 This export contains:
-- {data['statistics']['total_conversations']} conversations
-- {data['statistics']['total_projects']} projects  
-- {data['statistics']['total_preferences']} preferences
-- {data['statistics']['total_context_links']} context links
+- {statistics.get('total_conversations', 0)} conversations
+- {statistics.get('total_projects', 0)} projects  
+- {statistics.get('total_preferences', 0)} preferences
+- {statistics.get('total_context_links', 0)} context links
 
 To import this data, use the import_data method of the DataExportImportService.
 """
-            zipf.writestr("README.txt", readme_content)
+            zipf.writestr("README.txt", readme_content, compress_type=zipfile.ZIP_STORED)
     
     def import_data(self, 
                    import_path: str,
                    overwrite_existing: bool = False,
-                   selective_import: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
+                   selective_import: Optional[Dict[str, bool]] = None,
+                   unsafe_fast: bool = False) -> Dict[str, Any]:
         """
         Import data from an export file.
         
@@ -304,6 +729,9 @@ To import this data, use the import_data method of the DataExportImportService.
             import_path: Path to the import file
             overwrite_existing: Whether to overwrite existing data
             selective_import: Dict specifying what to import (conversations, projects, etc.)
+            unsafe_fast: Disable SQLite fsyncs during the bulk writes. Faster, but
+                a crash mid-import can corrupt the database; only use when the
+                import can be retried from a backup
             
         Returns:
             Dict with import results and statistics
@@ -313,6 +741,7 @@ To import this data, use the import_data method of the DataExportImportService.
             FileNotFoundError: If import file not found
             ValueError: If import file format is invalid
         """
+        import_data = None
         try:
             import_file = Path(import_path)
             if not import_file.exists():
@@ -346,7 +775,7 @@ To import this data, use the import_data method of the DataExportImportService.
             
             if selective_import.get("projects", True):
                 results["results"]["projects"] = self._import_projects(
-                    import_data["projects"], overwrite_existing
+                    import_data["projects"], overwrite_existing, unsafe_fast
                 )
             
             if selective_import.get("preferences", True):
@@ -356,37 +785,145 @@ To import this data, use the import_data method of the DataExportImportService.
             
             if selective_import.get("conversations", True):
                 results["results"]["conversations"] = self._import_conversations(
-                    import_data["conversations"], overwrite_existing
+                    import_data["conversations"], overwrite_existing, unsafe_fast
                 )
             
             if selective_import.get("context_links", True):
                 results["results"]["context_links"] = self._import_context_links(
-                    import_data["context_links"], overwrite_existing
+                    import_data["context_links"], overwrite_existing, unsafe_fast
                 )
             
+            self._stats_cache = None
             logger.info("Data import completed successfully")
             return results
             
         except Exception as e:
             logger.error(f"Data import failed: {e}")
             raise DatabaseConnectionError(f"Data import failed: {e}") from e
+        finally:
+            # Release the temporary files behind spooled sections
+            for section in (import_data or {}).values():
+                if isinstance(section, _SpooledSection):
+                    section.close()
     
     def _load_import_data(self, import_path: str) -> Dict[str, Any]:
-        """Load data from import file (JSON or ZIP)."""
+        """
+        Load data from import file (JSON or ZIP).
+        
+        When ijson is available the data sections are returned as lazy
+        iterables that parse one row at a time from the file, so memory use
+        does not grow with the size of the export.
+        """
         import_file = Path(import_path)
         
         if import_file.suffix.lower() == '.zip':
             # Load from ZIP file
             with zipfile.ZipFile(import_path, 'r') as zipf:
-                if "export_data.json" in zipf.namelist():
-                    with zipf.open("export_data.json") as f:
-                        return json.load(f)
-                else:
+                names = set(zipf.namelist())
+                metadata = self._read_zip_metadata(zipf, names)
+                if metadata.get("format_version") in _JSONL_ARCHIVE_VERSIONS:
+                    return self._load_jsonl_import_data(zipf, import_path, names, metadata)
+                if "export_data.json" not in names:
                     raise ValueError("Invalid ZIP export file: missing export_data.json")
+            # Archives written before the JSONL layout hold a single document
+            opener = partial(_open_zip_entry, import_path, "export_data.json")
         else:
             # Load from JSON file
-            with open(import_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            opener = partial(open, import_path, 'rb')
+        
+        if IJSON_AVAILABLE:
+            return self._stream_import_data(opener)
+        
+        if ORJSON_AVAILABLE and import_file.suffix.lower() != '.zip':
+            # Parse straight from the page cache instead of copying the file
+            # into a bytes object and then decoding it into a str
+            with open(import_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return orjson.loads(memoryview(mapped))
+        
+        with opener() as f:
+            return json.load(f)
+    
+    def _read_zip_metadata(self, zipf: zipfile.ZipFile, names: set) -> Dict[str, Any]:
+        """
+        Read the export metadata of a ZIP export.
+        
+        Format 1.1 archives wrap it in ``export_info``; 1.0 archives store
+        the metadata object itself. Returns an empty dict if there is none.
+        """
+        if "metadata.json" not in names:
+            return {}
+        
+        with zipf.open("metadata.json") as f:
+            content = json.load(f)
+        return content.get("export_info", content)
+    
+    def _load_jsonl_import_data(self, 
+                                zipf: zipfile.ZipFile, 
+                                import_path: str, 
+                                names: set,
+                                metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a lazily-parsed view of a ZIP export with one JSONL entry per section."""
+        data: Dict[str, Any] = {"metadata": metadata}
+        
+        for key in ("conversations", "projects", "preferences", "context_links"):
+            entry_name = f"{key}.jsonl"
+            if entry_name not in names:
+                raise ValueError(f"Invalid ZIP export file: missing {entry_name}")
+            data[key] = _JsonLinesSection(import_path, entry_name)
+        
+        return data
+    
+    def _stream_import_data(self, opener: Callable[[], ContextManager[BinaryIO]]) -> Dict[str, Any]:
+        """
+        Build a lazily-parsed view of an export document.
+        
+        The document is parsed in a single streaming pass. Rows of each data
+        section are spooled to a temporary JSON-lines file as they are
+        parsed, so the sections can be read back in any order without
+        parsing the document again or holding it in memory.
+        """
+        sections = ("conversations", "projects", "preferences", "context_links")
+        data: Dict[str, Any] = {}
+        spooled: Dict[str, _SpooledSection] = {}
+        
+        # Prefix of the value being built, where it is spooled (None for
+        # the metadata object), and its builder
+        building: Optional[str] = None
+        target: Optional[_SpooledSection] = None
+        builder = None
+        
+        try:
+            with opener() as f:
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == building and event in ("end_map", "end_array"):
+                            if target is None:
+                                data["metadata"] = builder.value
+                            else:
+                                target.append(builder.value)
+                            building = target = builder = None
+                    elif prefix == "" and event == "map_key":
+                        if value in sections:
+                            spooled[value] = data[value] = _SpooledSection()
+                    elif prefix == "metadata" and event == "start_map":
+                        building, target = prefix, None
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix.endswith(".item") and prefix[:-5] in spooled:
+                        if event in ("start_map", "start_array"):
+                            building, target = prefix, spooled[prefix[:-5]]
+                            builder = ijson.ObjectBuilder()
+                            builder.event(event, value)
+                        else:
+                            spooled[prefix[:-5]].append(value)
+        except Exception:
+            for section in spooled.values():
+                section.close()
+            raise
+        
+        return data
     
     def _validate_import_data(self, data: Dict[str, Any]) -> None:
         """Validate import data structure."""
@@ -398,56 +935,166 @@ To import this data, use the import_data method of the DataExportImportService.
         
         # Check format version compatibility
         format_version = data["metadata"].get("format_version", "unknown")
-        if format_version != self.export_format_version:
+        if format_version not in _SUPPORTED_FORMAT_VERSIONS:
             logger.warning(f"Import format version {format_version} may not be fully compatible with current version {self.export_format_version}")
     
-    def _import_projects(self, projects_data: List[Dict[str, Any]], overwrite: bool) -> Dict[str, Any]:
+    @contextmanager
+    def _import_session(self, unsafe_fast: bool = False) -> Iterator[Session]:
+        """
+        Open a session tuned for bulk writes.
+        
+        On SQLite the connection's fsync level is lowered to NORMAL (OFF with
+        ``unsafe_fast``), which is still crash-safe in WAL mode, and its page
+        cache is enlarged. The session is bound to one connection for its
+        whole life, so the per-batch commits do not hand the tuned connection
+        back to the pool; the settings are restored on that same connection
+        before it is returned.
+        """
+        engine = self.db_manager.engine
+        if engine.dialect.name != "sqlite":
+            with self.db_manager.get_session() as session:
+                yield session
+            return
+        
+        with engine.connect() as connection:
+            previous_synchronous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+            previous_cache_size = connection.exec_driver_sql("PRAGMA cache_size").scalar()
+            connection.exec_driver_sql(f"PRAGMA synchronous={'OFF' if unsafe_fast else 'NORMAL'}")
+            connection.exec_driver_sql("PRAGMA cache_size=-200000")
+            # End the implicit transaction so the session's commits are real
+            connection.commit()
+            
+            session = self.db_manager.session_factory(bind=connection)
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+                connection.exec_driver_sql(f"PRAGMA synchronous={int(previous_synchronous)}")
+                connection.exec_driver_sql(f"PRAGMA cache_size={int(previous_cache_size)}")
+                connection.commit()
+    
+    def _bulk_insert(self, 
+                     session: Session, 
+                     statement: Any, 
+                     rows: List[Dict[str, Any]], 
+                     results: Dict[str, Any],
+                     label: str,
+                     returns_rows: bool = False) -> None:
+        """
+        Insert a batch of rows with a single executemany and commit it.
+        
+        Committing per batch keeps the write lock short so repository calls
+        made between batches are not blocked by this session.
+        
+        When ``returns_rows`` is set the statement returns one row per
+        inserted row, so rows skipped by a conflict clause are counted as
+        skipped instead of imported.
+        
+        If the batch fails it is rolled back and retried one row at a time,
+        so only the rows that cannot be inserted are counted as errors.
+        """
+        if not rows:
+            return
+        
+        try:
+            result = session.execute(statement, rows)
+            inserted = len(result.all()) if returns_rows else len(rows)
+            session.commit()
+            results["imported"] += inserted
+            results["skipped"] += len(rows) - inserted
+            return
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.warning(f"Batch of {len(rows)} {label} failed, retrying row by row: {e}")
+        
+        for row in rows:
+            try:
+                result = session.execute(statement, [row])
+                inserted = len(result.all()) if returns_rows else 1
+                session.commit()
+                results["imported"] += inserted
+                results["skipped"] += 1 - inserted
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.error(f"Failed to import one of {label}: {e}")
+                results["errors"] += 1
+    
+    def _existing_ids(self, session: Session, id_column: Any, ids: List[Any]) -> set:
+        """
+        Return which of ``ids`` already exist, using batched SELECTs instead of a probe per row.
+        
+        The IN list is split into chunks of ``IN_CLAUSE_CHUNK_SIZE`` to stay
+        under SQLite's bound-parameter limit (999 on older builds).
+        """
+        existing = set()
+        for chunk in _batched(ids, self.IN_CLAUSE_CHUNK_SIZE):
+            existing.update(session.scalars(select(id_column).where(id_column.in_(chunk))))
+        return existing
+    
+    def _import_projects(self, projects_data: Iterable[Dict[str, Any]], overwrite: bool,
+                         unsafe_fast: bool = False) -> Dict[str, Any]:
         """Import projects data."""
         results = {"imported": 0, "skipped": 0, "errors": 0}
+        fromiso = datetime.fromisoformat  # bound once for the row loop
         
-        for project_data in projects_data:
-            try:
-                # Check if project exists
-                existing_project = self.project_repo.get_by_id(project_data["id"])
-                
-                if existing_project and not overwrite:
-                    results["skipped"] += 1
-                    continue
-                
-                if existing_project and overwrite:
-                    # Update existing project
-                    from models.schemas import ProjectUpdate
-                    update_data = ProjectUpdate(
-                        name=project_data["name"],
-                        path=project_data.get("path"),
-                        description=project_data.get("description")
-                    )
-                    self.project_repo.update(project_data["id"], update_data)
-                else:
-                    # Create new project with specific ID
-                    with self.db_manager.get_session() as session:
-                        project = Project(
-                            id=project_data["id"],
-                            name=project_data["name"],
-                            path=project_data.get("path"),
-                            description=project_data.get("description"),
-                            created_at=datetime.fromisoformat(project_data["created_at"]),
-                            last_accessed=datetime.fromisoformat(project_data["last_accessed"])
-                        )
-                        session.add(project)
-                        session.commit()
+        with self._import_session(unsafe_fast) as session:
+            for batch in _batched(projects_data, self.IMPORT_BATCH_SIZE):
+                new_rows = []
+                queued_ids = set()
+                existing_ids = self._existing_ids(session, Project.id, [p["id"] for p in batch])
                 
-                results["imported"] += 1
+                for project_data in batch:
+                    try:
+                        if project_data["id"] in queued_ids:
+                            # Repeated ID within this batch; the first copy wins
+                            results["skipped"] += 1
+                            continue
+                        
+                        # Check if project exists
+                        existing_project = project_data["id"] in existing_ids
+                        
+                        if existing_project and not overwrite:
+                            results["skipped"] += 1
+                            continue
+                        
+                        if existing_project and overwrite:
+                            # Update existing project
+                            update_data = ProjectUpdate(
+                                name=project_data["name"],
+                                path=project_data.get("path"),
+                                description=project_data.get("description")
+                            )
+                            self.project_repo.update(project_data["id"], update_data)
+                            results["imported"] += 1
+                        else:
+                            # Queue new project with specific ID for bulk insert
+                            new_rows.append({
+                                "id": project_data["id"],
+                                "name": project_data["name"],
+                                "path": project_data.get("path"),
+                                "description": project_data.get("description"),
+                                "created_at": fromiso(project_data["created_at"]),
+                                "last_accessed": fromiso(project_data["last_accessed"])
+                            })
+                            queued_ids.add(project_data["id"])
+                        
+                    except Exception as e:
+                        logger.error(f"Failed to import project {project_data.get('id', 'unknown')}: {e}")
+                        results["errors"] += 1
                 
-            except Exception as e:
-                logger.error(f"Failed to import project {project_data.get('id', 'unknown')}: {e}")
-                results["errors"] += 1
+                self._bulk_insert(session, _INSERT_PROJECT, new_rows, results, "projects")
         
         return results
     
-    def _import_preferences(self, preferences_data: List[Dict[str, Any]], overwrite: bool) -> Dict[str, Any]:
+    def _import_preferences(self, preferences_data: Iterable[Dict[str, Any]], overwrite: bool) -> Dict[str, Any]:
         """Import preferences data."""
         results = {"imported": 0, "skipped": 0, "errors": 0}
+        # Plain dict lookup instead of Enum construction, which raises on misses
+        categories = {category.value: category for category in PreferenceCategory}
         
         for pref_data in preferences_data:
             try:
@@ -461,9 +1108,8 @@ To import this data, use the import_data method of the DataExportImportService.
                 # Set preference (creates or updates)
                 category = None
                 if pref_data.get("category"):
-                    try:
-                        category = PreferenceCategory(pref_data["category"])
-                    except ValueError:
+                    category = categories.get(pref_data["category"])
+                    if category is None:
                         logger.warning(f"Unknown preference category: {pref_data['category']}")
                 
                 self.preferences_repo.set_value(
@@ -480,91 +1126,155 @@ To import this data, use the import_data method of the DataExportImportService.
         
         return results
     
-    def _import_conversations(self, conversations_data: List[Dict[str, Any]], overwrite: bool) -> Dict[str, Any]:
+    def _import_conversations(self, conversations_data: Iterable[Dict[str, Any]], overwrite: bool,
+                              unsafe_fast: bool = False) -> Dict[str, Any]:
         """Import conversations data."""
         results = {"imported": 0, "skipped": 0, "errors": 0}
+        fromiso = datetime.fromisoformat  # bound once for the row loop
         
-        for conv_data in conversations_data:
-            try:
-                # Check if conversation exists
-                existing_conv = self.conversation_repo.get_by_id(conv_data["id"])
-                
-                if existing_conv and not overwrite:
-                    results["skipped"] += 1
-                    continue
-                
-                if existing_conv and overwrite:
-                    # Update existing conversation
-                    from models.schemas import ConversationUpdate
-                    update_data = ConversationUpdate(
-                        content=conv_data["content"],
-                        conversation_metadata=conv_data.get("conversation_metadata"),
-                        tags=conv_data.get("tags"),
-                        project_id=conv_data.get("project_id")
-                    )
-                    self.conversation_repo.update(conv_data["id"], update_data)
-                else:
-                    # Create new conversation with specific ID
-                    with self.db_manager.get_session() as session:
-                        conversation = Conversation(
-                            id=conv_data["id"],
-                            tool_name=conv_data["tool_name"],
-                            project_id=conv_data.get("project_id"),
-                            timestamp=datetime.fromisoformat(conv_data["timestamp"]),
-                            content=conv_data["content"],
-                            conversation_metadata=conv_data.get("conversation_metadata"),
-                            tags=", ".join(conv_data["tags"]) if conv_data.get("tags") else None
-                        )
-                        session.add(conversation)
-                        session.commit()
+        with self._import_session(unsafe_fast) as session:
+            for batch in _batched(conversations_data, self.IMPORT_BATCH_SIZE):
+                new_rows = []
+                queued_ids = set()
+                existing_ids = self._existing_ids(session, Conversation.id, [c["id"] for c in batch])
                 
-                results["imported"] += 1
+                for conv_data in batch:
+                    try:
+                        if conv_data["id"] in queued_ids:
+                            # Repeated ID within this batch; the first copy wins
+                            results["skipped"] += 1
+                            continue
+                        
+                        # Check if conversation exists
+                        existing_conv = conv_data["id"] in existing_ids
+                        
+                        if existing_conv and not overwrite:
+                            results["skipped"] += 1
+                            continue
+                        
+                        if existing_conv and overwrite:
+                            # Update existing conversation
+                            update_data = ConversationUpdate(
+                                content=conv_data["content"],
+                                conversation_metadata=conv_data.get("conversation_metadata"),
+                                tags=conv_data.get("tags"),
+                                project_id=conv_data.get("project_id")
+                            )
+                            self.conversation_repo.update(conv_data["id"], update_data)
+                            results["imported"] += 1
+                        else:
+                            # Queue new conversation with specific ID for bulk insert
+                            new_rows.append({
+                                "id": conv_data["id"],
+                                "tool_name": conv_data["tool_name"],
+                                "project_id": conv_data.get("project_id"),
+                                "timestamp": fromiso(conv_data["timestamp"]),
+                                "content": conv_data["content"],
+                                "conversation_metadata": conv_data.get("conversation_metadata"),
+                                "tags": ", ".join(conv_data["tags"]) if conv_data.get("tags") else None
+                            })
+                            queued_ids.add(conv_data["id"])
+                        
+                    except Exception as e:
+                        logger.error(f"Failed to import conversation {conv_data.get('id', 'unknown')}: {e}")
+                        results["errors"] += 1
                 
-            except Exception as e:
-                logger.error(f"Failed to import conversation {conv_data.get('id', 'unknown')}: {e}")
-                results["errors"] += 1
+                self._bulk_insert(session, _INSERT_CONVERSATION, new_rows, results, "conversations")
         
         return results
     
-    def _import_context_links(self, links_data: List[Dict[str, Any]], overwrite: bool) -> Dict[str, Any]:
+    def _import_context_links(self, links_data: Iterable[Dict[str, Any]], overwrite: bool,
+                              unsafe_fast: bool = False) -> Dict[str, Any]:
         """Import context links data."""
         results = {"imported": 0, "skipped": 0, "errors": 0}
+        fromiso = datetime.fromisoformat  # bound once for the row loop
         
-        for link_data in links_data:
-            try:
-                with self.db_manager.get_session() as session:
-                    # Check if link exists
-                    existing_link = session.query(ContextLink).filter(
-                        ContextLink.source_conversation_id == link_data["source_conversation_id"],
-                        ContextLink.target_conversation_id == link_data["target_conversation_id"],
-                        ContextLink.relationship_type == link_data["relationship_type"]
-                    ).first()
-                    
-                    if existing_link and not overwrite:
-                        results["skipped"] += 1
-                        continue
-                    
-                    if existing_link and overwrite:
-                        # Update existing link
-                        existing_link.confidence_score = link_data["confidence_score"]
-                        session.commit()
-                    else:
-                        # Create new link
-                        context_link = ContextLink(
-                            source_conversation_id=link_data["source_conversation_id"],
-                            target_conversation_id=link_data["target_conversation_id"],
-                            relationship_type=link_data["relationship_type"],
-                            confidence_score=link_data["confidence_score"],
-                            created_at=datetime.fromisoformat(link_data["created_at"])
+        with self._import_session(unsafe_fast) as session:
+            # Links are unique per (source, target, relationship type); where
+            # the dialect allows it, a link created concurrently while an
+            # import runs is kept rather than failing the batch, and RETURNING
+            # tells which rows were really inserted
+            dialect = session.get_bind().dialect
+            insert_links = _INSERT_CONTEXT_LINK
+            returns_rows = False
+            conflict_skipping_insert = _CONFLICT_SKIPPING_INSERTS.get(dialect.name)
+            if conflict_skipping_insert is not None:
+                insert_links = conflict_skipping_insert(ContextLink).on_conflict_do_nothing()
+                if dialect.insert_returning:
+                    insert_links = insert_links.returning(ContextLink.id)
+                    returns_rows = True
+            
+            # Look up every existing (source, target, type) triple in one query
+            existing_links = {
+                (source_id, target_id, rel_type): link_id
+                for link_id, source_id, target_id, rel_type in session.execute(
+                    select(
+                        ContextLink.id,
+                        ContextLink.source_conversation_id,
+                        ContextLink.target_conversation_id,
+                        ContextLink.relationship_type
+                    )
+                )
+            }
+            queued_links = set()
+            
+            for batch in _batched(links_data, self.IMPORT_BATCH_SIZE):
+                new_rows = []
+                updated_rows = []
+                
+                for link_data in batch:
+                    try:
+                        # Check if link exists
+                        link_key = (
+                            link_data["source_conversation_id"],
+                            link_data["target_conversation_id"],
+                            link_data["relationship_type"]
                         )
-                        session.add(context_link)
-                        session.commit()
-                    
-                    results["imported"] += 1
+                        if link_key in queued_links:
+                            # Duplicate of a link already imported from this file
+                            results["skipped"] += 1
+                            continue
+                        
+                        existing_link_id = existing_links.get(link_key)
+                        
+                        if existing_link_id is not None and not overwrite:
+                            results["skipped"] += 1
+                            continue
+                        
+                        if existing_link_id is not None and overwrite:
+                            # Queue confidence update for existing link
+                            updated_rows.append({
+                                "id": existing_link_id,
+                                "confidence_score": link_data["confidence_score"]
+                            })
+                        else:
+                            # Queue new link for bulk insert
+                            new_rows.append({
+                                "source_conversation_id": link_data["source_conversation_id"],
+                                "target_conversation_id": link_data["target_conversation_id"],
+                                "relationship_type": link_data["relationship_type"],
+                                "confidence_score": link_data["confidence_score"],
+                                "created_at": fromiso(link_data["created_at"])
+                            })
+                            queued_links.add(link_key)
+                        
+                    except Exception as e:
+                        logger.error(f"Failed to import context link: {e}")
+                        results["errors"] += 1
                 
-            except Exception as e:
-                logger.error(f"Failed to import context link: {e}")
-                results["errors"] += 1
+                if updated_rows:
+                    try:
+                        # Bulk UPDATE by primary key as a single executemany
+                        session.execute(_UPDATE_CONTEXT_LINK, updated_rows)
+                        session.commit()
+                        results["imported"] += len(updated_rows)
+                    except SQLAlchemyError as e:
+                        session.rollback()
+                        logger.error(f"Failed to update batch of {len(updated_rows)} context links: {e}")
+                        results["errors"] += len(updated_rows)
+                
+                self._bulk_insert(session, insert_links, new_rows, results, "context links",
+                                  returns_rows=returns_rows)
         
         return results
     
@@ -672,14 +1382,15 @@ To import this data, use the import_data method of the DataExportImportService.
             cutoff_date = datetime.now() - timedelta(days=older_than_days)
             
             with self.db_manager.get_session() as session:
-                # Find conversations to delete
-                total_conversations = session.query(func.count(Conversation.id)).scalar() or 0
-                
-                old_conversations_query = session.query(Conversation).filter(
-                    Conversation.timestamp < cutoff_date
-                ).order_by(Conversation.timestamp)
-                
-                old_conversations_count = old_conversations_query.count()
+                # Find conversations to delete; both counts come from one scan
+                total_conversations, old_conversations_count = session.execute(
+                    select(
+                        func.count(Conversation.id),
+                        func.sum(case((Conversation.timestamp < cutoff_date, 1), else_=0))
+                    )
+                ).one()
+                total_conversations = total_conversations or 0
+                old_conversations_count = old_conversations_count or 0
                 
                 # Calculate how many we can actually delete
                 conversations_to_keep = max(keep_minimum, total_conversations - old_conversations_count)
@@ -698,29 +1409,53 @@ To import this data, use the import_data method of the DataExportImportService.
                 }
                 
                 if actual_delete_count > 0:
-                    # Get the conversations to delete
-                    conversations_to_delete = old_conversations_query.limit(actual_delete_count).all()
+                    # Old conversations that are not among the newest keep_minimum;
+                    # this selects exactly the actual_delete_count oldest ones
+                    newest_ids = select(Conversation.id).order_by(
+                        Conversation.timestamp.desc()
+                    ).limit(keep_minimum)
+                    deletable_ids = select(Conversation.id).where(
+                        Conversation.timestamp < cutoff_date,
+                        Conversation.id.notin_(newest_ids)
+                    )
+                    
+                    ordered_ids = deletable_ids.order_by(Conversation.timestamp, Conversation.id)
                     
                     if not dry_run:
-                        # Delete context links first (foreign key constraints)
-                        for conv in conversations_to_delete:
-                            # Delete context links where this conversation is source or target
-                            session.query(ContextLink).filter(
-                                (ContextLink.source_conversation_id == conv.id) |
-                                (ContextLink.target_conversation_id == conv.id)
-                            ).delete(synchronize_session=False)
+                        # Commit per batch so the write lock and journal stay
+                        # small and concurrent writers are not starved. Each
+                        # batch is selected inside the DELETE statements and
+                        # RETURNING reports what was actually removed, so no
+                        # separate SELECT of the ids is needed.
+                        deleted_ids = results["deleted_conversation_ids"]
+                        while len(deleted_ids) < actual_delete_count:
+                            batch = ordered_ids.limit(
+                                min(self.CLEANUP_BATCH_SIZE, actual_delete_count - len(deleted_ids))
+                            )
                             
-                            results["deleted_conversation_ids"].append(conv.id)
-                        
-                        # Delete the conversations
-                        for conv in conversations_to_delete:
-                            session.delete(conv)
+                            # Delete context links first (foreign key constraints)
+                            session.execute(
+                                delete(ContextLink).where(or_(
+                                    ContextLink.source_conversation_id.in_(batch),
+                                    ContextLink.target_conversation_id.in_(batch)
+                                )).execution_options(synchronize_session=False)
+                            )
+                            batch_ids = list(session.scalars(
+                                delete(Conversation).where(Conversation.id.in_(batch))
+                                .returning(Conversation.id)
+                                .execution_options(synchronize_session=False)
+                            ))
+                            session.commit()
+                            
+                            if not batch_ids:
+                                break
+                            deleted_ids.extend(batch_ids)
+                            logger.debug(f"Deleted {len(deleted_ids)}/{actual_delete_count} old conversations")
                         
-                        session.commit()
-                        logger.info(f"Deleted {actual_delete_count} old conversations")
+                        self._stats_cache = None
+                        logger.info(f"Deleted {len(deleted_ids)} old conversations")
                     else:
-                        # Just collect IDs for dry run
-                        results["deleted_conversation_ids"] = [conv.id for conv in conversations_to_delete]
+                        results["deleted_conversation_ids"] = list(session.scalars(ordered_ids))
                         logger.info(f"Dry run: would delete {actual_delete_count} old conversations")
                 else:
                     logger.info("No conversations to delete based on criteria")
@@ -735,6 +1470,9 @@ To import this data, use the import_data method of the DataExportImportService.
         """
         Clean up orphaned data (context links without conversations, etc.).
         
+        Duplicate context links are removed as well, keeping the oldest of
+        each group, after which the unique index on context links is created.
+        
         Args:
             dry_run: If True, only report what would be cleaned without actually cleaning
             
@@ -751,44 +1489,59 @@ To import this data, use the import_data method of the DataExportImportService.
                 "cleanup_timestamp": datetime.now().isoformat(),
                 "dry_run": dry_run,
                 "orphaned_context_links": 0,
+                "duplicate_context_links": 0,
                 "orphaned_project_references": 0
             }
             
             with self.db_manager.get_session() as session:
-                # Find orphaned context links
-                orphaned_links = session.query(ContextLink).filter(
-                    ~session.query(Conversation).filter(
-                        Conversation.id == ContextLink.source_conversation_id
-                    ).exists() |
-                    ~session.query(Conversation).filter(
-                        Conversation.id == ContextLink.target_conversation_id
-                    ).exists()
-                ).all()
-                
-                results["orphaned_context_links"] = len(orphaned_links)
-                
-                if not dry_run and orphaned_links:
-                    for link in orphaned_links:
-                        session.delete(link)
-                    logger.info(f"Deleted {len(orphaned_links)} orphaned context links")
-                
-                # Find conversations with non-existent project references
-                orphaned_project_refs = session.query(Conversation).filter(
-                    Conversation.project_id.isnot(None),
-                    ~session.query(Project).filter(
-                        Project.id == Conversation.project_id
-                    ).exists()
-                ).all()
-                
-                results["orphaned_project_references"] = len(orphaned_project_refs)
+                if dry_run:
+                    results["orphaned_context_links"] = session.scalar(
+                        select(func.count()).select_from(_ORPHANED_LINK_IDS.subquery())
+                    ) or 0
+                    results["duplicate_context_links"] = session.scalar(
+                        select(func.count(ContextLink.id))
+                        .where(ContextLink.id.notin_(_CANONICAL_LINK_IDS))
+                    ) or 0
+                    results["orphaned_project_references"] = session.scalar(
+                        select(func.count()).select_from(_ORPHANED_PROJECT_REF_IDS.subquery())
+                    ) or 0
+                    return results
+                
+                # Clean up in the database with one statement per kind
+                # instead of loading and modifying each row in Python
+                deleted_links = session.execute(
+                    delete(ContextLink).where(ContextLink.id.in_(_ORPHANED_LINK_IDS))
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                results["orphaned_context_links"] = deleted_links
+                
+                if deleted_links:
+                    logger.info(f"Deleted {deleted_links} orphaned context links")
+                
+                # Remove duplicates left from before links were unique, then
+                # enforce uniqueness so they cannot come back
+                deleted_duplicates = session.execute(
+                    delete(ContextLink).where(ContextLink.id.notin_(_CANONICAL_LINK_IDS))
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                results["duplicate_context_links"] = deleted_duplicates
+                session.execute(text(CONTEXT_LINK_UNIQUE_INDEX))
+                
+                if deleted_duplicates:
+                    logger.info(f"Deleted {deleted_duplicates} duplicate context links")
+                
+                cleared_refs = session.execute(
+                    update(Conversation).where(Conversation.id.in_(_ORPHANED_PROJECT_REF_IDS))
+                    .values(project_id=None)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                results["orphaned_project_references"] = cleared_refs
+                
+                if cleared_refs:
+                    logger.info(f"Cleaned {cleared_refs} orphaned project references")
                 
-                if not dry_run and orphaned_project_refs:
-                    for conv in orphaned_project_refs:
-                        conv.project_id = None
-                    logger.info(f"Cleaned {len(orphaned_project_refs)} orphaned project references")
-                
-                if not dry_run:
-                    session.commit()
+                session.commit()
+                self._stats_cache = None
                 
                 return results
                 
@@ -796,16 +1549,158 @@ To import this data, use the import_data method of the DataExportImportService.
             logger.error(f"Orphaned data cleanup failed: {e}")
             raise DatabaseConnectionError(f"Orphaned data cleanup failed: {e}") from e
     
-    def get_data_statistics(self) -> Dict[str, Any]:
+    def _read_stats_summaries(self, session: Session) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Read the (key, count) rows of every statistics counter table.
+        
+        The tables and their triggers are created when the database is
+        initialized. On databases other than SQLite the counts are grouped
+        from the source tables directly.
+        """
+        if session.get_bind().dialect.name != "sqlite":
+            return {
+                summary: session.execute(text(
+                    f"SELECT {column}, COUNT(*) FROM {source} GROUP BY {column}"
+                )).all()
+                for summary, source, column in STATS_SUMMARIES
+            }
+        
+        return {
+            summary: session.execute(text(
+                f"SELECT key, count FROM {summary} WHERE count > 0"
+            )).all()
+            for summary, _, _ in STATS_SUMMARIES
+        }
+    
+    def rebuild_statistics_summary(self) -> None:
+        """
+        Recount the statistics counter tables from the source tables.
+        
+        The counters are kept current by triggers, so this is only needed
+        after changes made with the triggers absent (e.g. restoring a backup
+        taken from an older version).
+        
+        Raises:
+            DatabaseConnectionError: If the rebuild fails
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                if session.get_bind().dialect.name != "sqlite":
+                    return
+                
+                connection = session.connection()
+                create_stats_summaries(connection)
+                for summary, source, column in STATS_SUMMARIES:
+                    fill_stats_summary(connection, summary, source, column)
+                
+                self._stats_cache = None
+                logger.info("Rebuilt statistics summary tables")
+                
+        except Exception as e:
+            logger.error(f"Failed to rebuild statistics summary: {e}")
+            raise DatabaseConnectionError(f"Failed to rebuild statistics summary: {e}") from e
+    
+    def _get_storage_statistics(self, session: Session, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Report on-disk storage used by the database and its main tables.
+        
+        On SQLite, sizes are read from the page counters and the dbstat
+        virtual table (tables including their indexes). When dbstat is not
+        compiled in, or on other databases, the per-table figures fall back
+        to per-row size estimates.
+        """
+        mb = 1024 * 1024
+        storage: Dict[str, Any] = {}
+        table_bytes = None
+        
+        if session.get_bind().dialect.name == "sqlite":
+            storage["database_mb"] = (session.scalar(text(
+                "SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()"
+            )) or 0) / mb
+            
+            try:
+                table_bytes = dict(session.execute(text(
+                    "SELECT m.tbl_name, SUM(d.pgsize) FROM dbstat AS d "
+                    "JOIN sqlite_master AS m ON m.name = d.name "
+                    "WHERE d.aggregate = TRUE GROUP BY m.tbl_name"
+                )).all())
+            except SQLAlchemyError:
+                # SQLite built without SQLITE_ENABLE_DBSTAT_VTAB
+                pass
+        
+        if table_bytes is None:
+            avg_conversation_size = 1000  # Rough estimate in bytes
+            avg_preference_size = 100
+            storage["estimated_conversations_mb"] = (
+                stats["conversations"]["total"] * avg_conversation_size
+            ) / mb
+            storage["estimated_preferences_mb"] = (
+                stats["preferences"]["total"] * avg_preference_size
+            ) / mb
+            storage.setdefault(
+                "database_mb",
+                storage["estimated_conversations_mb"] + storage["estimated_preferences_mb"]
+            )
+            storage["is_estimate"] = True
+            return storage
+        
+        # Key names are kept for existing callers; the values are measured
+        storage["estimated_conversations_mb"] = table_bytes.get("conversations", 0) / mb
+        storage["estimated_preferences_mb"] = table_bytes.get("preferences", 0) / mb
+        storage["by_table_mb"] = {name: size / mb for name, size in table_bytes.items()}
+        storage["is_estimate"] = False
+        return storage
+    
+    def _estimate_row_count(self, session: Session, table: str) -> Optional[int]:
+        """
+        Return the planner's row count estimate for a table.
+        
+        The estimate comes from sqlite_stat1, which is filled by ANALYZE;
+        None is returned when no statistics have been gathered or the
+        database is not SQLite.
+        """
+        # Checked up front: on other databases a failed query would abort
+        # the transaction the remaining statistics queries run in
+        if session.get_bind().dialect.name != "sqlite":
+            return None
+        
+        try:
+            stat = session.scalar(
+                text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1"),
+                {"table": table}
+            )
+        except SQLAlchemyError:
+            # sqlite_stat1 only exists once ANALYZE has run
+            return None
+        
+        return int(stat.split()[0]) if stat else None
+    
+    def get_data_statistics(self, exact: bool = True) -> Dict[str, Any]:
         """
         Get comprehensive statistics about stored data.
         
+        With ``exact`` turned off, results are cached for ``STATS_CACHE_TTL``
+        seconds so repeated status calls skip the database; imports and
+        cleanups through this service invalidate the cache immediately.
+        
+        Args:
+            exact: Count every total exactly and bypass the cache. When False
+                the project total is taken from the query planner's
+                statistics when available and ``projects.is_estimate`` is
+                set; the other totals are always exact as they come from the
+                counter tables or the date range scan.
+        
         Returns:
             Dict with detailed data statistics
             
         Raises:
             DatabaseConnectionError: If statistics query fails
         """
+        cache_time = time.monotonic()
+        if (not exact and self._stats_cache is not None
+                and cache_time - self._stats_cache[0] < self.STATS_CACHE_TTL):
+            return copy.deepcopy(self._stats_cache[1])
+        
         try:
             with self.db_manager.get_session() as session:
                 stats = {
@@ -817,85 +1712,87 @@ To import this data, use the import_data method of the DataExportImportService.
                     "storage": {}
                 }
                 
-                # Conversation statistics
-                stats["conversations"]["total"] = session.query(func.count(Conversation.id)).scalar() or 0
-                
-                # By tool
-                tool_counts = session.query(
-                    Conversation.tool_name,
-                    func.count(Conversation.id)
-                ).group_by(Conversation.tool_name).all()
-                stats["conversations"]["by_tool"] = {tool: count for tool, count in tool_counts}
-                
-                # By date ranges
+                # Date range boundaries
                 now = datetime.now()
                 last_week = now - timedelta(days=7)
                 last_month = now - timedelta(days=30)
                 last_year = now - timedelta(days=365)
                 
-                stats["conversations"]["last_week"] = session.query(func.count(Conversation.id)).filter(
-                    Conversation.timestamp >= last_week
-                ).scalar() or 0
+                # Per-key counts are read from trigger-maintained counter
+                # tables instead of grouping the source tables on every call
+                summaries = self._read_stats_summaries(session)
+                
+                project_total = None if exact else self._estimate_row_count(session, "projects")
+                stats["projects"]["is_estimate"] = project_total is not None
+                if project_total is None:
+                    project_total = session.query(func.count(Project.id)).scalar() or 0
+                
+                # Conversation statistics: total and date-range counts come
+                # from one scan using conditional aggregation instead of one
+                # query per range
+                total, week_count, month_count, year_count = session.execute(
+                    select(
+                        func.count(Conversation.id),
+                        func.sum(case((Conversation.timestamp >= last_week, 1), else_=0)),
+                        func.sum(case((Conversation.timestamp >= last_month, 1), else_=0)),
+                        func.sum(case((Conversation.timestamp >= last_year, 1), else_=0))
+                    )
+                ).one()
+                stats["conversations"]["total"] = total or 0
                 
-                stats["conversations"]["last_month"] = session.query(func.count(Conversation.id)).filter(
-                    Conversation.timestamp >= last_month
-                ).scalar() or 0
+                # By tool
+                stats["conversations"]["by_tool"] = {
+                    (tool or None): count
+                    for tool, count in summaries["conversation_stats_by_tool"]
+                }
                 
-                stats["conversations"]["last_year"] = session.query(func.count(Conversation.id)).filter(
-                    Conversation.timestamp >= last_year
-                ).scalar() or 0
+                stats["conversations"]["last_week"] = week_count or 0
+                stats["conversations"]["last_month"] = month_count or 0
+                stats["conversations"]["last_year"] = year_count or 0
                 
                 # Project statistics
-                stats["projects"]["total"] = session.query(func.count(Project.id)).scalar() or 0
-                stats["projects"]["with_conversations"] = session.query(
-                    func.count(func.distinct(Conversation.project_id))
-                ).filter(Conversation.project_id.isnot(None)).scalar() or 0
+                stats["projects"]["total"] = project_total
+                stats["projects"]["with_conversations"] = session.scalar(
+                    select(
+                        func.count(func.distinct(Conversation.project_id))
+                    ).where(Conversation.project_id.isnot(None))
+                ) or 0
                 
                 # Most active projects
-                active_projects = session.query(
-                    Project.name,
-                    func.count(Conversation.id).label("conversation_count")
-                ).join(Conversation, Project.id == Conversation.project_id).group_by(
-                    Project.id, Project.name
-                ).order_by(text("conversation_count DESC")).limit(5).all()
-                
+                active_projects = session.execute(
+                    select(
+                        Project.name,
+                        func.count(Conversation.id).label("conversation_count")
+                    ).join(Conversation, Project.id == Conversation.project_id).group_by(
+                        Project.id, Project.name
+                    ).order_by(text("conversation_count DESC")).limit(5)
+                ).all()
                 stats["projects"]["most_active"] = [
                     {"name": name, "conversation_count": count}
                     for name, count in active_projects
                 ]
                 
                 # Preference statistics
-                stats["preferences"]["total"] = session.query(func.count(Preference.key)).scalar() or 0
-                
-                pref_categories = session.query(
-                    Preference.category,
-                    func.count(Preference.key)
-                ).group_by(Preference.category).all()
+                pref_categories = summaries["preference_stats_by_category"]
+                stats["preferences"]["total"] = sum(count for _, count in pref_categories)
                 stats["preferences"]["by_category"] = {
                     (cat or "uncategorized"): count for cat, count in pref_categories
                 }
                 
                 # Context link statistics
-                stats["context_links"]["total"] = session.query(func.count(ContextLink.id)).scalar() or 0
-                
-                link_types = session.query(
-                    ContextLink.relationship_type,
-                    func.count(ContextLink.id)
-                ).group_by(ContextLink.relationship_type).all()
-                stats["context_links"]["by_type"] = {rel_type: count for rel_type, count in link_types}
-                
-                # Storage estimates (rough)
-                avg_conversation_size = 1000  # Rough estimate in bytes
-                avg_preference_size = 100
-                
-                stats["storage"]["estimated_conversations_mb"] = (
-                    stats["conversations"]["total"] * avg_conversation_size
-                ) / (1024 * 1024)
+                link_types = summaries["context_link_stats_by_type"]
+                stats["context_links"]["total"] = sum(count for _, count in link_types)
+                stats["context_links"]["by_type"] = {
+                    (rel_type or None): count for rel_type, count in link_types
+                }
                 
-                stats["storage"]["estimated_preferences_mb"] = (
-                    stats["preferences"]["total"] * avg_preference_size
-                ) / (1024 * 1024)
+                # Storage figures
+                stats["storage"] = self._get_storage_statistics(session, stats)
                 
+                if not exact:
+                    # Callers get their own copy, so the cached entry cannot
+                    # be changed through a returned result
+                    self._stats_cache = (cache_time, copy.deepcopy(stats))
                 return stats
                 
         except Exception as e:
@@ -927,15 +1824,37 @@ To import this data, use the import_data method of the DataExportImportService.
             }
             
             with self.db_manager.get_session() as session:
-                # Check for orphaned context links
-                orphaned_links_count = session.query(func.count(ContextLink.id)).filter(
-                    ~session.query(Conversation).filter(
-                        Conversation.id == ContextLink.source_conversation_id
-                    ).exists() |
-                    ~session.query(Conversation).filter(
-                        Conversation.id == ContextLink.target_conversation_id
-                    ).exists()
-                ).scalar() or 0
+                # Once the unique index exists duplicates cannot be stored,
+                # so the grouping scan is only needed on older databases
+                links_unique = any(
+                    index["name"] == CONTEXT_LINK_UNIQUE_INDEX_NAME
+                    for index in inspect(session.connection()).get_indexes(ContextLink.__tablename__)
+                )
+                if links_unique:
+                    duplicate_link_count = literal(0)
+                else:
+                    duplicate_link_groups = select(ContextLink.source_conversation_id).group_by(
+                        ContextLink.source_conversation_id,
+                        ContextLink.target_conversation_id,
+                        ContextLink.relationship_type
+                    ).having(func.count() > 1).subquery()
+                    duplicate_link_count = select(func.count()).select_from(
+                        duplicate_link_groups
+                    ).scalar_subquery()
+                
+                # All four checks are answered by one statement of scalar
+                # subqueries instead of a round-trip per check
+                (orphaned_links_count, invalid_project_refs,
+                 duplicate_links, empty_conversations) = session.execute(select(
+                    select(func.count())
+                    .select_from(_ORPHANED_LINK_IDS.subquery()).scalar_subquery(),
+                    select(func.count())
+                    .select_from(_ORPHANED_PROJECT_REF_IDS.subquery()).scalar_subquery(),
+                    duplicate_link_count,
+                    select(func.count(Conversation.id)).where(
+                        (Conversation.content == "") | (Conversation.content.is_(None))
+                    ).scalar_subquery()
+                )).one()
                 
                 if orphaned_links_count > 0:
                     results["issues"].append({
@@ -944,14 +1863,6 @@ To import this data, use the import_data method of the DataExportImportService.
                         "description": f"{orphaned_links_count} context links reference non-existent conversations"
                     })
                 
-                # Check for conversations with invalid project references
-                invalid_project_refs = session.query(func.count(Conversation.id)).filter(
-                    Conversation.project_id.isnot(None),
-                    ~session.query(Project).filter(
-                        Project.id == Conversation.project_id
-                    ).exists()
-                ).scalar() or 0
-                
                 if invalid_project_refs > 0:
                     results["issues"].append({
                         "type": "invalid_project_references",
@@ -959,26 +1870,13 @@ To import this data, use the import_data method of the DataExportImportService.
                         "description": f"{invalid_project_refs} conversations reference non-existent projects"
                     })
                 
-                # Check for duplicate context links
-                duplicate_links = session.execute(text("""
-                    SELECT source_conversation_id, target_conversation_id, relationship_type, COUNT(*) as count
-                    FROM context_links 
-                    GROUP BY source_conversation_id, target_conversation_id, relationship_type
-                    HAVING COUNT(*) > 1
-                """)).fetchall()
-                
                 if duplicate_links:
                     results["warnings"].append({
                         "type": "duplicate_context_links",
-                        "count": len(duplicate_links),
-                        "description": f"{len(duplicate_links)} sets of duplicate context links found"
+                        "count": duplicate_links,
+                        "description": f"{duplicate_links} sets of duplicate context links found"
                     })
                 
-                # Check for conversations with empty content
-                empty_conversations = session.query(func.count(Conversation.id)).filter(
-                    (Conversation.content == "") | (Conversation.content.is_(None))
-                ).scalar() or 0
-                
                 if empty_conversations > 0:
                     results["warnings"].append({
                         "type": "empty_conversations",
@@ -2,7 +2,8 @@
 Encryption service for data at rest using AES-256.
 
 This module provides encryption and decryption capabilities for sensitive data
-stored in the database, using AES-256 encryption with secure key derivation.
+stored in the database, using AES-256-GCM encryption with secure key derivation.
+Values written by older releases with Fernet can still be decrypted.
 """
 
 import base64
@@ -10,15 +11,33 @@ import hashlib
 import logging
 import os
 import secrets
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 
 logger = logging.getLogger(__name__)
 
+# Prefix of values encrypted with AES-256-GCM; the rest is URL-safe base64
+# of the nonce followed by the ciphertext and tag
+_AESGCM_PREFIX = "v2:"
+
+# Size in bytes of the random AES-GCM nonce stored with each value
+_AESGCM_NONCE_SIZE = 12
+
+# Scrypt cost parameters used when none are given. These are the values
+# every existing key was derived with, so they must not change.
+DEFAULT_KDF_PARAMS: Dict[str, int] = {"n": 2**14, "r": 8, "p": 1}
+
+# Fernet tokens are URL-safe base64 beginning with the 0x80 version byte.
+# Values written by older releases wrapped the token in a second, standard
+# base64 layer and therefore never start with this prefix.
+_FERNET_TOKEN_PREFIX = "gAAAAA"
+
 
 class EncryptionError(Exception):
     """Base exception for encryption-related errors."""
@@ -38,14 +57,20 @@ class KeyDerivationError(EncryptionError):
 class EncryptionService:
     """Service for encrypting and decrypting data at rest."""
     
-    def __init__(self, passphrase: Optional[str] = None):
+    def __init__(self, passphrase: Optional[str] = None, kdf_params: Optional[Dict[str, int]] = None):
         """
         Initialize the encryption service.
         
         Args:
             passphrase: User-provided passphrase for key derivation.
                        If None, will look for ENCRYPTION_PASSPHRASE env var.
+            kdf_params: Scrypt cost parameters ``n``, ``r`` and ``p``.
+                       Defaults to DEFAULT_KDF_PARAMS; keys derived with other
+                       values need the same parameters to be derived again.
         """
+        self._kdf_params = {**DEFAULT_KDF_PARAMS, **(kdf_params or {})}
+        self._aead: Optional[AESGCM] = None
+        # Only used to read values written before the switch to AES-GCM
         self._fernet: Optional[Fernet] = None
         self._passphrase = passphrase or os.getenv("ENCRYPTION_PASSPHRASE")
         self._salt: Optional[bytes] = None
@@ -72,13 +97,12 @@ class EncryptionService:
             kdf = Scrypt(
                 length=32,  # 256 bits
                 salt=salt,
-                n=2**14,    # CPU/memory cost parameter (16384)
-                r=8,        # Block size parameter
-                p=1,        # Parallelization parameter
+                n=self._kdf_params["n"],  # CPU/memory cost parameter
+                r=self._kdf_params["r"],  # Block size parameter
+                p=self._kdf_params["p"],  # Parallelization parameter
             )
             
-            key = kdf.derive(passphrase.encode('utf-8'))
-            return base64.urlsafe_b64encode(key)
+            return kdf.derive(passphrase.encode('utf-8'))
             
         except Exception as e:
             logger.error(f"Key derivation failed: {e}")
@@ -117,8 +141,8 @@ class EncryptionService:
             # Derive key from passphrase
             key = self._derive_key_from_passphrase(self._passphrase, self._salt)
             
-            # Initialize Fernet cipher
-            self._fernet = Fernet(key)
+            # Initialize ciphers
+            self._set_key(key)
             
             logger.info("Encryption service initialized successfully")
             return self._salt
@@ -127,9 +151,14 @@ class EncryptionService:
             logger.error(f"Encryption service initialization failed: {e}")
             raise EncryptionError(f"Failed to initialize encryption: {e}") from e
     
+    def _set_key(self, key: bytes) -> None:
+        """Install a derived 32-byte key for encryption and legacy decryption."""
+        self._aead = AESGCM(key)
+        self._fernet = Fernet(base64.urlsafe_b64encode(key))
+    
     def is_enabled(self) -> bool:
         """Check if encryption is enabled and initialized."""
-        return self._fernet is not None
+        return self._aead is not None
     
     def encrypt(self, data: str) -> str:
         """
@@ -139,7 +168,7 @@ class EncryptionService:
             data: Plain text data to encrypt
             
         Returns:
-            str: Base64-encoded encrypted data
+            str: Encrypted value (version prefix and URL-safe base64 text)
             
         Raises:
             EncryptionError: If encryption fails
@@ -149,12 +178,47 @@ class EncryptionService:
             return data
         
         try:
-            # Convert string to bytes and encrypt
-            data_bytes = data.encode('utf-8')
-            encrypted_bytes = self._fernet.encrypt(data_bytes)
+            # AES-GCM authenticates the ciphertext itself, so one call
+            # replaces Fernet's separate AES-CBC and HMAC passes
+            nonce = os.urandom(_AESGCM_NONCE_SIZE)
+            ciphertext = self._aead.encrypt(nonce, data.encode('utf-8'), None)
+            return _AESGCM_PREFIX + base64.urlsafe_b64encode(nonce + ciphertext).decode('ascii')
             
-            # Return base64-encoded encrypted data
-            return base64.b64encode(encrypted_bytes).decode('ascii')
+        except Exception as e:
+            logger.error(f"Encryption failed: {e}")
+            raise EncryptionError(f"Failed to encrypt data: {e}") from e
+    
+    def encrypt_many(self, items: Iterable[str]) -> List[str]:
+        """
+        Encrypt many strings in one call.
+        
+        Equivalent to calling ``encrypt`` on each item, but the cipher and
+        helpers are looked up once for the whole batch, which matters when
+        encrypting thousands of values during bulk operations.
+        
+        Args:
+            items: Plain text strings to encrypt
+            
+        Returns:
+            List[str]: Encrypted values in input order
+            
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        if not self.is_enabled():
+            return list(items)
+        
+        aead_encrypt = self._aead.encrypt
+        urandom = os.urandom
+        b64encode = base64.urlsafe_b64encode
+        
+        try:
+            encrypted = []
+            for item in items:
+                nonce = urandom(_AESGCM_NONCE_SIZE)
+                payload = nonce + aead_encrypt(nonce, item.encode('utf-8'), None)
+                encrypted.append(_AESGCM_PREFIX + b64encode(payload).decode('ascii'))
+            return encrypted
             
         except Exception as e:
             logger.error(f"Encryption failed: {e}")
@@ -165,7 +229,7 @@ class EncryptionService:
         Decrypt a string using AES-256.
         
         Args:
-            encrypted_data: Base64-encoded encrypted data
+            encrypted_data: Encrypted value as returned by ``encrypt``
             
         Returns:
             str: Decrypted plain text data
@@ -178,14 +242,21 @@ class EncryptionService:
             return encrypted_data
         
         try:
-            # Decode base64 and decrypt
-            encrypted_bytes = base64.b64decode(encrypted_data.encode('ascii'))
-            decrypted_bytes = self._fernet.decrypt(encrypted_bytes)
+            if encrypted_data.startswith(_AESGCM_PREFIX):
+                payload = base64.urlsafe_b64decode(encrypted_data[len(_AESGCM_PREFIX):])
+                nonce = payload[:_AESGCM_NONCE_SIZE]
+                decrypted_bytes = self._aead.decrypt(nonce, payload[_AESGCM_NONCE_SIZE:], None)
+            else:
+                encrypted_bytes = encrypted_data.encode('ascii')
+                if not encrypted_data.startswith(_FERNET_TOKEN_PREFIX):
+                    # Legacy value with an extra base64 layer around the token
+                    encrypted_bytes = base64.b64decode(encrypted_bytes)
+                decrypted_bytes = self._fernet.decrypt(encrypted_bytes)
             
             # Convert bytes back to string
             return decrypted_bytes.decode('utf-8')
             
-        except InvalidToken as e:
+        except (InvalidTag, InvalidToken) as e:
             logger.error("Invalid token during decryption - wrong key or corrupted data")
             raise DecryptionError("Invalid encryption token - wrong passphrase or corrupted data") from e
         except Exception as e:
@@ -206,17 +277,20 @@ class EncryptionService:
         if not self.is_enabled():
             return data
         
-        encrypted_data = data.copy()
+        encrypted_data = dict(data)
+        encrypt = self.encrypt  # bound once for the field loop
         
-        for field in fields_to_encrypt:
-            if field in encrypted_data and encrypted_data[field] is not None:
-                try:
-                    # Convert to string if not already
-                    field_value = str(encrypted_data[field])
-                    encrypted_data[field] = self.encrypt(field_value)
-                except Exception as e:
-                    logger.error(f"Failed to encrypt field '{field}': {e}")
-                    # Keep original value if encryption fails
+        # Only visit the requested fields that are actually present
+        for field in data.keys() & set(fields_to_encrypt):
+            field_value = data[field]
+            if field_value is None:
+                continue
+            try:
+                # Convert to string if not already
+                encrypted_data[field] = encrypt(str(field_value))
+            except Exception as e:
+                logger.error(f"Failed to encrypt field '{field}': {e}")
+                # Keep original value if encryption fails
         
         return encrypted_data
     
@@ -234,15 +308,19 @@ class EncryptionService:
         if not self.is_enabled():
             return data
         
-        decrypted_data = data.copy()
+        decrypted_data = dict(data)
+        decrypt = self.decrypt  # bound once for the field loop
         
-        for field in fields_to_decrypt:
-            if field in decrypted_data and decrypted_data[field] is not None:
-                try:
-                    decrypted_data[field] = self.decrypt(str(decrypted_data[field]))
-                except Exception as e:
-                    logger.error(f"Failed to decrypt field '{field}': {e}")
-                    # Keep original value if decryption fails
+        # Only visit the requested fields that are actually present
+        for field in data.keys() & set(fields_to_decrypt):
+            field_value = data[field]
+            if field_value is None:
+                continue
+            try:
+                decrypted_data[field] = decrypt(str(field_value))
+            except Exception as e:
+                logger.error(f"Failed to decrypt field '{field}': {e}")
+                # Keep original value if decryption fails
         
         return decrypted_data
     
@@ -273,7 +351,7 @@ class EncryptionService:
             # Update internal state
             self._passphrase = new_passphrase
             self._salt = new_salt
-            self._fernet = Fernet(new_key)
+            self._set_key(new_key)
             
             logger.info("Encryption key rotated successfully")
             return old_salt, new_salt
@@ -310,10 +388,15 @@ class EncryptionService:
         """Get the current salt used for key derivation."""
         return self._salt
     
+    def get_kdf_params(self) -> Dict[str, int]:
+        """Get the Scrypt parameters used for key derivation (store these with the salt)."""
+        return dict(self._kdf_params)
+    
     def cleanup(self) -> None:
         """Clean up encryption service resources."""
-        if self._fernet:
+        if self._aead:
             # Clear sensitive data from memory
+            self._aead = None
             self._fernet = None
         
         if self._passphrase:
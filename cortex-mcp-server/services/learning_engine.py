@@ -5,14 +5,26 @@ This service analyzes conversation patterns, learns from user feedback,
 and improves suggestions over time to provide personalized assistance.
 """
 
+import asyncio
 import logging
 import re
-from collections import Counter, defaultdict
+import sys
+import time
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime, timedelta
+from itertools import chain, product
+from operator import itemgetter
 from typing import Dict, List, Optional, Set, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
+# Try to import optional Aho-Corasick keyword matcher
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from models.database import Conversation, Preference
 from models.schemas import PreferenceCategory, PreferenceCreate
 from repositories.conversation_repository import ConversationRepository
@@ -21,6 +33,95 @@ from config.database import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by the detectors are compiled once at import time instead of
+# being looked up in the re module cache on every call
+
+# Fenced code blocks, with an optional language identifier on the opening
+# line; inline fences such as ```x = 1``` have no language line
+_CODE_BLOCK_RE = re.compile(r'```(?:(?P<lang>[\w+#.-]*)\n)?(?P<code>.*?)```', re.DOTALL)
+
+# Leading whitespace of each non-blank line that is indented
+_LEADING_INDENT_RE = re.compile(r'^([^\S\n]+)\S', re.MULTILINE)
+
+# Quoted string literals in code, either kind in one scan; the opening
+# character of each match tells the kinds apart
+_QUOTES_RE = re.compile(r"'[^']*'|\"[^\"]*\"")
+_QUOTE_KINDS = {"'": 'single', '"': 'double'}
+
+# Resource references; _URL_RE captures each URL's domain so findall
+# returns domains directly without a second search per URL
+_URL_RE = re.compile(r'https?://([^/\s]+)[^\s]*')
+_FILE_PATH_RE = re.compile(r'[./][\w/.-]+\.\w+')
+
+
+class _KeywordMatcher:
+    """
+    Find which of a set of grouped keywords occur in a text.
+    
+    With pyahocorasick installed all keywords are found in one pass over the
+    text; otherwise each keyword is checked with a substring search. Either
+    way a keyword counts once per text, as a plain ``in`` test would.
+    """
+    
+    def __init__(self, keywords: Dict[str, List[str]]):
+        # (group, keyword) pairs in configuration order
+        self._entries = [
+            (group, keyword)
+            for group, group_keywords in keywords.items()
+            for keyword in group_keywords
+        ]
+        # Interned "group:keyword" counter keys, aligned with the entries, so
+        # detectors do not format a new key string per match
+        self._keys = [sys.intern(f"{group}:{keyword}") for group, keyword in self._entries]
+        self._automaton = None
+        # One alternation per group answers "does any keyword of this group
+        # occur" with a single search when the automaton is unavailable
+        self._group_res = {
+            group: re.compile('|'.join(map(re.escape, group_keywords)))
+            for group, group_keywords in keywords.items()
+            if group_keywords
+        }
+        
+        if AHOCORASICK_AVAILABLE and self._entries:
+            automaton = ahocorasick.Automaton()
+            for index, (_, keyword) in enumerate(self._entries):
+                # Keywords shared by several groups map to every group
+                indexes = automaton.get(keyword, ())
+                automaton.add_word(keyword, indexes + (index,))
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def _find_indexes(self, text: str) -> List[int]:
+        """Return the entry indexes whose keyword occurs in ``text``, ascending."""
+        if self._automaton is None:
+            return [index for index, (_, keyword) in enumerate(self._entries) if keyword in text]
+        
+        found = set()
+        for _, indexes in self._automaton.iter(text):
+            found.update(indexes)
+        return sorted(found)
+    
+    def find(self, text: str) -> List[Tuple[str, str]]:
+        """Return the (group, keyword) pairs found in ``text``, in configuration order."""
+        entries = self._entries
+        return [entries[index] for index in self._find_indexes(text)]
+    
+    def find_keys(self, text: str) -> List[str]:
+        """Return the "group:keyword" keys found in ``text``, in configuration order."""
+        keys = self._keys
+        return [keys[index] for index in self._find_indexes(text)]
+    
+    def find_groups(self, text: str) -> List[str]:
+        """Return the groups with at least one keyword in ``text``, in configuration order."""
+        if self._automaton is None:
+            return [group for group, group_re in self._group_res.items() if group_re.search(text)]
+        
+        groups = []
+        for group, _ in self.find(text):
+            if not groups or groups[-1] != group:
+                groups.append(group)
+        return groups
+
 
 class PatternType(str, Enum):
     """Types of patterns that can be detected."""
@@ -71,6 +172,12 @@ class UserFeedback:
 class LearningEngine:
     """Engine for learning user patterns and preferences."""
     
+    # Seconds a detection result stays valid for an unchanged conversation set
+    PATTERN_CACHE_TTL = 300.0
+    
+    # Maximum number of conversation sets with cached detection results
+    PATTERN_CACHE_SIZE = 64
+    
     def __init__(
         self,
         db_manager: DatabaseManager,
@@ -120,10 +227,34 @@ class LearningEngine:
                     ['plan', 'code', 'review'],
                     ['debug', 'fix', 'test'],
                     ['research', 'prototype', 'implement']
-                ]
+                ],
+                # Workflow-related keywords per phase
+                'keywords': {
+                    'planning': ['plan', 'design', 'architecture', 'requirements', 'spec'],
+                    'development': ['implement', 'code', 'build', 'create', 'develop'],
+                    'testing': ['test', 'verify', 'validate', 'check', 'debug'],
+                    'review': ['review', 'refactor', 'optimize', 'improve', 'clean'],
+                    'deployment': ['deploy', 'release', 'publish', 'launch', 'ship']
+                }
+            },
+            PatternType.RESOURCE_USAGE: {
+                'keywords': {
+                    'doc_type': ['documentation', 'docs', 'readme', 'wiki', 'guide', 'tutorial']
+                }
             }
         }
         
+        # Keyword matchers built once from the configurations above
+        self._tech_matcher = _KeywordMatcher(
+            self.pattern_configs[PatternType.TECHNOLOGY_PREFERENCE]['keywords']
+        )
+        self._workflow_matcher = _KeywordMatcher(
+            self.pattern_configs[PatternType.WORKFLOW_PATTERN]['keywords']
+        )
+        self._doc_matcher = _KeywordMatcher(
+            self.pattern_configs[PatternType.RESOURCE_USAGE]['keywords']
+        )
+        
         # Feedback processing weights
         self.feedback_weights = {
             FeedbackType.POSITIVE: 1.2,
@@ -142,6 +273,10 @@ class LearningEngine:
             'pattern_effectiveness': {},  # Track which patterns work best
             'user_preferences': {}  # Track user-specific preferences
         }
+        
+        # Detected patterns keyed on a signature of the analysed conversation
+        # set, as (monotonic timestamp, patterns), in least recently used order
+        self._pattern_cache: "OrderedDict[tuple, Tuple[float, List[DetectedPattern]]]" = OrderedDict()
 
     async def detect_user_preferences(
         self,
@@ -161,6 +296,12 @@ class LearningEngine:
             List[DetectedPattern]: Detected patterns with confidence scores
         """
         try:
+            # Count first so sparse windows skip loading conversations
+            recent_count = self.conversation_repo.count_recent(hours=time_window_days * 24)
+            if recent_count < min_conversations:
+                logger.info(f"Not enough conversations ({recent_count}) for pattern detection")
+                return []
+            
             # Get recent conversations
             cutoff_date = datetime.utcnow() - timedelta(days=time_window_days)
             conversations = self.conversation_repo.get_recent(
@@ -172,42 +313,59 @@ class LearningEngine:
                 logger.info(f"Not enough conversations ({len(conversations)}) for pattern detection")
                 return []
             
+            # Conversations are newest first, so a new conversation changes
+            # both the count and the leading timestamp
+            signature = (user_id, time_window_days, len(conversations), conversations[0].timestamp)
+            cached = self._pattern_cache.get(signature)
+            now = time.monotonic()
+            if cached is not None:
+                if now - cached[0] < self.PATTERN_CACHE_TTL:
+                    self._pattern_cache.move_to_end(signature)
+                    logger.debug("Using cached pattern detection results")
+                    return list(cached[1])
+                del self._pattern_cache[signature]
+            
             detected_patterns = []
             
-            # Detect coding style patterns
-            coding_patterns = self._detect_coding_style_patterns(conversations)
-            if coding_patterns:
-                logger.debug(f"Found {len(coding_patterns)} coding patterns")
-                detected_patterns.extend(coding_patterns)
-            
-            # Detect technology preferences
-            tech_patterns = self._detect_technology_preferences(conversations)
-            if tech_patterns:
-                logger.debug(f"Found {len(tech_patterns)} technology patterns")
-                detected_patterns.extend(tech_patterns)
-            
-            # Detect workflow patterns
-            workflow_patterns = self._detect_workflow_patterns(conversations)
-            if workflow_patterns:
-                logger.debug(f"Found {len(workflow_patterns)} workflow patterns")
-                detected_patterns.extend(workflow_patterns)
-            
-            # Detect resource usage patterns
-            resource_patterns = self._detect_resource_patterns(conversations)
-            if resource_patterns:
-                logger.debug(f"Found {len(resource_patterns)} resource patterns")
-                detected_patterns.extend(resource_patterns)
+            # The detectors are CPU-bound and independent of each other, so
+            # run them in the default executor to keep the event loop free
+            loop = asyncio.get_running_loop()
+            
+            # Lowercase each conversation once for all keyword detectors
+            lowered = await loop.run_in_executor(
+                None, lambda: [conv.content.lower() for conv in conversations]
+            )
+            
+            coding_patterns, tech_patterns, workflow_patterns, resource_patterns = await asyncio.gather(
+                loop.run_in_executor(None, self._detect_coding_style_patterns, conversations),
+                loop.run_in_executor(None, self._detect_technology_preferences, conversations, lowered),
+                loop.run_in_executor(None, self._detect_workflow_patterns, conversations, lowered),
+                loop.run_in_executor(None, self._detect_resource_patterns, conversations, lowered)
+            )
+            
+            for label, found in (
+                ('coding', coding_patterns),
+                ('technology', tech_patterns),
+                ('workflow', workflow_patterns),
+                ('resource', resource_patterns)
+            ):
+                if found:
+                    logger.debug(f"Found {len(found)} {label} patterns")
+                    detected_patterns.extend(found)
             
             # Filter patterns by confidence threshold
-            high_confidence_patterns = []
-            for pattern in detected_patterns:
-                if hasattr(pattern, 'confidence_score') and pattern.confidence_score >= 0.3:  # Lower threshold for testing
-                    high_confidence_patterns.append(pattern)
+            high_confidence_patterns = [
+                pattern for pattern in detected_patterns
+                if pattern.confidence_score >= 0.3  # Lower threshold for testing
+            ]
             
             logger.info(f"Detected {len(high_confidence_patterns)} high-confidence patterns "
                        f"from {len(conversations)} conversations")
             
-            return high_confidence_patterns
+            self._pattern_cache[signature] = (now, high_confidence_patterns)
+            if len(self._pattern_cache) > self.PATTERN_CACHE_SIZE:
+                self._pattern_cache.popitem(last=False)
+            return list(high_confidence_patterns)
             
         except Exception as e:
             logger.error(f"Error detecting user preferences: {e}")
@@ -220,52 +378,30 @@ class LearningEngine:
         try:
             # Extract code blocks from conversations
             code_blocks = []
+            find_blocks = _CODE_BLOCK_RE.finditer
             for conv in conversations:
-                # Try multiple patterns to extract code blocks
-                patterns = [
-                    r'```[^\n]*\n(.*?)\n```',  # Standard pattern with language
-                    r'```\n(.*?)\n```',        # Pattern without language
-                    r'```(.*?)```'             # Simple pattern
-                ]
-                
-                found_code = False
-                for pattern in patterns:
-                    code_matches = re.findall(pattern, conv.content, re.DOTALL)
-                    if code_matches:
-                        code_blocks.extend(code_matches)
-                        found_code = True
-                        break
-                
-                # If no matches with standard patterns, try extracting manually
-                if not found_code and '```' in conv.content:
-                    parts = conv.content.split('```')
-                    for i in range(1, len(parts), 2):  # Every other part is code
-                        code_content = parts[i].strip()
-                        # Remove language identifier if it's on the first line
-                        lines = code_content.split('\n')
-                        if len(lines) > 1 and lines[0].strip() and not any(c in lines[0] for c in [' ', '(', '{', '=']):
-                            code_content = '\n'.join(lines[1:])
-                        if code_content.strip():
-                            code_blocks.append(code_content)
+                # One pass over the content finds every fenced block
+                for match in find_blocks(conv.content):
+                    code_content = match.group('code')
+                    if code_content.strip():
+                        code_blocks.append(code_content)
             
             if not code_blocks:
                 return patterns
             
-            # Analyze indentation patterns
+            # Analyze indentation patterns. One regex pass collects the
+            # indentation of every indented, non-blank line; only the few
+            # distinct indent strings are then classified in Python.
+            indent_strings = Counter(_LEADING_INDENT_RE.findall('\n'.join(code_blocks)))
             indentation_counts = Counter()
-            for code in code_blocks:
-                lines = code.split('\n')
-                for line in lines:
-                    if line.strip():  # Skip empty lines
-                        leading_spaces = len(line) - len(line.lstrip())
-                        if leading_spaces > 0:
-                            if '\t' in line[:leading_spaces]:
-                                indentation_counts['tabs'] += 1
-                            else:
-                                indentation_counts[f'{leading_spaces}_spaces'] += 1
+            for indent, count in indent_strings.items():
+                if '\t' in indent:
+                    indentation_counts['tabs'] += count
+                else:
+                    indentation_counts[f'{len(indent)}_spaces'] += count
             
             if indentation_counts:
-                most_common_indent = indentation_counts.most_common(1)[0]
+                most_common_indent = max(indentation_counts.items(), key=itemgetter(1))
                 confidence = most_common_indent[1] / sum(indentation_counts.values())
                 
                 if confidence >= 0.6:
@@ -281,15 +417,12 @@ class LearningEngine:
                     ))
             
             # Analyze quote preferences
-            quote_counts = Counter()
+            quote_counts = Counter(single=0, double=0)
             for code in code_blocks:
-                single_quotes = len(re.findall(r"'[^']*'", code))
-                double_quotes = len(re.findall(r'"[^"]*"', code))
-                quote_counts['single'] += single_quotes
-                quote_counts['double'] += double_quotes
+                quote_counts.update(_QUOTE_KINDS[literal[0]] for literal in _QUOTES_RE.findall(code))
             
             if sum(quote_counts.values()) > 5:  # Minimum threshold
-                most_common_quote = quote_counts.most_common(1)[0]
+                most_common_quote = max(quote_counts.items(), key=itemgetter(1))
                 confidence = most_common_quote[1] / sum(quote_counts.values())
                 
                 if confidence >= 0.7:
@@ -310,24 +443,32 @@ class LearningEngine:
             logger.error(f"Error detecting coding style patterns: {e}")
             return []
 
-    def _detect_technology_preferences(self, conversations: List[Conversation]) -> List[DetectedPattern]:
-        """Detect technology preference patterns."""
+    def _detect_technology_preferences(
+        self,
+        conversations: List[Conversation],
+        lowered: Optional[List[str]] = None
+    ) -> List[DetectedPattern]:
+        """
+        Detect technology preference patterns.
+        
+        Args:
+            conversations: Conversations to analyze
+            lowered: Lowercased content of each conversation, computed here
+                if not supplied
+        """
         patterns = []
         
         try:
             # Count technology mentions
-            tech_mentions = defaultdict(int)
-            tech_contexts = defaultdict(list)
+            tech_mentions = Counter()
             
-            for conv in conversations:
-                content_lower = conv.content.lower()
-                
+            if lowered is None:
+                lowered = [conv.content.lower() for conv in conversations]
+            
+            find_technologies = self._tech_matcher.find_keys
+            for content_lower in lowered:
                 # Check for technology keywords
-                for category, technologies in self.pattern_configs[PatternType.TECHNOLOGY_PREFERENCE]['keywords'].items():
-                    for tech in technologies:
-                        if tech in content_lower:
-                            tech_mentions[f"{category}:{tech}"] += 1
-                            tech_contexts[f"{category}:{tech}"].append(conv.id)
+                tech_mentions.update(find_technologies(content_lower))
             
             # Analyze preferences within categories
             categories = defaultdict(Counter)
@@ -339,7 +480,7 @@ class LearningEngine:
             for category, tech_counts in categories.items():
                 if len(tech_counts) >= 1:  # At least 1 technology mentioned
                     total_mentions = sum(tech_counts.values())
-                    most_used = tech_counts.most_common(1)[0]
+                    most_used = max(tech_counts.items(), key=itemgetter(1))
                     
                     # Calculate confidence based on frequency and repetition
                     confidence = min(most_used[1] / max(total_mentions, 3), 1.0)  # Cap at 1.0
@@ -363,29 +504,31 @@ class LearningEngine:
             logger.error(f"Error detecting technology preferences: {e}")
             return []
 
-    def _detect_workflow_patterns(self, conversations: List[Conversation]) -> List[DetectedPattern]:
-        """Detect workflow and process patterns."""
+    def _detect_workflow_patterns(
+        self,
+        conversations: List[Conversation],
+        lowered: Optional[List[str]] = None
+    ) -> List[DetectedPattern]:
+        """
+        Detect workflow and process patterns.
+        
+        Args:
+            conversations: Conversations to analyze
+            lowered: Lowercased content of each conversation, computed here
+                if not supplied
+        """
         patterns = []
         
         try:
-            # Extract workflow-related keywords
-            workflow_keywords = {
-                'planning': ['plan', 'design', 'architecture', 'requirements', 'spec'],
-                'development': ['implement', 'code', 'build', 'create', 'develop'],
-                'testing': ['test', 'verify', 'validate', 'check', 'debug'],
-                'review': ['review', 'refactor', 'optimize', 'improve', 'clean'],
-                'deployment': ['deploy', 'release', 'publish', 'launch', 'ship']
-            }
-            
             # Track workflow sequences
             workflow_sequences = []
-            for conv in conversations:
-                content_lower = conv.content.lower()
-                conv_workflow = []
-                
-                for phase, keywords in workflow_keywords.items():
-                    if any(keyword in content_lower for keyword in keywords):
-                        conv_workflow.append(phase)
+            if lowered is None:
+                lowered = [conv.content.lower() for conv in conversations]
+            
+            find_phases = self._workflow_matcher.find_groups
+            for conv, content_lower in zip(conversations, lowered):
+                # Phases with at least one keyword present, in phase order
+                conv_workflow = find_phases(content_lower)
                 
                 if conv_workflow:
                     workflow_sequences.append((conv.timestamp, conv_workflow))
@@ -395,14 +538,12 @@ class LearningEngine:
             
             # Analyze common workflow patterns
             sequence_patterns = Counter()
-            for i in range(len(workflow_sequences) - 1):
-                current_phases = workflow_sequences[i][1]
-                next_phases = workflow_sequences[i + 1][1]
-                
-                for curr_phase in current_phases:
-                    for next_phase in next_phases:
-                        if curr_phase != next_phase:
-                            sequence_patterns[f"{curr_phase} -> {next_phase}"] += 1
+            for (_, current_phases), (_, next_phases) in zip(workflow_sequences, workflow_sequences[1:]):
+                sequence_patterns.update(
+                    f"{curr_phase} -> {next_phase}"
+                    for curr_phase, next_phase in product(current_phases, next_phases)
+                    if curr_phase != next_phase
+                )
             
             # Generate patterns for common sequences
             if sequence_patterns:
@@ -428,51 +569,52 @@ class LearningEngine:
             logger.error(f"Error detecting workflow patterns: {e}")
             return []
 
-    def _detect_resource_patterns(self, conversations: List[Conversation]) -> List[DetectedPattern]:
-        """Detect frequently accessed resource patterns."""
+    def _detect_resource_patterns(
+        self,
+        conversations: List[Conversation],
+        lowered: Optional[List[str]] = None
+    ) -> List[DetectedPattern]:
+        """
+        Detect frequently accessed resource patterns.
+        
+        Args:
+            conversations: Conversations to analyze
+            lowered: Lowercased content of each conversation, computed here
+                if not supplied
+        """
         patterns = []
         
         try:
             # Extract URLs, file paths, and documentation references
             resource_mentions = Counter()
-            resource_contexts = defaultdict(list)
             
-            for conv in conversations:
+            if lowered is None:
+                lowered = [conv.content.lower() for conv in conversations]
+            
+            find_urls = _URL_RE.findall
+            find_file_paths = _FILE_PATH_RE.findall
+            find_doc_keywords = self._doc_matcher.find_keys
+            for conv, content_lower in zip(conversations, lowered):
                 content = conv.content
                 
-                # Find URLs
-                urls = re.findall(r'https?://[^\s]+', content)
-                for url in urls:
-                    # Extract domain for pattern detection
-                    domain_match = re.search(r'https?://([^/]+)', url)
-                    if domain_match:
-                        domain = domain_match.group(1)
-                        resource_mentions[f"url:{domain}"] += 1
-                        resource_contexts[f"url:{domain}"].append(conv.id)
-                
-                # Find file paths
-                file_paths = re.findall(r'[./][\w/.-]+\.\w+', content)
-                for path in file_paths:
-                    extension = path.split('.')[-1].lower()
-                    resource_mentions[f"file_type:{extension}"] += 1
-                    resource_contexts[f"file_type:{extension}"].append(conv.id)
-                
-                # Find documentation keywords
-                doc_keywords = ['documentation', 'docs', 'readme', 'wiki', 'guide', 'tutorial']
-                for keyword in doc_keywords:
-                    if keyword.lower() in content.lower():
-                        resource_mentions[f"doc_type:{keyword}"] += 1
-                        resource_contexts[f"doc_type:{keyword}"].append(conv.id)
+                # URL domains, file extensions and documentation keywords,
+                # counted together in one Counter.update call
+                resource_mentions.update(chain(
+                    (f"url:{domain}" for domain in find_urls(content)),
+                    (f"file_type:{path.rpartition('.')[2].lower()}" for path in find_file_paths(content)),
+                    find_doc_keywords(content_lower)
+                ))
             
             # Generate patterns for frequently accessed resources
             for resource, count in resource_mentions.most_common(10):
                 if count >= 2:  # Lower threshold for testing
                     confidence = min(count / 5, 1.0)  # Cap at 1.0, lower denominator
+                    kind, _, value = resource.partition(':')
                     
                     patterns.append(DetectedPattern(
                         pattern_type=PatternType.RESOURCE_USAGE,
-                        pattern_key=resource.split(':', 1)[0],
-                        pattern_value=resource.split(':', 1)[1],
+                        pattern_key=kind,
+                        pattern_value=value,
                         confidence_score=confidence,
                         evidence_count=count,
                         first_seen=conversations[-1].timestamp,
@@ -508,20 +650,25 @@ class LearningEngine:
                 'context': feedback.context
             }
             
-            self.preferences_repo.set_value(
-                feedback_key,
-                feedback_data,
-                PreferenceCategory.LEARNING
-            )
+            # Writes for this feedback event, committed in one transaction
+            pending: List[Tuple[str, Any, PreferenceCategory]] = [
+                (feedback_key, feedback_data, PreferenceCategory.LEARNING)
+            ]
+            
+            # Feedback can change what is learned, so drop cached detections
+            self._pattern_cache.clear()
             
             # Process different types of feedback
             if feedback.feedback_type == FeedbackType.CORRECTION:
-                await self._process_correction_feedback(feedback)
+                pending.extend(self._process_correction_feedback(feedback))
             elif feedback.feedback_type == FeedbackType.PREFERENCE_UPDATE:
-                await self._process_preference_update(feedback)
+                pending.extend(self._process_preference_update(feedback))
             elif feedback.feedback_type in [FeedbackType.POSITIVE, FeedbackType.NEGATIVE]:
-                await self._process_rating_feedback(feedback)
-            elif feedback.feedback_type in [FeedbackType.STORAGE_APPROVAL, FeedbackType.STORAGE_REJECTION, FeedbackType.STORAGE_MODIFICATION]:
+                pending.extend(self._process_rating_feedback(feedback))
+            
+            self.preferences_repo.set_values(pending)
+            
+            if feedback.feedback_type in [FeedbackType.STORAGE_APPROVAL, FeedbackType.STORAGE_REJECTION, FeedbackType.STORAGE_MODIFICATION]:
                 await self._process_storage_feedback(feedback)
             
             logger.info(f"Processed {feedback.feedback_type.value} feedback for conversation {feedback.conversation_id}")
@@ -1040,11 +1187,11 @@ class LearningEngine:
                 'category_adjustments': {}
             }
 
-    async def _process_correction_feedback(self, feedback: UserFeedback) -> None:
-        """Process correction feedback to update patterns."""
+    def _process_correction_feedback(self, feedback: UserFeedback) -> List[Tuple[str, Any, PreferenceCategory]]:
+        """Process correction feedback to update patterns, returning the preference writes."""
         try:
             if not feedback.corrected_value or not feedback.original_suggestion:
-                return
+                return []
             
             # Update pattern confidence based on correction
             correction_key = f"correction:{feedback.suggestion_id or 'general'}"
@@ -1058,40 +1205,36 @@ class LearningEngine:
             }
             
             existing_corrections.append(correction_data)
-            self.preferences_repo.set_value(
-                correction_key,
-                existing_corrections,
-                PreferenceCategory.LEARNING
-            )
+            entries = [(correction_key, existing_corrections, PreferenceCategory.LEARNING)]
             
             # Learn from the correction pattern
-            await self._learn_from_correction(feedback)
+            entries.extend(self._learn_from_correction(feedback))
+            return entries
             
         except Exception as e:
             logger.error(f"Error processing correction feedback: {e}")
+            return []
 
-    async def _process_preference_update(self, feedback: UserFeedback) -> None:
-        """Process explicit preference updates."""
+    def _process_preference_update(self, feedback: UserFeedback) -> List[Tuple[str, Any, PreferenceCategory]]:
+        """Process explicit preference updates, returning the preference writes."""
         try:
             if not feedback.corrected_value:
-                return
+                return []
             
             # Extract preference from context
             preference_key = feedback.context.get('preference_key')
             if preference_key:
-                self.preferences_repo.set_value(
-                    preference_key,
-                    feedback.corrected_value,
-                    PreferenceCategory.GENERAL
-                )
-                
-                logger.info(f"Updated user preference {preference_key} to {feedback.corrected_value}")
+                logger.info(f"Updating user preference {preference_key} to {feedback.corrected_value}")
+                return [(preference_key, feedback.corrected_value, PreferenceCategory.GENERAL)]
+            
+            return []
             
         except Exception as e:
             logger.error(f"Error processing preference update: {e}")
+            return []
 
-    async def _process_rating_feedback(self, feedback: UserFeedback) -> None:
-        """Process positive/negative rating feedback."""
+    def _process_rating_feedback(self, feedback: UserFeedback) -> List[Tuple[str, Any, PreferenceCategory]]:
+        """Process positive/negative rating feedback, returning the preference writes."""
         try:
             # Update suggestion quality scores
             if feedback.suggestion_id:
@@ -1105,23 +1248,22 @@ class LearningEngine:
                 }
                 
                 existing_ratings.append(rating_data)
-                self.preferences_repo.set_value(
-                    rating_key,
-                    existing_ratings,
-                    PreferenceCategory.LEARNING
-                )
+                return [(rating_key, existing_ratings, PreferenceCategory.LEARNING)]
+            
+            return []
             
         except Exception as e:
             logger.error(f"Error processing rating feedback: {e}")
+            return []
 
-    async def _learn_from_correction(self, feedback: UserFeedback) -> None:
-        """Learn patterns from user corrections."""
+    def _learn_from_correction(self, feedback: UserFeedback) -> List[Tuple[str, Any, PreferenceCategory]]:
+        """Learn patterns from user corrections, returning the preference writes."""
         try:
             original = feedback.original_suggestion
             corrected = feedback.corrected_value
             
             if not original or not corrected:
-                return
+                return []
             
             # Analyze the type of correction
             correction_type = self._classify_correction(original, corrected)
@@ -1146,22 +1288,23 @@ class LearningEngine:
             
             existing_patterns[pattern_key]['last_seen'] = feedback.timestamp.isoformat()
             
-            self.preferences_repo.set_value(
-                learning_key,
-                existing_patterns,
-                PreferenceCategory.LEARNING
-            )
+            return [(learning_key, existing_patterns, PreferenceCategory.LEARNING)]
             
         except Exception as e:
             logger.error(f"Error learning from correction: {e}")
+            return []
 
     def _classify_correction(self, original: str, corrected: str) -> str:
         """Classify the type of correction made by the user."""
         try:
-            # Simple classification based on content analysis
-            if len(corrected) > len(original) * 1.5:
+            # Simple classification based on content analysis; the length
+            # ratios 1.5 and 0.5 are compared in integer arithmetic
+            original_len = len(original)
+            corrected_len = len(corrected)
+            
+            if corrected_len * 2 > original_len * 3:
                 return "expansion"
-            elif len(corrected) < len(original) * 0.5:
+            elif corrected_len * 2 < original_len:
                 return "simplification"
             elif original.lower() != corrected.lower():
                 return "rephrasing"
@@ -1332,6 +1475,8 @@ class LearningEngine:
                 if self.preferences_repo.delete(pref.key):
                     deleted_count += 1
             
+            self._pattern_cache.clear()
+            
             logger.info(f"Reset learning data: deleted {deleted_count} preferences")
             return True
             
@@ -4,10 +4,19 @@ Search engine that combines semantic and keyword search capabilities with gracef
 
 import asyncio
 import logging
+import json
+import operator
 import re
+import shutil
 import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple, Union
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
 
 # Add parent directory to path for imports
 import sys
@@ -34,6 +43,28 @@ except ImportError:
 logger = get_component_logger("search_engine")
 perf_logger = get_performance_logger()
 
+# Words of at least three characters; \w runs are maximal, so the length
+# bound drops short words inside the regex engine rather than in Python
+_WORD_RE = re.compile(r'\w{3,}')
+
+# Common words left out of the keyword index
+_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'will', 'with', 'i', 'you', 'we', 'they', 'this',
+    'but', 'or', 'not', 'have', 'had', 'do', 'does', 'did', 'can',
+    'could', 'should', 'would', 'may', 'might', 'must', 'shall',
+    'about', 'all', 'also', 'any', 'been', 'her', 'him', 'his',
+    'how', 'into', 'more', 'now', 'only', 'our', 'out', 'over',
+    'said', 'she', 'some', 'than', 'them', 'very', 'what', 'when',
+    'where', 'who', 'why', 'your'
+})
+
+# Weights of the semantic, keyword and recency scores in the combined score
+_SEMANTIC_WEIGHT = 0.6
+_KEYWORD_WEIGHT = 0.3
+_RECENCY_WEIGHT = 0.1
+
 
 class SearchResult:
     """Represents a search result with combined scoring."""
@@ -61,9 +92,9 @@ class SearchResult:
         if self._combined_score is None:
             # Weighted combination of different scores
             self._combined_score = (
-                0.6 * self.semantic_score +
-                0.3 * self.keyword_score +
-                0.1 * self.recency_score
+                _SEMANTIC_WEIGHT * self.semantic_score +
+                _KEYWORD_WEIGHT * self.keyword_score +
+                _RECENCY_WEIGHT * self.recency_score
             )
         return self._combined_score
     
@@ -82,9 +113,361 @@ class SearchResult:
         }
 
 
+def _parse_timestamp(value) -> float:
+    """Return a metadata timestamp as POSIX seconds, or NaN if missing or invalid."""
+    if not value:
+        return float("nan")
+    
+    try:
+        # Parse timestamp (assuming ISO format)
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return value.timestamp()
+    except (ValueError, TypeError, AttributeError, OverflowError, OSError):
+        return float("nan")
+
+
+def _recency_scores(timestamps: np.ndarray, now: float) -> np.ndarray:
+    """
+    Map POSIX timestamps to recency scores against a single ``now``.
+    
+    Recent content (0-7 days) gets a high score and older content lower
+    ones; missing timestamps (NaN) score 0.0.
+    """
+    days_ago = np.floor((now - timestamps) / 86400.0)
+    scores = np.select(
+        [days_ago <= 7, days_ago <= 30, days_ago <= 90],
+        [1.0, 0.7, 0.4],
+        default=0.1
+    )
+    return np.where(np.isnan(timestamps), 0.0, scores)
+
+
+# Metadata filter operators; each fails the filter when it holds
+_FILTER_OPERATORS = (
+    ("$gte", operator.lt),
+    ("$lte", operator.gt),
+    ("$eq", operator.ne),
+)
+
+def _compile_filters(filters: Dict) -> Callable[[Dict], bool]:
+    """
+    Compile metadata filters into a single predicate.
+    
+    The filter dict is walked once to build one ``(key, rejects)`` check per
+    condition, so matching a candidate does no isinstance dispatch or
+    operator lookups.
+    
+    Args:
+        filters: Metadata filters; a list value means "any of these values",
+            a dict value holds ``$gte``/``$lte``/``$eq`` operators, anything
+            else is compared for equality
+        
+    Returns:
+        Predicate returning True if metadata matches every filter
+    """
+    checks: List[Tuple[Any, Callable[[Any], bool]]] = []
+    for key, value in filters.items():
+        if isinstance(value, list):
+            checks.append((key, lambda meta_value, allowed=value: meta_value not in allowed))
+        elif isinstance(value, dict):
+            for name, rejects in _FILTER_OPERATORS:
+                if name in value:
+                    checks.append((key, lambda meta_value, bound=value[name], rejects=rejects: rejects(meta_value, bound)))
+        else:
+            checks.append((key, lambda meta_value, expected=value: meta_value != expected))
+    
+    # A filtered key must be present even if it has no conditions
+    keys = tuple(filters)
+    
+    def matches(metadata: Dict) -> bool:
+        for key in keys:
+            if key not in metadata:
+                return False
+        for key, rejects in checks:
+            if rejects(metadata[key]):
+                return False
+        return True
+    
+    return matches
+
+
+def _rank_results(results: List[SearchResult], limit: int) -> List[SearchResult]:
+    """
+    Return the ``limit`` best results by combined score, best first.
+    
+    The combined scores of the whole list are computed as one vectorized
+    expression over parallel score arrays and stored back on each result;
+    ties keep their original order, as a stable sort would. Only the
+    selected top ``limit`` scores are sorted.
+    """
+    if not results or limit <= 0:
+        return []
+    
+    count = len(results)
+    semantic = np.fromiter((r.semantic_score for r in results), dtype=np.float64, count=count)
+    keyword = np.fromiter((r.keyword_score for r in results), dtype=np.float64, count=count)
+    recency = np.fromiter((r.recency_score for r in results), dtype=np.float64, count=count)
+    combined = _SEMANTIC_WEIGHT * semantic + _KEYWORD_WEIGHT * keyword + _RECENCY_WEIGHT * recency
+    
+    for result, score in zip(results, combined.tolist()):
+        result._combined_score = score
+    
+    if count > limit:
+        # Partition around the limit-th best score, then take everything
+        # above it plus the earliest results tied with it
+        threshold = -np.partition(-combined, limit - 1)[limit - 1]
+        above = np.flatnonzero(combined > threshold)
+        tied = np.flatnonzero(combined == threshold)[:limit - len(above)]
+        selected = np.sort(np.concatenate([above, tied]))
+    else:
+        selected = np.arange(count)
+    
+    order = selected[np.argsort(-combined[selected], kind="stable")]
+    return [results[index] for index in order.tolist()]
+
+
+class _KeywordPostings:
+    """
+    Read-only CSR snapshot of the keyword index.
+    
+    Postings for every term are stored back to back in one contiguous
+    ``int64`` array, with ``indptr`` marking where each term's slice starts,
+    so scoring a query is a concatenation of a few slices and a handful of
+    array operations instead of a Python loop over sets.
+    
+    Documents are scored with BM25. Postings record presence only, so every
+    term frequency is 1 and a document's length is its number of distinct
+    keywords.
+    """
+    
+    # BM25 term frequency saturation and length normalization parameters
+    K1 = 1.2
+    B = 0.75
+    
+    def __init__(self, keyword_index: Dict[str, Set[int]], doc_terms: Dict[int, Tuple[str, ...]]):
+        self.term_to_id: Dict[str, int] = {}
+        lengths = np.empty(len(keyword_index), dtype=np.int64)
+        postings = []
+        for term_id, (term, doc_ids) in enumerate(keyword_index.items()):
+            self.term_to_id[term] = term_id
+            lengths[term_id] = len(doc_ids)
+            postings.extend(doc_ids)
+        
+        self.indptr = np.zeros(len(keyword_index) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        self.indices = np.array(postings, dtype=np.int64)
+        
+        # Document lengths, looked up by binary search over the sorted IDs
+        self.doc_ids = np.fromiter(doc_terms, dtype=np.int64, count=len(doc_terms))
+        self.doc_lengths = np.fromiter(
+            (len(terms) for terms in doc_terms.values()), dtype=np.float64, count=len(doc_terms)
+        )
+        order = np.argsort(self.doc_ids)
+        self.doc_ids = self.doc_ids[order]
+        self.doc_lengths = self.doc_lengths[order]
+        self.avg_doc_length = float(self.doc_lengths.mean()) if len(self.doc_lengths) else 1.0
+    
+    # Files holding a saved snapshot inside its directory
+    TERMS_FILE = "terms.json"
+    ARRAY_FILES = ("indptr", "indices", "doc_ids", "doc_lengths")
+    
+    @classmethod
+    def load(cls, directory: Path) -> Optional["_KeywordPostings"]:
+        """
+        Load a snapshot saved by ``save``, memory-mapping its arrays.
+        
+        Returns:
+            The snapshot, or None if ``directory`` holds no complete snapshot
+        """
+        terms_path = directory / cls.TERMS_FILE
+        array_paths = [directory / f"{name}.npy" for name in cls.ARRAY_FILES]
+        if not terms_path.exists() or not all(path.exists() for path in array_paths):
+            return None
+        
+        postings = cls.__new__(cls)
+        with open(terms_path, "r", encoding="utf-8") as f:
+            terms = json.load(f)
+        postings.term_to_id = {term: term_id for term_id, term in enumerate(terms)}
+        postings.indptr, postings.indices, postings.doc_ids, postings.doc_lengths = (
+            np.load(path, mmap_mode="r") for path in array_paths
+        )
+        postings.avg_doc_length = float(postings.doc_lengths.mean()) if len(postings.doc_lengths) else 1.0
+        return postings
+    
+    def save(self, directory: Path) -> None:
+        """Write the snapshot to ``directory`` as a term list and .npy arrays."""
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / self.TERMS_FILE, "w", encoding="utf-8") as f:
+            json.dump(list(self.term_to_id), f, ensure_ascii=False)
+        for name in self.ARRAY_FILES:
+            np.save(directory / f"{name}.npy", np.asarray(getattr(self, name)))
+    
+    def to_index(self) -> Tuple[Dict[str, Set[int]], Dict[int, Tuple[str, ...]]]:
+        """Rebuild the mutable keyword index and doc-to-terms map from the snapshot."""
+        keyword_index: Dict[str, Set[int]] = {}
+        doc_terms: Dict[int, List[str]] = {doc_id: [] for doc_id in self.doc_ids.tolist()}
+        indptr = self.indptr
+        for term, row in self.term_to_id.items():
+            doc_ids = self.indices[indptr[row]:indptr[row + 1]].tolist()
+            keyword_index[term] = set(doc_ids)
+            for doc_id in doc_ids:
+                doc_terms[doc_id].append(term)
+        return keyword_index, {doc_id: tuple(terms) for doc_id, terms in doc_terms.items()}
+    
+    def _idf(self, document_frequency: np.ndarray) -> np.ndarray:
+        """Return the BM25 inverse document frequency for each frequency."""
+        doc_count = len(self.doc_ids)
+        return np.log1p((doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
+    
+    def score(self, keywords: Set[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score documents against ``keywords`` with BM25.
+        
+        Scores are divided by the score of an average-length document that
+        contains every keyword, the sum of the keywords' IDFs, and capped at
+        1.0, so they stay in [0, 1] like the other score kinds. Keywords
+        missing from the index still count towards that sum, as unmatched
+        keywords lowered the old matched-fraction score.
+        
+        Returns:
+            Tuple of (internal IDs, scores) for documents matching at least
+            one keyword
+        """
+        empty = np.empty(0, dtype=np.int64)
+        rows = np.array(
+            [self.term_to_id[keyword] for keyword in keywords if keyword in self.term_to_id],
+            dtype=np.int64
+        )
+        if not len(rows):
+            return empty, np.empty(0, dtype=np.float64)
+        
+        k1, b = self.K1, self.B
+        indptr = self.indptr
+        document_frequency = indptr[rows + 1] - indptr[rows]
+        idf = self._idf(document_frequency)
+        
+        unknown_idf = self._idf(np.zeros(len(keywords) - len(rows)))
+        full_match_score = idf.sum() + unknown_idf.sum()
+        
+        postings = np.concatenate([self.indices[indptr[row]:indptr[row + 1]] for row in rows.tolist()])
+        doc_ids, inverse = np.unique(postings, return_inverse=True)
+        idf_sums = np.bincount(inverse, weights=np.repeat(idf, document_frequency), minlength=len(doc_ids))
+        
+        doc_lengths = self.doc_lengths[np.searchsorted(self.doc_ids, doc_ids)]
+        norms = 1 + k1 * (1 - b + b * doc_lengths / self.avg_doc_length)
+        scores = idf_sums * (k1 + 1) / norms / full_match_score
+        return doc_ids, np.minimum(scores, 1.0)
+
+
+class _ContentArena:
+    """
+    Document contents packed into one UTF-8 buffer.
+    
+    Each document is a row holding a start and end offset into a shared
+    ``bytearray``, so the store keeps one buffer and two flat offset arrays
+    instead of a ``str`` object per document. Contents are decoded only when
+    read. Replaced or removed rows become dead space that is reclaimed once
+    it outweighs the live contents.
+    """
+    
+    # Dead bytes below which compaction is not worth a buffer copy
+    COMPACT_MIN_BYTES = 1 << 20
+    
+    def __init__(self):
+        self._data = bytearray()
+        self._starts = array('q')
+        self._ends = array('q')
+        self._rows: Dict[int, int] = {}
+        self._dead_bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __setitem__(self, internal_id: int, content: str) -> None:
+        self.pop(internal_id)
+        encoded = content.encode('utf-8')
+        self._rows[internal_id] = len(self._starts)
+        self._starts.append(len(self._data))
+        self._data += encoded
+        self._ends.append(len(self._data))
+    
+    def update(self, items: Iterable[Tuple[int, str]]) -> None:
+        """Store several (internal_id, content) pairs."""
+        for internal_id, content in items:
+            self[internal_id] = content
+    
+    def get(self, internal_id: int, default: Optional[str] = None) -> Optional[str]:
+        """Return the decoded content of a document, or ``default``."""
+        row = self._rows.get(internal_id)
+        if row is None:
+            return default
+        return self._data[self._starts[row]:self._ends[row]].decode('utf-8')
+    
+    def pop(self, internal_id: int, default: Optional[str] = None) -> Optional[str]:
+        """Remove a document, returning its content or ``default``."""
+        content = self.get(internal_id, default)
+        row = self._rows.pop(internal_id, None)
+        if row is not None:
+            self._dead_bytes += self._ends[row] - self._starts[row]
+            if self._dead_bytes >= self.COMPACT_MIN_BYTES and self._dead_bytes * 2 > len(self._data):
+                self._compact()
+        return content
+    
+    def clear(self) -> None:
+        """Remove all documents."""
+        self.__init__()
+    
+    def save(self, directory: Path) -> None:
+        """Write the live contents to ``directory``, compacting first."""
+        self._compact()
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "contents.bin").write_bytes(self._data)
+        ids = np.fromiter(self._rows, dtype=np.int64, count=len(self._rows))
+        np.save(directory / "content_rows.npy", np.stack([ids, np.asarray(self._starts), np.asarray(self._ends)]))
+    
+    def load(self, directory: Path) -> bool:
+        """
+        Replace the contents with those saved by ``save``.
+        
+        Returns:
+            True if ``directory`` held saved contents
+        """
+        data_path = directory / "contents.bin"
+        rows_path = directory / "content_rows.npy"
+        if not data_path.exists() or not rows_path.exists():
+            return False
+        
+        ids, starts, ends = np.load(rows_path)
+        self.__init__()
+        self._data = bytearray(data_path.read_bytes())
+        self._starts = array('q', starts.tolist())
+        self._ends = array('q', ends.tolist())
+        self._rows = {internal_id: row for row, internal_id in enumerate(ids.tolist())}
+        return True
+    
+    def _compact(self) -> None:
+        """Copy the live rows into a fresh buffer, dropping dead space."""
+        data = bytearray()
+        starts = array('q')
+        ends = array('q')
+        rows = {}
+        for internal_id, row in self._rows.items():
+            rows[internal_id] = len(starts)
+            starts.append(len(data))
+            data += self._data[self._starts[row]:self._ends[row]]
+            ends.append(len(data))
+        
+        self._data, self._starts, self._ends, self._rows = data, starts, ends, rows
+        self._dead_bytes = 0
+
+
 class SearchEngine:
     """Search engine combining semantic and keyword search."""
     
+    # Most recent query embeddings kept to skip repeated model inference
+    QUERY_EMBEDDING_CACHE_SIZE = 1024
+    
     def __init__(
         self,
         embedding_service: Optional[EmbeddingService],
@@ -106,17 +489,68 @@ class SearchEngine:
         self.vector_store = vector_store
         self.storage_path = storage_path
         
-        # In-memory keyword index for fast text search
+        # In-memory keyword index for fast text search; the dict of sets
+        # takes incremental updates and a CSR snapshot of it, rebuilt lazily
+        # after changes, serves queries
         self._keyword_index: Dict[str, Set[int]] = {}
-        self._content_store: Dict[int, str] = {}
+        self._postings: Optional[_KeywordPostings] = None
+        # Keywords indexed for each document, so removal patches postings
+        # directly instead of re-tokenizing the content
+        self._doc_terms: Dict[int, Tuple[str, ...]] = {}
+        # Set when the postings snapshot was loaded from disk and the dict
+        # index has not been rebuilt from it yet; queries read the
+        # memory-mapped snapshot until the index is first modified
+        self._keyword_index_pending = False
+        self._content_store = _ContentArena()
+        # Parsed metadata timestamps (POSIX seconds, NaN if absent) so each
+        # document's timestamp string is parsed once, not on every search
+        self._doc_timestamps: Dict[int, float] = {}
+        # LRU of query embeddings keyed on (model name, query text)
+        self._query_embeddings: "OrderedDict[Tuple[Optional[str], str], List[float]]" = OrderedDict()
+        # Thread for tokenizing document batches off the event loop, started
+        # on first use and shut down in cleanup(); one worker suffices since
+        # tokenization holds the GIL
+        self._tokenize_pool: Optional[ThreadPoolExecutor] = None
         
     async def initialize(self) -> None:
         """Initialize the search engine."""
         if self.embedding_service is not None:
             await self.embedding_service.initialize()
         await self.vector_store.initialize()
+        self._load_keyword_index()
         logger.info("Search engine initialized")
     
+    @property
+    def _keyword_index_path(self) -> Optional[Path]:
+        """Directory holding the saved keyword index, if storage is configured."""
+        return Path(self.storage_path) / "keyword_index" if self.storage_path else None
+    
+    def _load_keyword_index(self) -> None:
+        """Load the saved keyword index and contents instead of re-tokenizing documents."""
+        directory = self._keyword_index_path
+        if directory is None or self._doc_terms or len(self._content_store):
+            return
+        
+        # A save interrupted between its two renames leaves the previous
+        # snapshot only under the retired name
+        retired = directory.with_name(directory.name + ".old")
+        if not directory.exists() and retired.exists():
+            directory = retired
+        
+        postings = _KeywordPostings.load(directory)
+        if postings is None or not self._content_store.load(directory):
+            return
+        
+        self._postings = postings
+        self._keyword_index_pending = True
+        logger.info(f"Loaded keyword index with {len(postings.term_to_id)} terms from {directory}")
+    
+    def _ensure_keyword_index(self) -> None:
+        """Rebuild the mutable keyword index from a loaded snapshot before modifying it."""
+        if self._keyword_index_pending:
+            self._keyword_index, self._doc_terms = self._postings.to_index()
+            self._keyword_index_pending = False
+    
     async def add_document(
         self,
         content: str,
@@ -147,9 +581,9 @@ class SearchEngine:
             internal_id = internal_ids[0]
         else:
             # For keyword-only mode, create a dummy embedding
-            dummy_embedding = [0.0] * self.vector_store.dimension
+            dummy_embedding = np.zeros((1, self.vector_store.dimension), dtype=np.float32)
             internal_ids = await self.vector_store.add_vectors(
-                [dummy_embedding],
+                dummy_embedding,
                 [metadata],
                 [document_id] if document_id else None
             )
@@ -179,12 +613,30 @@ class SearchEngine:
         Returns:
             List of internal IDs assigned to the documents
         """
-        # Generate embeddings in batch if service is available
-        if self.embedding_service is not None:
-            embeddings = await self.embedding_service.generate_embeddings(contents)
-        else:
-            # For keyword-only mode, create dummy embeddings
-            embeddings = [[0.0] * self.vector_store.dimension for _ in contents]
+        # Tokenize the batch on the engine's pool so the event loop stays
+        # free; only this coroutine writes the results into the index
+        if self._tokenize_pool is None:
+            self._tokenize_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="search-tokenize"
+            )
+        loop = asyncio.get_running_loop()
+        tokenize_future = loop.run_in_executor(
+            self._tokenize_pool, self._extract_keywords_batch, contents
+        )
+        
+        # Generate embeddings in batch if service is available, overlapping
+        # the tokenization
+        try:
+            if self.embedding_service is not None:
+                embeddings = await self.embedding_service.generate_embeddings(contents)
+            else:
+                # For keyword-only mode, create dummy embeddings as one zeroed
+                # float32 block instead of nested lists of Python floats
+                embeddings = np.zeros((len(contents), self.vector_store.dimension), dtype=np.float32)
+            doc_keywords = await tokenize_future
+        finally:
+            if not tokenize_future.done():
+                tokenize_future.cancel()
         
         # Add to vector store
         internal_ids = await self.vector_store.add_vectors(
@@ -194,15 +646,16 @@ class SearchEngine:
         )
         
         # Add to keyword index
-        for internal_id, content in zip(internal_ids, contents):
-            self._add_to_keyword_index(internal_id, content)
-            self._content_store[internal_id] = content
+        self._add_batch_to_keyword_index(internal_ids, doc_keywords)
+        self._content_store.update(zip(internal_ids, contents))
         
         logger.debug(f"Added {len(contents)} documents to search index")
         return internal_ids
     
     def _add_to_keyword_index(self, internal_id: int, content: str) -> None:
         """Add document to keyword index."""
+        self._ensure_keyword_index()
+        
         # Extract keywords (simple tokenization)
         keywords = self._extract_keywords(content)
         
@@ -210,30 +663,54 @@ class SearchEngine:
             if keyword not in self._keyword_index:
                 self._keyword_index[keyword] = set()
             self._keyword_index[keyword].add(internal_id)
+        
+        self._doc_terms[internal_id] = tuple(keywords)
+        self._postings = None
+    
+    def _add_batch_to_keyword_index(self, internal_ids: List[int], doc_keywords: List[Set[str]]) -> None:
+        """Add several tokenized documents to the keyword index, touching each term's postings once."""
+        self._ensure_keyword_index()
+        
+        # Group the batch's postings by term first, so each index set is
+        # looked up and extended once per term instead of once per document
+        batch_postings: Dict[str, List[int]] = {}
+        for internal_id, keywords in zip(internal_ids, doc_keywords):
+            self._doc_terms[internal_id] = tuple(keywords)
+            for keyword in keywords:
+                postings = batch_postings.get(keyword)
+                if postings is None:
+                    batch_postings[keyword] = [internal_id]
+                else:
+                    postings.append(internal_id)
+        
+        keyword_index = self._keyword_index
+        for keyword, postings in batch_postings.items():
+            doc_ids = keyword_index.get(keyword)
+            if doc_ids is None:
+                keyword_index[keyword] = set(postings)
+            else:
+                doc_ids.update(postings)
+        
+        self._postings = None
+    
+    def _get_postings(self) -> _KeywordPostings:
+        """Return the CSR snapshot of the keyword index, rebuilding it if stale."""
+        if self._postings is None:
+            self._postings = _KeywordPostings(self._keyword_index, self._doc_terms)
+        return self._postings
+    
+    def _extract_keywords_batch(self, texts: List[str]) -> List[Set[str]]:
+        """Extract keywords from each of several texts."""
+        extract = self._extract_keywords
+        return [extract(text) for text in texts]
     
     def _extract_keywords(self, text: str) -> Set[str]:
         """Extract keywords from text."""
         # Convert to lowercase and extract words
-        text = text.lower()
-        words = re.findall(r'\b\w+\b', text)
-        
-        # Filter out very short words and common stop words
-        stop_words = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'will', 'with', 'i', 'you', 'we', 'they', 'this',
-            'but', 'or', 'not', 'have', 'had', 'do', 'does', 'did', 'can',
-            'could', 'should', 'would', 'may', 'might', 'must', 'shall',
-            'about', 'all', 'also', 'any', 'been', 'her', 'him', 'his',
-            'how', 'into', 'more', 'now', 'only', 'our', 'out', 'over',
-            'said', 'she', 'some', 'than', 'them', 'very', 'what', 'when',
-            'where', 'who', 'why', 'your'
-        }
+        keywords = set(_WORD_RE.findall(text.lower()))
         
-        keywords = {
-            word for word in words
-            if len(word) >= 3 and word not in stop_words
-        }
+        # Filter out common stop words
+        keywords.difference_update(_STOP_WORDS)
         
         return keywords
     
@@ -261,7 +738,10 @@ class SearchEngine:
         
         try:
             if search_type == "semantic":
-                results = await self._semantic_search_with_fallback(query, limit, filters)
+                results = await self._try_semantic_search(query, limit, filters)
+                if results is None:
+                    logger.warning("Semantic search failed, falling back to keyword search")
+                    results = await self._keyword_search(query, limit, filters)
             elif search_type == "keyword":
                 results = await self._keyword_search(query, limit, filters)
             else:  # hybrid
@@ -292,18 +772,24 @@ class SearchEngine:
             
             return []
     
-    async def _semantic_search_with_fallback(
+    async def _try_semantic_search(
         self,
         query: str,
         limit: int,
         filters: Optional[Dict] = None
-    ) -> List[SearchResult]:
-        """Perform semantic search with fallback to keyword search."""
+    ) -> Optional[List[SearchResult]]:
+        """
+        Perform semantic search without raising.
+        
+        Returns:
+            Search results, or None if semantic search failed so the caller
+            can fall back to keyword results
+        """
         try:
             return await self._semantic_search(query, limit, filters)
         except Exception as e:
-            logger.warning(f"Semantic search failed, falling back to keyword search: {e}")
-            return await self._keyword_search(query, limit, filters)
+            logger.debug(f"Semantic search failed: {e}")
+            return None
 
     @retry_with_backoff(
         config=RetryConfig(max_attempts=2, base_delay=0.5),
@@ -322,35 +808,53 @@ class SearchEngine:
             
         with TimedOperation("semantic_search_embedding", logger):
             # Generate query embedding
-            query_embedding = await self.embedding_service.generate_embedding(query)
+            query_embedding = await self._get_query_embedding(query)
         
         with TimedOperation("semantic_search_vector_search", logger):
-            # Search vector store
+            # Search vector store; extra neighbours give the recency scores
+            # a pool to re-rank, and the store widens its scan as needed to
+            # find enough that pass the filters
             vector_results = await self.vector_store.search(
                 query_embedding,
-                k=limit * 2,  # Get more results to account for filtering
-                filters=filters
+                k=limit * 2,
+                filters=filters,
+                predicate=_compile_filters(filters) if filters else None
             )
         
         # Convert to SearchResult objects
         results = []
         for internal_id, similarity, metadata in vector_results:
             content = self._content_store.get(internal_id, "")
-            recency_score = self._calculate_recency_score(metadata)
             
             result = SearchResult(
                 internal_id=internal_id,
                 content=content,
                 metadata=metadata,
                 semantic_score=similarity,
-                keyword_score=0.0,
-                recency_score=recency_score
+                keyword_score=0.0
             )
             results.append(result)
         
+        self._apply_recency_scores(results)
+        
         # Sort by combined score and limit
-        results.sort(key=lambda x: x.combined_score, reverse=True)
-        return results[:limit]
+        return _rank_results(results, limit)
+    
+    async def _get_query_embedding(self, query: str) -> List[float]:
+        """Return the embedding for a query, reusing recently computed ones."""
+        cache = self._query_embeddings
+        key = (getattr(self.embedding_service, "model_name", None), query)
+        
+        embedding = cache.get(key)
+        if embedding is not None:
+            cache.move_to_end(key)
+            return embedding
+        
+        embedding = await self.embedding_service.generate_embedding(query)
+        cache[key] = embedding
+        if len(cache) > self.QUERY_EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+        return embedding
     
     async def _keyword_search(
         self,
@@ -365,43 +869,40 @@ class SearchEngine:
             return []
         
         # Find documents containing query keywords
-        candidate_docs: Dict[int, int] = {}  # internal_id -> keyword_count
+        doc_ids, keyword_scores = self._get_postings().score(query_keywords)
+        candidate_docs: Dict[int, float] = dict(zip(doc_ids.tolist(), keyword_scores.tolist()))  # internal_id -> keyword_score
+        
+        # Fetch metadata for all candidates in one call
+        candidate_ids = list(candidate_docs)
+        candidate_metadata = await self.vector_store.get_metadata_batch(candidate_ids)
         
-        for keyword in query_keywords:
-            if keyword in self._keyword_index:
-                for internal_id in self._keyword_index[keyword]:
-                    candidate_docs[internal_id] = candidate_docs.get(internal_id, 0) + 1
+        matches_filters = _compile_filters(filters) if filters else None
         
         # Score and filter results
         results = []
-        for internal_id, keyword_count in candidate_docs.items():
-            # Get metadata and apply filters
-            metadata = await self.vector_store.get_metadata(internal_id)
+        for internal_id, metadata in zip(candidate_ids, candidate_metadata):
+            # Apply filters
             if metadata is None:
                 continue
             
-            if filters and not self._matches_filters(metadata, filters):
+            if matches_filters is not None and not matches_filters(metadata):
                 continue
             
             content = self._content_store.get(internal_id, "")
             
-            # Calculate keyword score (normalized by query length)
-            keyword_score = keyword_count / len(query_keywords)
-            recency_score = self._calculate_recency_score(metadata)
-            
             result = SearchResult(
                 internal_id=internal_id,
                 content=content,
                 metadata=metadata,
                 semantic_score=0.0,
-                keyword_score=keyword_score,
-                recency_score=recency_score
+                keyword_score=candidate_docs[internal_id]
             )
             results.append(result)
         
+        self._apply_recency_scores(results)
+        
         # Sort by combined score and limit
-        results.sort(key=lambda x: x.combined_score, reverse=True)
-        return results[:limit]
+        return _rank_results(results, limit)
     
     async def _hybrid_search_with_fallback(
         self,
@@ -423,126 +924,74 @@ class SearchEngine:
         filters: Optional[Dict] = None
     ) -> List[SearchResult]:
         """Perform hybrid search combining semantic and keyword search."""
-        # Run both searches in parallel with error handling
-        semantic_task = asyncio.create_task(
-            self._semantic_search_safe(query, limit * 2, filters)
-        )
-        keyword_task = asyncio.create_task(
-            self._keyword_search(query, limit * 2, filters)
+        # Start the semantic leg, which waits on embedding generation, and
+        # run the in-memory keyword leg on this coroutine meanwhile
+        semantic_task = asyncio.ensure_future(
+            self._try_semantic_search(query, limit * 2, filters)
         )
+        keyword_error: Optional[Exception] = None
         
         try:
-            semantic_results, keyword_results = await asyncio.gather(
-                semantic_task, keyword_task, return_exceptions=True
-            )
-            
-            # Handle exceptions from parallel tasks
-            if isinstance(semantic_results, Exception):
-                logger.warning(f"Semantic search failed in hybrid mode: {semantic_results}")
-                semantic_results = []
-            
-            if isinstance(keyword_results, Exception):
-                logger.warning(f"Keyword search failed in hybrid mode: {keyword_results}")
+            try:
+                keyword_results = await self._keyword_search(query, limit * 2, filters)
+            except Exception as e:
+                logger.warning(f"Keyword search failed in hybrid mode: {e}")
+                keyword_error = e
                 keyword_results = []
             
-            # If both failed, raise an exception
-            if not semantic_results and not keyword_results:
-                raise ServiceDegradedError("Both semantic and keyword search failed")
-            
-        except Exception as e:
-            logger.error(f"Hybrid search parallel execution failed: {e}")
-            # Fallback to sequential execution
-            semantic_results = await self._semantic_search_safe(query, limit * 2, filters)
-            keyword_results = await self._keyword_search(query, limit * 2, filters)
-        
-        # Combine results
-        combined_results: Dict[int, SearchResult] = {}
-        
-        # Add semantic results
-        for result in semantic_results or []:
-            combined_results[result.internal_id] = result
-        
-        # Merge keyword results
-        for result in keyword_results or []:
-            if result.internal_id in combined_results:
-                # Update existing result with keyword score
-                existing = combined_results[result.internal_id]
+            semantic_results = await semantic_task or []
+        finally:
+            if not semantic_task.done():
+                semantic_task.cancel()
+        
+        if not semantic_results and not keyword_results:
+            # Semantic failures are already absorbed as empty results, so
+            # only a keyword failure makes this a degraded search rather
+            # than one with no matches
+            if keyword_error is not None:
+                raise ServiceDegradedError("Both semantic and keyword search failed") from keyword_error
+            return []
+        
+        # Combine results; a document found by both legs keeps its semantic
+        # result and takes the keyword score. _rank_results recomputes every
+        # combined score, so merged results need no cache reset.
+        combined_results: Dict[int, SearchResult] = {
+            result.internal_id: result for result in semantic_results
+        }
+        for result in keyword_results:
+            existing = combined_results.setdefault(result.internal_id, result)
+            if existing is not result:
                 existing.keyword_score = result.keyword_score
-                existing._combined_score = None  # Reset to recalculate
-            else:
-                # Add new result
-                combined_results[result.internal_id] = result
         
         # Sort by combined score and limit
-        final_results = list(combined_results.values())
-        final_results.sort(key=lambda x: x.combined_score, reverse=True)
-        return final_results[:limit]
-    
-    async def _semantic_search_safe(
-        self,
-        query: str,
-        limit: int,
-        filters: Optional[Dict] = None
-    ) -> List[SearchResult]:
-        """Safe semantic search that returns empty list on failure."""
-        try:
-            return await self._semantic_search(query, limit, filters)
-        except Exception as e:
-            logger.debug(f"Semantic search failed safely: {e}")
-            return []
+        return _rank_results(list(combined_results.values()), limit)
     
     def _calculate_recency_score(self, metadata: Dict) -> float:
         """Calculate recency score based on timestamp."""
-        timestamp_str = metadata.get("timestamp")
-        if not timestamp_str:
-            return 0.0
+        timestamps = np.array([_parse_timestamp(metadata.get("timestamp"))])
+        return float(_recency_scores(timestamps, time.time())[0])
+    
+    def _apply_recency_scores(self, results: List[SearchResult]) -> None:
+        """Set the recency score of every result against one clock reading."""
+        if not results:
+            return
         
-        try:
-            # Parse timestamp (assuming ISO format)
-            if isinstance(timestamp_str, str):
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            else:
-                timestamp = timestamp_str
-            
-            # Calculate days since timestamp
-            days_ago = (datetime.now(timestamp.tzinfo) - timestamp).days
-            
-            # Exponential decay: score decreases as content gets older
-            # Recent content (0-7 days) gets high score, older content gets lower
-            if days_ago <= 7:
-                return 1.0
-            elif days_ago <= 30:
-                return 0.7
-            elif days_ago <= 90:
-                return 0.4
-            else:
-                return 0.1
-        except (ValueError, TypeError):
-            return 0.0
+        doc_timestamps = self._doc_timestamps
+        timestamps = np.empty(len(results), dtype=np.float64)
+        for index, result in enumerate(results):
+            timestamp = doc_timestamps.get(result.internal_id)
+            if timestamp is None:
+                timestamp = _parse_timestamp(result.metadata.get("timestamp"))
+                doc_timestamps[result.internal_id] = timestamp
+            timestamps[index] = timestamp
+        
+        scores = _recency_scores(timestamps, time.time())
+        for result, score in zip(results, scores.tolist()):
+            result.recency_score = score
     
     def _matches_filters(self, metadata: Dict, filters: Dict) -> bool:
         """Check if metadata matches the given filters."""
-        for key, value in filters.items():
-            if key not in metadata:
-                return False
-            
-            meta_value = metadata[key]
-            
-            if isinstance(value, list):
-                if meta_value not in value:
-                    return False
-            elif isinstance(value, dict):
-                if "$gte" in value and meta_value < value["$gte"]:
-                    return False
-                if "$lte" in value and meta_value > value["$lte"]:
-                    return False
-                if "$eq" in value and meta_value != value["$eq"]:
-                    return False
-            else:
-                if meta_value != value:
-                    return False
-        
-        return True
+        return _compile_filters(filters)(metadata)
     
     async def remove_document(self, internal_id: int) -> None:
         """Remove a document from the search index."""
@@ -550,17 +999,20 @@ class SearchEngine:
         await self.vector_store.remove_vectors([internal_id])
         
         # Remove from keyword index
-        content = self._content_store.get(internal_id, "")
-        if content:
-            keywords = self._extract_keywords(content)
-            for keyword in keywords:
-                if keyword in self._keyword_index:
-                    self._keyword_index[keyword].discard(internal_id)
-                    if not self._keyword_index[keyword]:
-                        del self._keyword_index[keyword]
+        self._ensure_keyword_index()
+        keywords = self._doc_terms.pop(internal_id, ())
+        for keyword in keywords:
+            doc_ids = self._keyword_index.get(keyword)
+            if doc_ids is not None:
+                doc_ids.discard(internal_id)
+                if not doc_ids:
+                    del self._keyword_index[keyword]
+        if keywords:
+            self._postings = None
         
         # Remove from content store
         self._content_store.pop(internal_id, None)
+        self._doc_timestamps.pop(internal_id, None)
         
         logger.debug(f"Removed document {internal_id} from search index")
     
@@ -585,6 +1037,25 @@ class SearchEngine:
     async def save(self) -> None:
         """Save the search index to disk."""
         await self.vector_store.save()
+        
+        directory = self._keyword_index_path
+        if directory is not None:
+            # Write the whole snapshot to the side and swap the directory in,
+            # so a reader never sees files from two different saves. The
+            # current snapshot may be memory-mapped from the retired files,
+            # which stay readable after they are unlinked.
+            staging = directory.with_name(directory.name + ".tmp")
+            retired = directory.with_name(directory.name + ".old")
+            shutil.rmtree(staging, ignore_errors=True)
+            self._get_postings().save(staging)
+            self._content_store.save(staging)
+            
+            shutil.rmtree(retired, ignore_errors=True)
+            if directory.exists():
+                directory.rename(retired)
+            staging.rename(directory)
+            shutil.rmtree(retired, ignore_errors=True)
+        
         logger.info("Search engine saved")
     
     async def cleanup(self) -> None:
@@ -594,6 +1065,15 @@ class SearchEngine:
             await self.embedding_service.cleanup()
         
         self._keyword_index.clear()
+        self._doc_terms.clear()
+        self._keyword_index_pending = False
+        self._postings = None
         self._content_store.clear()
+        self._doc_timestamps.clear()
+        self._query_embeddings.clear()
+        
+        if self._tokenize_pool is not None:
+            self._tokenize_pool.shutdown(wait=True)
+            self._tokenize_pool = None
         
         logger.info("Search engine cleaned up")
\ No newline at end of file
@@ -6,7 +6,7 @@ import asyncio
 import logging
 import pickle
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import faiss
 import numpy as np
@@ -17,6 +17,11 @@ logger = logging.getLogger(__name__)
 class VectorStore:
     """FAISS-based vector store for similarity search."""
     
+    # Most candidates a filtered search considers while widening to find
+    # enough matches; very selective filters return fewer results instead
+    # of scanning the whole index on every query
+    MAX_FILTERED_SEARCH_K = 4096
+    
     def __init__(
         self,
         dimension: int,
@@ -37,6 +42,8 @@ class VectorStore:
         
         self._index: Optional[faiss.Index] = None
         self._id_to_metadata: Dict[int, Dict] = {}
+        # FAISS row (vector_index) to internal ID, for mapping search hits
+        self._vector_index_to_id: Dict[int, int] = {}
         self._next_id = 0
         self._is_trained = False
         
@@ -110,11 +117,13 @@ class VectorStore:
         internal_ids = []
         for i, meta in enumerate(metadata):
             internal_id = self._next_id
+            vector_index = self._index.ntotal - len(vectors) + i
             self._id_to_metadata[internal_id] = {
                 **meta,
                 "external_id": ids[i] if ids else None,
-                "vector_index": self._index.ntotal - len(vectors) + i
+                "vector_index": vector_index
             }
+            self._vector_index_to_id[vector_index] = internal_id
             internal_ids.append(internal_id)
             self._next_id += 1
         
@@ -125,7 +134,8 @@ class VectorStore:
         self,
         query_vector: Union[List[float], np.ndarray],
         k: int = 10,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        predicate: Optional[Callable[[Dict], bool]] = None
     ) -> List[Tuple[int, float, Dict]]:
         """
         Search for similar vectors.
@@ -134,6 +144,8 @@ class VectorStore:
             query_vector: Query vector
             k: Number of results to return
             filters: Optional filters to apply to metadata
+            predicate: Optional precompiled metadata check, used instead of
+                evaluating ``filters`` for every candidate
             
         Returns:
             List of tuples (internal_id, similarity_score, metadata)
@@ -152,44 +164,56 @@ class VectorStore:
         
         faiss.normalize_L2(query_vector)
         
-        # Perform search
-        search_k = min(k * 2, self._index.ntotal)  # Search more to account for filtering
-        loop = asyncio.get_event_loop()
-        similarities, indices = await loop.run_in_executor(
-            None, self._index.search, query_vector, search_k
-        )
-        
-        # Convert results and apply filters
+        # Search more than k to account for filtering; when filters reject
+        # too many candidates, widen the search until k matches are found or
+        # MAX_FILTERED_SEARCH_K candidates have been considered
+        filtering = predicate is not None or bool(filters)
+        search_k = min(k * 2, self._index.ntotal)
+        max_search_k = min(max(search_k, self.MAX_FILTERED_SEARCH_K), self._index.ntotal)
+        vector_index_to_id = self._vector_index_to_id
+        scanned = 0
         results = []
-        for i, (similarity, vector_idx) in enumerate(zip(similarities[0], indices[0])):
-            if vector_idx == -1:  # FAISS returns -1 for invalid results
-                continue
+        seen = set()
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            similarities, indices = await loop.run_in_executor(
+                None, self._index.search, query_vector, search_k
+            )
+            
+            # Convert results and apply filters, skipping the candidates
+            # already considered by a narrower pass
+            for similarity, vector_idx in zip(similarities[0][scanned:], indices[0][scanned:]):
+                if vector_idx == -1:  # FAISS returns -1 for invalid results
+                    continue
+                    
+                # Find internal ID by vector index
+                internal_id = vector_index_to_id.get(int(vector_idx))
+                if internal_id is None or internal_id in seen:
+                    continue
+                seen.add(internal_id)
+                metadata = self._id_to_metadata[internal_id].copy()
+                
+                # Apply filters
+                if predicate is not None:
+                    if not predicate(metadata):
+                        continue
+                elif filters and not self._matches_filters(metadata, filters):
+                    continue
                 
-            # Find internal ID by vector index
-            internal_id = None
-            metadata = None
-            for iid, meta in self._id_to_metadata.items():
-                if meta.get("vector_index") == vector_idx:
-                    internal_id = iid
-                    metadata = meta.copy()
+                # Remove internal fields from metadata
+                metadata.pop("vector_index", None)
+                
+                results.append((internal_id, float(similarity), metadata))
+                
+                if len(results) >= k:
                     break
             
-            if internal_id is None or metadata is None:
-                continue
-            
-            # Apply filters
-            if filters and not self._matches_filters(metadata, filters):
-                continue
+            if len(results) >= k or not filtering or search_k >= max_search_k:
+                return results
             
-            # Remove internal fields from metadata
-            metadata.pop("vector_index", None)
-            
-            results.append((internal_id, float(similarity), metadata))
-            
-            if len(results) >= k:
-                break
-        
-        return results
+            scanned = search_k
+            search_k = min(search_k * 4, max_search_k)
     
     def _matches_filters(self, metadata: Dict, filters: Dict) -> bool:
         """Check if metadata matches the given filters."""
@@ -239,6 +263,28 @@ class VectorStore:
             return result
         return None
     
+    async def get_metadata_batch(self, internal_ids: List[int]) -> List[Optional[Dict]]:
+        """
+        Get metadata for several vectors in one call.
+        
+        Args:
+            internal_ids: Internal IDs to look up
+            
+        Returns:
+            Metadata for each ID in order, None for unknown or deleted IDs
+        """
+        id_to_metadata = self._id_to_metadata
+        results = []
+        for internal_id in internal_ids:
+            metadata = id_to_metadata.get(internal_id)
+            if metadata and not metadata.get("deleted", False):
+                result = metadata.copy()
+                result.pop("vector_index", None)
+                results.append(result)
+            else:
+                results.append(None)
+        return results
+    
     async def save(self) -> None:
         """Save the index and metadata to disk."""
         if not self.storage_path or self._index is None:
@@ -286,6 +332,10 @@ class VectorStore:
             metadata = pickle.load(f)
         
         self._id_to_metadata = metadata["id_to_metadata"]
+        self._vector_index_to_id = {
+            meta["vector_index"]: internal_id
+            for internal_id, meta in self._id_to_metadata.items()
+        }
         self._next_id = metadata["next_id"]
         self._is_trained = metadata["is_trained"]
         
@@ -313,5 +363,6 @@ class VectorStore:
         
         self._index = None
         self._id_to_metadata.clear()
+        self._vector_index_to_id.clear()
         self._next_id = 0
         self._is_trained = False
\ No newline at end of file
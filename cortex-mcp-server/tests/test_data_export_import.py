@@ -0,0 +1,70 @@
+"""
+Tests for the data export/import service.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from config.database import DatabaseConfig, DatabaseManager
+from services.data_export_import import DataExportImportService
+
+
+@pytest.fixture
+def service(temp_database):
+    """Create a data export/import service over an empty database."""
+    db_manager = DatabaseManager(DatabaseConfig(database_path=temp_database))
+    db_manager.initialize_database()
+    try:
+        yield DataExportImportService(db_manager)
+    finally:
+        db_manager.close()
+
+
+def _conversation(conversation_id, tool_name="claude"):
+    """Build an exported conversation row."""
+    return {
+        "id": conversation_id,
+        "tool_name": tool_name,
+        "project_id": None,
+        "timestamp": "2024-01-01T12:00:00",
+        "content": f"Content of {conversation_id}",
+        "conversation_metadata": None,
+        "tags": []
+    }
+
+
+def test_get_data_statistics_served_from_cache(service):
+    """Repeated statistics calls reuse the cache without sharing its contents."""
+    first = service.get_data_statistics(exact=False)
+    first["conversations"]["total"] = -1
+
+    second = service.get_data_statistics(exact=False)
+    third = service.get_data_statistics(exact=False)
+
+    assert second["conversations"]["total"] == 0
+    assert second == third
+    assert second is not third
+    assert second["timestamp"] == first["timestamp"]
+
+
+def test_import_counts_only_bad_rows_as_errors(service, temp_directory):
+    """A repeated ID is skipped and an invalid row fails alone, not its whole batch."""
+    import_path = Path(temp_directory) / "export.json"
+    import_path.write_text(json.dumps({
+        "metadata": {"format_version": service.export_format_version},
+        "conversations": [
+            _conversation("conv-1"),
+            _conversation("conv-1"),
+            _conversation("conv-2", tool_name=None),
+            _conversation("conv-3")
+        ],
+        "projects": [],
+        "preferences": [],
+        "context_links": []
+    }))
+
+    results = service.import_data(str(import_path))
+
+    assert results["results"]["conversations"] == {"imported": 2, "skipped": 1, "errors": 1}
@@ -0,0 +1,70 @@
+"""
+Tests for the encryption service.
+"""
+
+import base64
+
+import pytest
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+from services.encryption_service import DEFAULT_KDF_PARAMS, EncryptionService
+
+PASSPHRASE = "correct horse battery staple"
+SALT = b"\x01" * 32
+
+
+@pytest.fixture
+def service():
+    """Create an encryption service initialized with a fixed salt."""
+    encryption_service = EncryptionService(PASSPHRASE)
+    encryption_service.initialize(SALT)
+    try:
+        yield encryption_service
+    finally:
+        encryption_service.cleanup()
+
+
+def _legacy_fernet() -> Fernet:
+    """Build the Fernet cipher older releases derived from PASSPHRASE and SALT."""
+    key = Scrypt(length=32, salt=SALT, **DEFAULT_KDF_PARAMS).derive(PASSPHRASE.encode("utf-8"))
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+class _Unprintable:
+    """Value whose string conversion fails."""
+
+    def __str__(self):
+        raise TypeError("cannot convert to string")
+
+
+def test_aesgcm_values_round_trip(service):
+    """Values are written with the v2 AES-GCM prefix and decrypt to the original text."""
+    encrypted = service.encrypt("sensitive: ünïcode")
+    batch = service.encrypt_many(["first", "second"])
+
+    assert encrypted.startswith("v2:")
+    assert all(value.startswith("v2:") for value in batch)
+    assert service.decrypt(encrypted) == "sensitive: ünïcode"
+    assert [service.decrypt(value) for value in batch] == ["first", "second"]
+
+
+def test_legacy_fernet_tokens_still_decrypt(service):
+    """Fernet tokens from older releases decrypt, with or without the extra base64 layer."""
+    token = _legacy_fernet().encrypt("legacy value".encode("utf-8"))
+
+    assert service.decrypt(token.decode("ascii")) == "legacy value"
+    assert service.decrypt(base64.b64encode(token).decode("ascii")) == "legacy value"
+
+
+def test_encrypt_dict_keeps_failed_fields_only(service):
+    """A field that cannot be encrypted keeps its value without affecting the others."""
+    unprintable = _Unprintable()
+    data = {"content": "secret", "metadata": unprintable, "title": None, "id": "conv-1"}
+
+    encrypted = service.encrypt_dict(data, ["content", "metadata", "title"])
+
+    assert encrypted["metadata"] is unprintable
+    assert encrypted["title"] is None
+    assert encrypted["id"] == "conv-1"
+    assert service.decrypt(encrypted["content"]) == "secret"
@@ -6,6 +6,7 @@ and repair utilities to ensure data consistency and reliability.
 """
 
 import asyncio
+import json
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
@@ -74,6 +75,150 @@ class IntegrityCheckResult:
         return [issue for issue in self.issues_found if issue.auto_fixable]
 
 
+# Required fields checked for NULLs, with the violation description
+_REQUIRED_FIELDS = {
+    ("conversations", "id"): "Conversation ID cannot be NULL",
+    ("conversations", "tool_name"): "Tool name cannot be NULL",
+    ("conversations", "content"): "Content cannot be NULL",
+    ("projects", "id"): "Project ID cannot be NULL",
+    ("projects", "name"): "Project name cannot be NULL",
+    ("preferences", "key"): "Preference key cannot be NULL",
+    ("preferences", "value"): "Preference value cannot be NULL",
+}
+
+
+# Single round-trip for the anomaly checks: every CTE selects offending
+# rows (or, for required fields, one NULL count per table scan), and the
+# union tags each with the kind of issue it represents
+_ANOMALY_QUERY = text("""
+    WITH orphaned_conversations AS (
+        SELECT c.id, c.project_id
+        FROM conversations c
+        LEFT JOIN projects p ON c.project_id = p.id
+        WHERE c.project_id IS NOT NULL AND p.id IS NULL
+    ),
+    orphaned_sources AS (
+        SELECT cl.id, cl.source_conversation_id
+        FROM context_links cl
+        LEFT JOIN conversations c ON cl.source_conversation_id = c.id
+        WHERE c.id IS NULL
+    ),
+    orphaned_targets AS (
+        SELECT cl.id, cl.target_conversation_id
+        FROM context_links cl
+        LEFT JOIN conversations c ON cl.target_conversation_id = c.id
+        WHERE c.id IS NULL
+    ),
+    empty_projects AS (
+        SELECT p.id, p.name, p.created_at
+        FROM projects p
+        LEFT JOIN conversations c ON p.id = c.project_id
+        WHERE c.id IS NULL
+        AND p.created_at < datetime('now', '-1 day')
+    ),
+    empty_content AS (
+        SELECT id FROM conversations WHERE content = '' OR LENGTH(TRIM(content)) = 0
+    ),
+    empty_names AS (
+        SELECT id FROM projects WHERE name = '' OR LENGTH(TRIM(name)) = 0
+    ),
+    future_timestamps AS (
+        SELECT id, timestamp FROM conversations WHERE timestamp > :future_cutoff
+    ),
+    old_timestamps AS (
+        SELECT id, timestamp FROM conversations WHERE timestamp < :old_cutoff
+    ),
+    long_content AS (
+        SELECT id, LENGTH(content) AS content_length
+        FROM conversations
+        WHERE LENGTH(content) > 1000000  -- 1MB
+    ),
+    conversation_nulls AS (
+        SELECT SUM(id IS NULL) AS id, SUM(tool_name IS NULL) AS tool_name,
+               SUM(content IS NULL) AS content
+        FROM conversations
+    ),
+    project_nulls AS (
+        SELECT SUM(id IS NULL) AS id, SUM(name IS NULL) AS name FROM projects
+    ),
+    preference_nulls AS (
+        SELECT SUM(key IS NULL) AS key, SUM(value IS NULL) AS value FROM preferences
+    )
+    SELECT 'orphaned_conversation' AS kind, id AS record_id, project_id AS detail, NULL AS extra
+    FROM orphaned_conversations
+    UNION ALL SELECT 'orphaned_source', id, source_conversation_id, NULL FROM orphaned_sources
+    UNION ALL SELECT 'orphaned_target', id, target_conversation_id, NULL FROM orphaned_targets
+    UNION ALL SELECT 'empty_project', id, name, created_at FROM empty_projects
+    UNION ALL SELECT 'empty_content', id, NULL, NULL FROM empty_content
+    UNION ALL SELECT 'empty_name', id, NULL, NULL FROM empty_names
+    UNION ALL SELECT 'future_timestamp', id, timestamp, NULL FROM future_timestamps
+    UNION ALL SELECT 'old_timestamp', id, timestamp, NULL FROM old_timestamps
+    UNION ALL SELECT 'long_content', id, content_length, NULL FROM long_content
+    UNION ALL SELECT 'null_field', 'conversations.id', id, NULL FROM conversation_nulls
+    UNION ALL SELECT 'null_field', 'conversations.tool_name', tool_name, NULL FROM conversation_nulls
+    UNION ALL SELECT 'null_field', 'conversations.content', content, NULL FROM conversation_nulls
+    UNION ALL SELECT 'null_field', 'projects.id', id, NULL FROM project_nulls
+    UNION ALL SELECT 'null_field', 'projects.name', name, NULL FROM project_nulls
+    UNION ALL SELECT 'null_field', 'preferences.key', key, NULL FROM preference_nulls
+    UNION ALL SELECT 'null_field', 'preferences.value', value, NULL FROM preference_nulls
+""")
+
+# Issue construction for each anomaly kind: (issue type, table, severity,
+# auto-fixable, fix suggestion, description template over detail/extra)
+_ANOMALY_KINDS = {
+    "orphaned_conversation": (
+        IntegrityIssueType.ORPHANED_RECORD, "conversations", "medium", True,
+        "Set project_id to NULL or create missing project",
+        "Conversation references non-existent project: {detail}"
+    ),
+    "orphaned_source": (
+        IntegrityIssueType.ORPHANED_RECORD, "context_links", "high", True,
+        "Delete orphaned context link",
+        "Context link references non-existent source conversation: {detail}"
+    ),
+    "orphaned_target": (
+        IntegrityIssueType.ORPHANED_RECORD, "context_links", "high", True,
+        "Delete orphaned context link",
+        "Context link references non-existent target conversation: {detail}"
+    ),
+    "empty_project": (
+        IntegrityIssueType.MISSING_REFERENCE, "projects", "low", False,
+        "Review if project should be deleted or if conversations are missing",
+        "Project '{detail}' has no conversations despite being created {extra}"
+    ),
+    "empty_content": (
+        IntegrityIssueType.INVALID_DATA, "conversations", "medium", True,
+        "Delete conversation with empty content",
+        "Conversation has empty content"
+    ),
+    "empty_name": (
+        IntegrityIssueType.INVALID_DATA, "projects", "high", False,
+        "Provide a valid name for the project",
+        "Project has empty name"
+    ),
+    "future_timestamp": (
+        IntegrityIssueType.INVALID_DATA, "conversations", "medium", True,
+        "Update timestamp to current time",
+        "Conversation has future timestamp: {detail}"
+    ),
+    "old_timestamp": (
+        IntegrityIssueType.INVALID_DATA, "conversations", "low", False,
+        "Review timestamp validity",
+        "Conversation has suspiciously old timestamp: {detail}"
+    ),
+    "long_content": (
+        IntegrityIssueType.INVALID_DATA, "conversations", "low", False,
+        "Review if content length is appropriate",
+        "Conversation has extremely long content: {detail} characters"
+    ),
+}
+
+# Number of separate checks answered by the anomaly query: orphaned
+# conversations, orphaned context links, empty projects, required fields,
+# data consistency, timestamps and text fields
+_ANOMALY_CHECK_COUNT = 7
+
+
 class DatabaseIntegrityChecker:
     """Comprehensive database integrity checker."""
     
@@ -103,33 +248,17 @@ class DatabaseIntegrityChecker:
         
         # List of all integrity checks to run
         checks = [
-            self._check_orphaned_conversations,
-            self._check_orphaned_context_links,
-            self._check_missing_project_references,
+            self._check_record_anomalies,
             self._check_invalid_json_metadata,
             self._check_duplicate_conversations,
-            self._check_constraint_violations,
-            self._check_data_consistency,
-            self._check_foreign_key_integrity,
-            self._check_timestamp_validity,
-            self._check_text_field_integrity
+            self._check_foreign_key_integrity
         ]
         
-        # Run all checks
-        for check in checks:
-            try:
-                with TimedOperation(f"integrity_check_{check.__name__}", logger):
-                    await check()
-            except Exception as e:
-                logger.error(f"Integrity check {check.__name__} failed: {e}")
-                self.issues_found.append(IntegrityIssue(
-                    issue_type=IntegrityIssueType.CORRUPTED_JSON,
-                    table_name="system",
-                    record_id="check_failure",
-                    description=f"Integrity check {check.__name__} failed: {str(e)}",
-                    severity="high",
-                    auto_fixable=False
-                ))
+        # Run all checks concurrently; each uses its own pooled session and
+        # returns its issues, which are collected once all have finished
+        results = await asyncio.gather(*(self._run_check(check) for check in checks))
+        for issues in results:
+            self.issues_found.extend(issues)
         
         duration = time.time() - start_time
         
@@ -155,140 +284,103 @@ class DatabaseIntegrityChecker:
         logger.info(f"Integrity check completed in {duration:.2f}s - Found {len(self.issues_found)} issues")
         return result
     
-    async def _check_orphaned_conversations(self) -> None:
-        """Check for conversations with invalid project references."""
-        self.checks_run += 1
+    async def _run_check(self, check) -> List[IntegrityIssue]:
+        """
+        Run a single integrity check, reporting its failure as an issue.
         
+        Args:
+            check: Bound ``_check_*`` coroutine method to run
+            
+        Returns:
+            List[IntegrityIssue]: Issues found by the check
+        """
         try:
-            async with self.db_manager.get_async_session() as session:
-                # Find conversations with project_id that doesn't exist in projects table
-                query = text("""
-                    SELECT c.id, c.project_id 
-                    FROM conversations c 
-                    LEFT JOIN projects p ON c.project_id = p.id 
-                    WHERE c.project_id IS NOT NULL AND p.id IS NULL
-                """)
-                
-                result = await session.execute(query)
-                orphaned = result.fetchall()
-                
-                for row in orphaned:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.ORPHANED_RECORD,
-                        table_name="conversations",
-                        record_id=row.id,
-                        description=f"Conversation references non-existent project: {row.project_id}",
-                        severity="medium",
-                        auto_fixable=True,
-                        fix_suggestion="Set project_id to NULL or create missing project"
-                    ))
-                    
+            with TimedOperation(f"integrity_check_{check.__name__}", logger):
+                return await check()
         except Exception as e:
-            logger.error(f"Failed to check orphaned conversations: {e}")
+            logger.error(f"Integrity check {check.__name__} failed: {e}")
+            return [IntegrityIssue(
+                issue_type=IntegrityIssueType.CORRUPTED_JSON,
+                table_name="system",
+                record_id="check_failure",
+                description=f"Integrity check {check.__name__} failed: {str(e)}",
+                severity="high",
+                auto_fixable=False
+            )]
     
-    async def _check_orphaned_context_links(self) -> None:
-        """Check for context links with invalid conversation references."""
-        self.checks_run += 1
+    async def _check_record_anomalies(self) -> List[IntegrityIssue]:
+        """
+        Check references, required fields, text fields and timestamps in one query.
         
-        try:
-            async with self.db_manager.get_async_session() as session:
-                # Check source conversation references
-                query = text("""
-                    SELECT cl.id, cl.source_conversation_id 
-                    FROM context_links cl 
-                    LEFT JOIN conversations c ON cl.source_conversation_id = c.id 
-                    WHERE c.id IS NULL
-                """)
-                
-                result = await session.execute(query)
-                orphaned_sources = result.fetchall()
-                
-                for row in orphaned_sources:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.ORPHANED_RECORD,
-                        table_name="context_links",
-                        record_id=str(row.id),
-                        description=f"Context link references non-existent source conversation: {row.source_conversation_id}",
-                        severity="high",
-                        auto_fixable=True,
-                        fix_suggestion="Delete orphaned context link"
-                    ))
-                
-                # Check target conversation references
-                query = text("""
-                    SELECT cl.id, cl.target_conversation_id 
-                    FROM context_links cl 
-                    LEFT JOIN conversations c ON cl.target_conversation_id = c.id 
-                    WHERE c.id IS NULL
-                """)
-                
-                result = await session.execute(query)
-                orphaned_targets = result.fetchall()
-                
-                for row in orphaned_targets:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.ORPHANED_RECORD,
-                        table_name="context_links",
-                        record_id=str(row.id),
-                        description=f"Context link references non-existent target conversation: {row.target_conversation_id}",
-                        severity="high",
-                        auto_fixable=True,
-                        fix_suggestion="Delete orphaned context link"
-                    ))
-                    
-        except Exception as e:
-            logger.error(f"Failed to check orphaned context links: {e}")
-    
-    async def _check_missing_project_references(self) -> None:
-        """Check for projects that should have conversations but don't."""
-        self.checks_run += 1
+        A failure of the query is not caught here: it is reported by
+        ``_run_check`` as a failed check, since none of the checks it
+        answers could run.
+        """
+        issues = []
         
-        try:
-            async with self.db_manager.get_async_session() as session:
-                # Find projects with no conversations (might indicate data loss)
-                query = text("""
-                    SELECT p.id, p.name, p.created_at 
-                    FROM projects p 
-                    LEFT JOIN conversations c ON p.id = c.project_id 
-                    WHERE c.id IS NULL 
-                    AND p.created_at < datetime('now', '-1 day')
-                """)
-                
-                result = await session.execute(query)
-                empty_projects = result.fetchall()
-                
-                for row in empty_projects:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.MISSING_REFERENCE,
-                        table_name="projects",
-                        record_id=row.id,
-                        description=f"Project '{row.name}' has no conversations despite being created {row.created_at}",
-                        severity="low",
-                        auto_fixable=False,
-                        fix_suggestion="Review if project should be deleted or if conversations are missing"
-                    ))
-                    
-        except Exception as e:
-            logger.error(f"Failed to check missing project references: {e}")
+        async with self.db_manager.get_async_session() as session:
+            result = await session.execute(_ANOMALY_QUERY, {
+                # More than 1 hour in the future, or before 2020
+                "future_cutoff": datetime.now() + timedelta(hours=1),
+                "old_cutoff": datetime(2020, 1, 1)
+            })
+            rows = result.fetchall()
+        
+        self.checks_run += _ANOMALY_CHECK_COUNT
+        
+        for row in rows:
+            if row.kind == "null_field":
+                if not row.detail:
+                    continue
+                table, field = row.record_id.split(".")
+                issues.append(IntegrityIssue(
+                    issue_type=IntegrityIssueType.CONSTRAINT_VIOLATION,
+                    table_name=table,
+                    record_id="multiple",
+                    description=f"{_REQUIRED_FIELDS[(table, field)]} - Found {row.detail} violations",
+                    severity="critical",
+                    auto_fixable=False,
+                    fix_suggestion=f"Delete or fix records with NULL {field}"
+                ))
+                continue
+            
+            issue_type, table, severity, auto_fixable, fix_suggestion, description = _ANOMALY_KINDS[row.kind]
+            issues.append(IntegrityIssue(
+                issue_type=issue_type,
+                table_name=table,
+                record_id=str(row.record_id),
+                description=description.format(detail=row.detail, extra=row.extra),
+                severity=severity,
+                auto_fixable=auto_fixable,
+                fix_suggestion=fix_suggestion
+            ))
+        
+        return issues
     
-    async def _check_invalid_json_metadata(self) -> None:
+    async def _check_invalid_json_metadata(self) -> List[IntegrityIssue]:
         """Check for corrupted JSON in metadata fields."""
         self.checks_run += 1
+        issues = []
         
         try:
             async with self.db_manager.get_async_session() as session:
-                # Check conversations metadata
-                conversations = await session.execute(
-                    text("SELECT id, metadata FROM conversations WHERE metadata IS NOT NULL")
-                )
+                # Check conversations metadata; SQLite validates it with
+                # json_valid() so only corrupt rows are fetched and parsed
+                if session.get_bind().dialect.name == "sqlite":
+                    query = text("""
+                        SELECT id, metadata FROM conversations
+                        WHERE metadata IS NOT NULL AND json_valid(metadata) = 0
+                    """)
+                else:
+                    query = text("SELECT id, metadata FROM conversations WHERE metadata IS NOT NULL")
+                conversations = await session.execute(query)
                 
                 for row in conversations.fetchall():
                     try:
-                        import json
                         if row.metadata:
                             json.loads(row.metadata)
                     except (json.JSONDecodeError, TypeError) as e:
-                        self.issues_found.append(IntegrityIssue(
+                        issues.append(IntegrityIssue(
                             issue_type=IntegrityIssueType.CORRUPTED_JSON,
                             table_name="conversations",
                             record_id=row.id,
@@ -300,122 +392,76 @@ class DatabaseIntegrityChecker:
                         
         except Exception as e:
             logger.error(f"Failed to check invalid JSON metadata: {e}")
+        
+        return issues
     
-    async def _check_duplicate_conversations(self) -> None:
+    async def _check_duplicate_conversations(self) -> List[IntegrityIssue]:
         """Check for potential duplicate conversations."""
         self.checks_run += 1
+        issues = []
         
         try:
             async with self.db_manager.get_async_session() as session:
-                # Find conversations with identical content and timestamps (within 1 minute)
+                # Find conversations with identical content posted in the same
+                # minute. Grouping on content length and prefix finds candidate
+                # groups in one pass; only their rows are fetched in full and
+                # compared exactly below.
                 query = text("""
-                    SELECT c1.id, c2.id, c1.content, c1.timestamp 
-                    FROM conversations c1 
-                    JOIN conversations c2 ON c1.content = c2.content 
-                    AND c1.tool_name = c2.tool_name 
-                    AND c1.project_id = c2.project_id 
-                    AND abs(julianday(c1.timestamp) - julianday(c2.timestamp)) < 0.000694  -- 1 minute
-                    AND c1.id < c2.id
+                    WITH candidate_groups AS (
+                        SELECT LENGTH(content) AS content_length,
+                               substr(content, 1, 64) AS content_prefix,
+                               tool_name, project_id,
+                               CAST(julianday(timestamp) * 1440 AS INTEGER) AS minute
+                        FROM conversations
+                        WHERE tool_name IS NOT NULL AND project_id IS NOT NULL
+                        GROUP BY content_length, content_prefix, tool_name, project_id, minute
+                        HAVING COUNT(*) > 1
+                    )
+                    SELECT c.id, c.content, c.timestamp, c.tool_name, c.project_id, g.minute
+                    FROM conversations c
+                    JOIN candidate_groups g
+                    ON LENGTH(c.content) = g.content_length
+                    AND substr(c.content, 1, 64) = g.content_prefix
+                    AND c.tool_name = g.tool_name
+                    AND c.project_id = g.project_id
+                    AND CAST(julianday(c.timestamp) * 1440 AS INTEGER) = g.minute
                 """)
                 
                 result = await session.execute(query)
-                duplicates = result.fetchall()
                 
-                for row in duplicates:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.DUPLICATE_RECORD,
-                        table_name="conversations",
-                        record_id=row[1],  # Second ID (newer)
-                        description=f"Potential duplicate conversation (similar to {row[0]})",
-                        severity="low",
-                        auto_fixable=True,
-                        fix_suggestion="Review and potentially delete duplicate conversation",
-                        metadata={"original_id": row[0], "timestamp": str(row[3])}
-                    ))
-                    
-        except Exception as e:
-            logger.error(f"Failed to check duplicate conversations: {e}")
-    
-    async def _check_constraint_violations(self) -> None:
-        """Check for constraint violations."""
-        self.checks_run += 1
-        
-        try:
-            async with self.db_manager.get_async_session() as session:
-                # Check for NULL values in required fields
-                required_fields = [
-                    ("conversations", "id", "Conversation ID cannot be NULL"),
-                    ("conversations", "tool_name", "Tool name cannot be NULL"),
-                    ("conversations", "content", "Content cannot be NULL"),
-                    ("projects", "id", "Project ID cannot be NULL"),
-                    ("projects", "name", "Project name cannot be NULL"),
-                    ("preferences", "key", "Preference key cannot be NULL"),
-                    ("preferences", "value", "Preference value cannot be NULL")
-                ]
+                groups: Dict[Tuple[str, str, int, str], List[Tuple[str, Any]]] = {}
+                for row in result.fetchall():
+                    key = (row.tool_name, row.project_id, row.minute, row.content)
+                    groups.setdefault(key, []).append((row.id, row.timestamp))
                 
-                for table, field, description in required_fields:
-                    query = text(f"SELECT COUNT(*) as count FROM {table} WHERE {field} IS NULL")
-                    result = await session.execute(query)
-                    count = result.scalar()
+                for members in groups.values():
+                    if len(members) < 2:
+                        continue
                     
-                    if count > 0:
-                        self.issues_found.append(IntegrityIssue(
-                            issue_type=IntegrityIssueType.CONSTRAINT_VIOLATION,
-                            table_name=table,
-                            record_id="multiple",
-                            description=f"{description} - Found {count} violations",
-                            severity="critical",
-                            auto_fixable=False,
-                            fix_suggestion=f"Delete or fix records with NULL {field}"
+                    # Keep the lowest ID as the original and flag the rest
+                    members.sort()
+                    original_id, original_timestamp = members[0]
+                    for duplicate_id, _ in members[1:]:
+                        issues.append(IntegrityIssue(
+                            issue_type=IntegrityIssueType.DUPLICATE_RECORD,
+                            table_name="conversations",
+                            record_id=duplicate_id,
+                            description=f"Potential duplicate conversation (similar to {original_id})",
+                            severity="low",
+                            auto_fixable=True,
+                            fix_suggestion="Review and potentially delete duplicate conversation",
+                            metadata={"original_id": original_id, "timestamp": str(original_timestamp)}
                         ))
-                        
-        except Exception as e:
-            logger.error(f"Failed to check constraint violations: {e}")
-    
-    async def _check_data_consistency(self) -> None:
-        """Check for data consistency issues."""
-        self.checks_run += 1
-        
-        try:
-            async with self.db_manager.get_async_session() as session:
-                # Check for conversations with empty content
-                query = text("SELECT id FROM conversations WHERE content = '' OR LENGTH(TRIM(content)) = 0")
-                result = await session.execute(query)
-                empty_content = result.fetchall()
-                
-                for row in empty_content:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.INVALID_DATA,
-                        table_name="conversations",
-                        record_id=row.id,
-                        description="Conversation has empty content",
-                        severity="medium",
-                        auto_fixable=True,
-                        fix_suggestion="Delete conversation with empty content"
-                    ))
-                
-                # Check for projects with empty names
-                query = text("SELECT id FROM projects WHERE name = '' OR LENGTH(TRIM(name)) = 0")
-                result = await session.execute(query)
-                empty_names = result.fetchall()
-                
-                for row in empty_names:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.INVALID_DATA,
-                        table_name="projects",
-                        record_id=row.id,
-                        description="Project has empty name",
-                        severity="high",
-                        auto_fixable=False,
-                        fix_suggestion="Provide a valid name for the project"
-                    ))
                     
         except Exception as e:
-            logger.error(f"Failed to check data consistency: {e}")
+            logger.error(f"Failed to check duplicate conversations: {e}")
+        
+        return issues
     
-    async def _check_foreign_key_integrity(self) -> None:
+    async def _check_foreign_key_integrity(self) -> List[IntegrityIssue]:
         """Check foreign key integrity."""
         self.checks_run += 1
+        issues = []
         
         try:
             async with self.db_manager.get_async_session() as session:
@@ -427,7 +473,7 @@ class DatabaseIntegrityChecker:
                 
         except Exception as e:
             # Foreign key violations found
-            self.issues_found.append(IntegrityIssue(
+            issues.append(IntegrityIssue(
                 issue_type=IntegrityIssueType.CONSTRAINT_VIOLATION,
                 table_name="system",
                 record_id="foreign_keys",
@@ -436,89 +482,8 @@ class DatabaseIntegrityChecker:
                 auto_fixable=False,
                 fix_suggestion="Run detailed foreign key analysis and fix violations"
             ))
-    
-    async def _check_timestamp_validity(self) -> None:
-        """Check for invalid timestamps."""
-        self.checks_run += 1
-        
-        try:
-            async with self.db_manager.get_async_session() as session:
-                # Check for future timestamps (more than 1 hour in the future)
-                future_cutoff = datetime.now() + timedelta(hours=1)
-                
-                query = text("""
-                    SELECT id, timestamp FROM conversations 
-                    WHERE timestamp > :future_cutoff
-                """)
-                
-                result = await session.execute(query, {"future_cutoff": future_cutoff})
-                future_timestamps = result.fetchall()
-                
-                for row in future_timestamps:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.INVALID_DATA,
-                        table_name="conversations",
-                        record_id=row.id,
-                        description=f"Conversation has future timestamp: {row.timestamp}",
-                        severity="medium",
-                        auto_fixable=True,
-                        fix_suggestion="Update timestamp to current time"
-                    ))
-                
-                # Check for very old timestamps (before 2020)
-                old_cutoff = datetime(2020, 1, 1)
-                
-                query = text("""
-                    SELECT id, timestamp FROM conversations 
-                    WHERE timestamp < :old_cutoff
-                """)
-                
-                result = await session.execute(query, {"old_cutoff": old_cutoff})
-                old_timestamps = result.fetchall()
-                
-                for row in old_timestamps:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.INVALID_DATA,
-                        table_name="conversations",
-                        record_id=row.id,
-                        description=f"Conversation has suspiciously old timestamp: {row.timestamp}",
-                        severity="low",
-                        auto_fixable=False,
-                        fix_suggestion="Review timestamp validity"
-                    ))
-                    
-        except Exception as e:
-            logger.error(f"Failed to check timestamp validity: {e}")
-    
-    async def _check_text_field_integrity(self) -> None:
-        """Check text field integrity and encoding."""
-        self.checks_run += 1
         
-        try:
-            async with self.db_manager.get_async_session() as session:
-                # Check for extremely long content that might cause issues
-                query = text("""
-                    SELECT id, LENGTH(content) as content_length 
-                    FROM conversations 
-                    WHERE LENGTH(content) > 1000000  -- 1MB
-                """)
-                
-                result = await session.execute(query)
-                long_content = result.fetchall()
-                
-                for row in long_content:
-                    self.issues_found.append(IntegrityIssue(
-                        issue_type=IntegrityIssueType.INVALID_DATA,
-                        table_name="conversations",
-                        record_id=row.id,
-                        description=f"Conversation has extremely long content: {row.content_length} characters",
-                        severity="low",
-                        auto_fixable=False,
-                        fix_suggestion="Review if content length is appropriate"
-                    ))
-                    
-        except Exception as e:
-            logger.error(f"Failed to check text field integrity: {e}")
+        return issues
     
     async def auto_fix_issues(self, issues: List[IntegrityIssue]) -> Dict[str, Any]:
         """